@@ -0,0 +1,69 @@
+""" Import and describe time for a large block catalog
+
+Defines a synthetic catalog of block classes, similar to what discovery does
+when importing a library of blocks, and then describes every block in it as
+the management API would.
+"""
+from enum import Enum
+from time import perf_counter
+
+from nio.block.base import Block
+from nio.properties import PropertyHolder, IntProperty, StringProperty, \
+    ListProperty, ObjectProperty, SelectProperty, FloatProperty, \
+    VersionProperty
+
+
+NUM_BLOCKS = 400
+
+
+class Choices(Enum):
+    first = "first"
+    second = "second"
+
+
+class Item(PropertyHolder):
+    name = StringProperty(title="Name", default="")
+    value = FloatProperty(title="Value", default=0.0)
+
+
+class Options(PropertyHolder):
+    retries = IntProperty(title="Retries", default=3)
+    choice = SelectProperty(Choices, title="Choice", default=Choices.first)
+    items = ListProperty(Item, title="Items", default=[])
+
+
+def _define_catalog():
+    catalog = []
+    for i in range(NUM_BLOCKS):
+        attrs = {
+            "version": VersionProperty("1.0.{}".format(i)),
+            "host": StringProperty(title="Host", default="localhost"),
+            "port": IntProperty(title="Port", default=8000 + i),
+            "options": ObjectProperty(Options, title="Options"),
+            "items": ListProperty(Item, title="Items", default=[]),
+        }
+        catalog.append(type("Block{}".format(i), (Block,), attrs))
+    return catalog
+
+
+def _describe(catalog):
+    for block_class in catalog:
+        block_class.get_description()
+
+
+def main():
+    start = perf_counter()
+    catalog = _define_catalog()
+    defined = perf_counter()
+    _describe(catalog)
+    described = perf_counter()
+    _describe(catalog)
+    described_again = perf_counter()
+    print("define:        {:8.2f} ms".format((defined - start) * 1000))
+    print("describe:      {:8.2f} ms".format((described - defined) * 1000))
+    print("describe (2x): {:8.2f} ms".format(
+        (described_again - described) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+""" Time to enrich large signals with small results
+
+Enriches signals carrying a large payload with a small result, once deep
+copying the incoming signals and once overlaying the results on them, and
+then reads an attribute from every output signal.
+"""
+from copy import deepcopy
+from time import perf_counter
+
+from nio.signal.base import Signal
+from nio.signal.overlay import OverlaySignal
+
+
+NUM_SIGNALS = 2000
+PAYLOAD_SIZE = 200
+
+
+def _copy(signal, result):
+    enriched = deepcopy(signal)
+    enriched.from_dict(result)
+    return enriched
+
+
+def _enrich(signals, enrich):
+    start = perf_counter()
+    for signal in signals:
+        enrich(signal, {"result": 1}).id
+    return perf_counter() - start
+
+
+def main():
+    signals = [Signal({
+        "id": i,
+        "payload": [{"index": j, "value": str(j)} for j in range(PAYLOAD_SIZE)]
+    }) for i in range(NUM_SIGNALS)]
+    copied = _enrich(signals, _copy)
+    overlaid = _enrich(signals, OverlaySignal)
+    print("{} signals, payload of {} items".format(NUM_SIGNALS, PAYLOAD_SIZE))
+    print("deepcopy: {:8.2f} ms".format(copied * 1000))
+    print("overlay:  {:8.2f} ms".format(overlaid * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+""" Attribute-read throughput of block properties
+
+Measures reading properties on many property holder instances, both the raw
+descriptor access (returning the PropertyValue) and the full call that
+deserializes the value.
+"""
+from timeit import repeat
+
+from nio.properties import PropertyHolder, IntProperty, StringProperty
+
+
+class Holder(PropertyHolder):
+    count = IntProperty(title="Count", default=5)
+    label = StringProperty(title="Label", default="label")
+
+
+NUM_INSTANCES = 1000
+NUMBER = 100
+REPEAT = 5
+
+
+def _build_instances():
+    instances = []
+    for i in range(NUM_INSTANCES):
+        instance = Holder()
+        # half the instances keep the default value
+        if i % 2:
+            instance.count = i
+        instances.append(instance)
+    return instances
+
+
+def _read(instances):
+    for instance in instances:
+        instance.count
+        instance.label
+
+
+def _call(instances):
+    for instance in instances:
+        instance.count()
+        instance.label()
+
+
+def main():
+    instances = _build_instances()
+    reads = NUM_INSTANCES * 2 * NUMBER
+    for name, target in (("read", _read), ("call", _call)):
+        best = min(repeat(lambda: target(instances),
+                          number=NUMBER, repeat=REPEAT))
+        print("{:>5}: {:>12.0f} reads/s".format(name, reads / best))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+""" Time to schedule and cancel jobs with the scheduler
+
+Schedules jobs far enough in the future for none of them to run, then
+cancels them all, as a cache overwriting its keys does. Cancelling leaves
+events in the queue to be skipped, compacting it once most of it is
+cancelled. For comparison, a smaller number of jobs is cancelled removing
+each event from the queue right away, as the scheduler used to, and the
+same number of jobs is scheduled and cancelled with the timing wheel
+backend.
+"""
+import heapq
+from datetime import timedelta
+from time import perf_counter
+
+from nio.modules.context import ModuleContext
+from nio.util.scheduler.scheduler import SchedulerRunner
+
+
+NUM_JOBS = 1000000
+NUM_EAGER_JOBS = 10000
+
+
+class EagerRemovalSchedulerRunner(SchedulerRunner):
+
+    def unschedule(self, job):
+        with self._events_lock:
+            event = self._events.pop(job, None)
+        if event:
+            with self._queue_lock:
+                heap = self._queue._heap
+                if event in heap:
+                    heap.remove(event)
+                    heapq.heapify(heap)
+            return True
+        return False
+
+
+def _schedule_and_cancel(scheduler, num_jobs, backend):
+    context = ModuleContext()
+    context.min_interval = 0.1
+    context.resolution = 0.1
+    context.backend = backend
+    scheduler.do_configure(context)
+    scheduler.do_start()
+    delta = timedelta(hours=1)
+    try:
+        start = perf_counter()
+        jobs = [scheduler.schedule_task(print, delta, True)
+                for _ in range(num_jobs)]
+        scheduled = perf_counter() - start
+        start = perf_counter()
+        for job in jobs:
+            scheduler.unschedule(job)
+        cancelled = perf_counter() - start
+    finally:
+        scheduler.do_stop()
+    return scheduled, cancelled
+
+
+def main():
+    for scheduler, num_jobs, backend in (
+            (EagerRemovalSchedulerRunner(), NUM_EAGER_JOBS, "heap"),
+            (SchedulerRunner(), NUM_EAGER_JOBS, "heap"),
+            (SchedulerRunner(), NUM_JOBS, "heap"),
+            (SchedulerRunner(), NUM_JOBS, "timing_wheel")):
+        scheduled, cancelled = _schedule_and_cancel(
+            scheduler, num_jobs, backend)
+        print("{:<28} {:<12} {:>8} jobs: schedule {:9.2f} ms, "
+              "cancel {:9.2f} ms".format(
+                  scheduler.__class__.__name__, backend, num_jobs,
+                  scheduled * 1000, cancelled * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+""" Time to simulate a day of scheduled jobs in virtual time
+
+Runs repeatable jobs with the virtual time scheduler, as a service with
+minute long collection windows would, moving its clock a day forward. Jobs
+run as fast as they can instead of waiting for their time, the speedup is
+the simulated time over the time it took.
+"""
+from datetime import timedelta
+from time import perf_counter
+
+from nio.modules.context import ModuleContext
+from nio.testing.modules.scheduler.virtual_scheduler import \
+    VirtualTimeSchedulerRunner
+
+
+NUM_JOBS = 100
+SIMULATED_SECONDS = 24 * 3600
+
+
+def main():
+    scheduler = VirtualTimeSchedulerRunner()
+    context = ModuleContext()
+    context.min_interval = 0.1
+    context.resolution = 0.1
+    scheduler.do_configure(context)
+    scheduler.do_start()
+    runs = [0]
+
+    def collect():
+        runs[0] += 1
+
+    try:
+        for job in range(NUM_JOBS):
+            scheduler.schedule_task(
+                collect, timedelta(seconds=60 + job), True)
+        start = perf_counter()
+        scheduler.advance(SIMULATED_SECONDS)
+        elapsed = perf_counter() - start
+    finally:
+        scheduler.do_stop()
+    print("{} jobs, {} runs in {:.2f} s of {} simulated s: {:.0f}x "
+          "real time".format(NUM_JOBS, runs[0], elapsed, SIMULATED_SECONDS,
+                             SIMULATED_SECONDS / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ A block contains modular functionality to be used inside of Services. To create
 a custom block, extend this Block class and override the appropriate methods.
 """
 from collections import defaultdict
+from copy import deepcopy
 from inspect import getargspec
 
 from nio.block.context import BlockContext
@@ -318,16 +319,22 @@ class Base(PropertyHolder, CommandHolder, Runner):
     def get_description(cls):
         """ Get a dictionary description of this block.
 
+        The description is built once per block class and cached, a copy
+        of it is returned.
+
         Returns:
             dict: A dictionary containing the blocks properties and commands
         """
-        properties = super().get_description()
-        commands = cls.get_command_description()
-
-        return {
-            'properties': properties,
-            'commands': commands
-        }
+        description_attr = "{0}_description".format(cls.__name__)
+        if not hasattr(cls, description_attr):
+            properties = super().get_description()
+            commands = cls.get_command_description()
+
+            setattr(cls, description_attr, {
+                'properties': properties,
+                'commands': commands
+            })
+        return deepcopy(getattr(cls, description_attr))
 
     def properties(self):
         """ Returns block runtime properties """
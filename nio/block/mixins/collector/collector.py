@@ -1,7 +1,11 @@
 from collections import defaultdict
+from tempfile import gettempdir
 from threading import Lock
+from nio.block.mixins.collector.spill import SpilledSignals
+from nio.properties import IntProperty, StringProperty
 from nio.properties.timedelta import TimeDeltaProperty
 from nio.modules.scheduler import Job
+from nio.util.threading import spawn
 
 
 class Collector(object):
@@ -17,19 +21,65 @@ class Collector(object):
 
     By setting the collect property to 0, notifying signals will happen
     immediately, as if this mixin wasn't even included.
+
+    Collected signals can also be notified before the collection window
+    ends, as soon as an output collects `max_batch_size` signals, from a
+    thread of their own so that notifying a signal never waits for
+    downstream blocks.
+
+    The `max_buffered_signals` property bounds the memory an output uses by
+    capping how many signals it keeps waiting. Once over the cap the oldest
+    signals are discarded, a warning is logged and the discarded signals
+    are counted.
+
+    Setting `spill_threshold` keeps at most that many signals in memory for
+    an output, further signals are spilled to disk and notified in order on
+    the following notifications. Signals still collected when the block
+    stops are notified then.
+
+    Signals are collected into a buffer which is swapped for an empty one
+    when it is time to notify, so that blocks can keep collecting signals
+    while the previous ones are being processed downstream.
     """
 
     collect = TimeDeltaProperty(
         title='Collect Timeout', default={"seconds": 1}, advanced=True, order=100
     )
+    max_batch_size = IntProperty(
+        title='Max Batch Size', default=0, advanced=True, order=101
+    )
+    max_buffered_signals = IntProperty(
+        title='Max Buffered Signals', default=0, advanced=True, order=102
+    )
+    spill_threshold = IntProperty(
+        title='Spill Threshold', default=0, advanced=True, order=103
+    )
+    spill_directory = StringProperty(
+        title='Spill Directory', default='', advanced=True, order=104
+    )
 
     def __init__(self):
         super().__init__()
         self._collect_job = None
         self._collect_lock = Lock()
+        # held while notifying collected signals, keeps batches in order
+        self._flush_lock = Lock()
         self._sigs_out = defaultdict(list)
+        self._max_batch_size = 0
+        self._max_buffered_signals = 0
+        self._discarded_signals = 0
+        # whether a thread is about to notify a full batch
+        self._batch_flush_pending = False
+        self._spill_threshold = 0
+        self._spill_directory = None
+        # signals spilled to disk, per output
+        self._spilled = {}
 
     def start(self):
+        self._max_batch_size = self.max_batch_size()
+        self._max_buffered_signals = self.max_buffered_signals()
+        self._spill_threshold = self.spill_threshold()
+        self._spill_directory = self.spill_directory() or gettempdir()
         # Start the collection job, if we want to be collecting
         if self._are_we_collecting():
             self._collect_job = Job(self._dump_signals, self.collect(), True)
@@ -38,13 +88,41 @@ class Collector(object):
     def stop(self):
         if self._collect_job:
             self._collect_job.cancel()
+        # notify what is left, signals spilled to disk would be lost
+        # otherwise
+        self._flush()
+        with self._collect_lock:
+            # signals spilled while notifying are not notified any longer
+            for output_id, spilled in self._spilled.items():
+                discarded = spilled.clear()
+                if discarded:
+                    self.logger.warning(
+                        "Discarded {} signals spilled for output {}".format(
+                            discarded, output_id))
+            self._spilled.clear()
         super().stop()
 
     def notify_signals(self, signals, output_id=None):
         """Override the notify signals call to keep collecting"""
         if self._are_we_collecting():
             with self._collect_lock:
-                self._sigs_out[output_id].extend(signals)
+                output_sigs = self._sigs_out[output_id]
+                spilled = self._spilled.get(output_id)
+                if spilled:
+                    # keep spilling until spilled signals are notified
+                    spilled.append(signals)
+                else:
+                    output_sigs.extend(signals)
+                    self._spill_excess(output_sigs, output_id)
+                    self._cap_buffer(output_sigs, output_id)
+                flush = self._is_batch_full(output_sigs) and \
+                    not self._batch_flush_pending
+                if flush:
+                    self._batch_flush_pending = True
+            if flush:
+                # notify from another thread, collecting never waits for
+                # signals to be notified downstream
+                spawn(self._flush_batch)
         else:
             super().notify_signals(signals, output_id)
 
@@ -52,15 +130,85 @@ class Collector(object):
         """Return True if we should be collecting signals"""
         return self.collect().total_seconds() > 0
 
+    def _is_batch_full(self, output_sigs):
+        return 0 < self._max_batch_size <= len(output_sigs)
+
+    def _spill_excess(self, output_sigs, output_id):
+        """Spill the signals of a buffer over the spill threshold"""
+        if 0 < self._spill_threshold < len(output_sigs):
+            spilled = self._spilled.get(output_id)
+            if spilled is None:
+                spilled = self._spilled[output_id] = SpilledSignals(
+                    self._spill_directory, self._spill_threshold)
+            spilled.append(output_sigs[self._spill_threshold:])
+            del output_sigs[self._spill_threshold:]
+
+    def _cap_buffer(self, output_sigs, output_id):
+        """Discard the oldest signals of a buffer over its maximum size"""
+        excess = len(output_sigs) - self._max_buffered_signals
+        if self._max_buffered_signals > 0 and excess > 0:
+            del output_sigs[:excess]
+            self._discarded_signals += excess
+            self.logger.warning(
+                "Buffer for output {} is full, discarded its {} oldest "
+                "signals, {} discarded so far".format(
+                    output_id, excess, self._discarded_signals))
+
+    def _flush_batch(self):
+        """Notify collected signals once an output has a full batch"""
+        self._flush(batch=True)
+
     def _dump_signals(self):
         """Notify any signals we have collected this window.
 
         This gets called by the scheduled Job.
         """
-        with self._collect_lock:
-            for output_id, output_sigs in self._sigs_out.items():
-                if len(output_sigs):
-                    # Notify the signals for this output ID then
-                    # remove the signals from the list
-                    super().notify_signals(output_sigs, output_id)
-                    del output_sigs[:]
+        self._flush()
+
+    def _flush(self, blocking=True, batch=False):
+        """Swap the collected signals for an empty buffer and notify them
+
+        Signals are notified outside of the collect lock so that signals can
+        keep being collected meanwhile. Signals spilled to disk are notified
+        after the ones in memory, which were collected before them.
+
+        Args:
+            blocking (bool): whether to wait for a notification in progress
+                to finish, when False and a notification is in progress
+                nothing is done.
+            batch (bool): whether notifying a full batch, another full
+                batch is only scheduled to be notified once the signals are
+                swapped, so at most one thread waits to notify a batch.
+        """
+        while self._flush_lock.acquire(blocking):
+            try:
+                with self._collect_lock:
+                    sigs_out = self._sigs_out
+                    self._sigs_out = defaultdict(list)
+                    if batch:
+                        self._batch_flush_pending = False
+                        batch = False
+                    segments = {}
+                    for output_id, spilled in self._spilled.items():
+                        spilled.seal()
+                        segments[output_id] = spilled.take()
+                output_ids = list(sigs_out)
+                output_ids.extend(output_id for output_id in segments
+                                  if output_id not in sigs_out)
+                for output_id in output_ids:
+                    output_sigs = sigs_out.get(output_id)
+                    if output_sigs:
+                        super().notify_signals(output_sigs, output_id)
+                    # read segments one at a time to bound memory usage
+                    for segment in segments.get(output_id, []):
+                        super().notify_signals(
+                            SpilledSignals.read(segment), output_id)
+            finally:
+                self._flush_lock.release()
+            # A batch may have filled up while notifying, since the flush lock
+            # was taken it was left for us to notify
+            with self._collect_lock:
+                if not any(self._is_batch_full(output_sigs)
+                           for output_sigs in self._sigs_out.values()):
+                    return
+            blocking = False
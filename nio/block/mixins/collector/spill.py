@@ -0,0 +1,153 @@
+import os
+import pickle
+import struct
+from collections import deque
+from tempfile import mkstemp
+
+from nio.util.logging import get_nio_logger
+
+# every record is the size of the pickled signal followed by the signal
+_RECORD_HEADER = struct.Struct(">I")
+
+
+class SpilledSignals(object):
+
+    """ Signals spilled to disk for a Collector output
+
+    Signals are appended to segment files, each segment holding up to
+    `segment_size` signals. Once sealed, segments are read back in the order
+    they were written and removed.
+
+    Every signal is pickled along with its class and all of its attributes,
+    hidden ones included, so that it is read back as it was notified.
+    Segment files are only readable by the process writing them, which is
+    the only one reading them back. A batch of signals holding a value that
+    can not be pickled is kept in memory instead, in its place among the
+    spilled signals.
+
+    Args:
+        directory (str): directory where segment files are created
+        segment_size (int): maximum number of signals per segment
+
+    """
+
+    def __init__(self, directory, segment_size):
+        self._directory = directory
+        self._segment_size = segment_size
+        # sealed segments as (path or signals kept in memory, number of
+        # signals), oldest first
+        self._sealed = deque()
+        self._active = None
+        self._active_path = None
+        self._active_count = 0
+        self._count = 0
+        self.logger = get_nio_logger("SpilledSignals")
+
+    def __len__(self):
+        """ Number of signals spilled and not taken yet """
+        return self._count
+
+    def append(self, signals):
+        """ Append signals to the active segment
+
+        Signals are all encoded before writing any of them, when one of them
+        can not be encoded the whole batch is kept in memory.
+
+        Args:
+            signals (list): signals to spill
+        """
+        try:
+            records = [self._encode(signal) for signal in signals]
+        except Exception:
+            self.logger.warning(
+                "Could not spill {} signals, keeping them in memory".format(
+                    len(signals)), exc_info=True)
+            self.seal()
+            self._sealed.append((list(signals), len(signals)))
+            self._count += len(signals)
+            return
+        for record in records:
+            if self._active is None:
+                fd, self._active_path = mkstemp(
+                    suffix=".sig", prefix="nio_collector_",
+                    dir=self._directory)
+                self._active = os.fdopen(fd, "wb")
+            self._active.write(record)
+            self._active_count += 1
+            self._count += 1
+            if self._active_count >= self._segment_size:
+                self.seal()
+
+    def seal(self):
+        """ Close the active segment so that it can be taken """
+        if self._active is not None:
+            self._active.close()
+            self._sealed.append((self._active_path, self._active_count))
+            self._active = None
+            self._active_path = None
+            self._active_count = 0
+
+    def take(self):
+        """ Take every sealed segment
+
+        Returns:
+            list: segments, oldest first, to be read with `read`
+        """
+        segments = []
+        while self._sealed:
+            segment, count = self._sealed.popleft()
+            self._count -= count
+            segments.append(segment)
+        return segments
+
+    @staticmethod
+    def read(segment):
+        """ Read the signals in a segment and remove it
+
+        Args:
+            segment: segment as returned by `take`
+
+        Returns:
+            list: signals in the order they were spilled
+        """
+        if isinstance(segment, list):
+            # signals kept in memory
+            return segment
+        signals = []
+        with open(segment, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset < len(data):
+            (size,) = _RECORD_HEADER.unpack_from(data, offset)
+            offset += _RECORD_HEADER.size
+            signal_class, attributes = pickle.loads(
+                data[offset:offset + size])
+            # attributes are restored as they were, without running the
+            # signal class constructor
+            signal = signal_class.__new__(signal_class)
+            signal.__dict__.update(attributes)
+            signals.append(signal)
+            offset += size
+        os.remove(segment)
+        return signals
+
+    def clear(self):
+        """ Discard every spilled signal
+
+        Returns:
+            int: number of signals discarded
+        """
+        self.seal()
+        discarded = self._count
+        for segment in self.take():
+            if not isinstance(segment, list):
+                os.remove(segment)
+        return discarded
+
+    @staticmethod
+    def _encode(signal):
+        """ Encode a signal as a record of a segment """
+        data = pickle.dumps(
+            (signal.__class__, signal.to_dict(include_hidden=True)),
+            pickle.HIGHEST_PROTOCOL)
+        return _RECORD_HEADER.pack(len(data)) + data
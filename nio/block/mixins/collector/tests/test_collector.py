@@ -1,8 +1,15 @@
+import os
+from decimal import Decimal
+from tempfile import TemporaryDirectory
+from threading import Event, Lock, active_count
 from unittest.mock import patch
 from datetime import timedelta
 from nio.block.mixins.collector.collector import Collector
 from nio.block.base import Block
+from nio.block.terminals import DEFAULT_TERMINAL
 from nio.signal.base import Signal
+from nio.signal.overlay import OverlaySignal
+from nio.testing.condition import ensure_condition
 from nio.testing.block_test_case import NIOBlockTestCase
 
 
@@ -10,6 +17,10 @@ class CollectingBlock(Collector, Block):
     pass
 
 
+class CustomSignal(Signal):
+    pass
+
+
 class TestCollector(NIOBlockTestCase):
 
     def test_collects(self):
@@ -83,3 +94,205 @@ class TestCollector(NIOBlockTestCase):
         self.assert_num_signals_notified(4, block, 'output1')
         # No more should have been notified on the second output
         self.assert_num_signals_notified(1, block, 'output2')
+
+    def test_max_batch_size(self):
+        """Signals are notified as soon as an output has a full batch"""
+        block = CollectingBlock()
+        self.configure_block(block, {
+            "collect": {'seconds': 2},
+            "max_batch_size": 3
+        })
+        with patch('nio.block.mixins.collector.collector.Job'):
+            block.start()
+        block.notify_signals([Signal()], 'output1')
+        block.notify_signals([Signal(), Signal()], 'output2')
+        self.assert_num_signals_notified(0)
+        block.notify_signals([Signal()], 'output2')
+        # a full batch notifies everything collected so far, from another
+        # thread
+        self.assertTrue(ensure_condition(
+            lambda: len(self.last_notified['output1']) == 1))
+        self.assert_num_signals_notified(3, block, 'output2')
+        self.assert_num_signals_notified(1, block, 'output1')
+        block.notify_signals([Signal()], 'output1')
+        self.assert_num_signals_notified(1, block, 'output1')
+        block._dump_signals()
+        self.assert_num_signals_notified(2, block, 'output1')
+        block.stop()
+
+    def test_max_batch_size_slow_downstream(self):
+        """At most one thread waits to notify a batch"""
+        block = CollectingBlock()
+        self.configure_block(block, {
+            "collect": {'seconds': 2},
+            "max_batch_size": 2
+        })
+        with patch('nio.block.mixins.collector.collector.Job'):
+            block.start()
+        release = Event()
+        notified = []
+
+        def notify_downstream(signals, output_id):
+            release.wait(5)
+            notified.extend(signals)
+
+        threads = active_count()
+        with patch.object(Block, 'notify_signals',
+                          side_effect=notify_downstream):
+            for _ in range(200):
+                block.notify_signals([Signal()])
+            # one thread notifying and one waiting to
+            self.assertLessEqual(active_count() - threads, 2)
+            release.set()
+            ensure_condition(lambda: len(notified) == 200)
+        self.assertEqual(len(notified), 200)
+        block.stop()
+
+    def test_max_buffered_signals(self):
+        """The oldest signals are discarded once an output buffer is full"""
+        block = CollectingBlock()
+        self.configure_block(block, {
+            "collect": {'seconds': 2},
+            "max_buffered_signals": 2
+        })
+        with patch('nio.block.mixins.collector.collector.Job'):
+            block.start()
+        for index in range(5):
+            block.notify_signals([Signal({"index": index})])
+        block.notify_signals([Signal({"index": 5})], 'output2')
+        block._dump_signals()
+        self.assertEqual(
+            [signal.index for signal in self.last_notified[DEFAULT_TERMINAL]],
+            [3, 4])
+        self.assert_num_signals_notified(1, block, 'output2')
+        self.assertEqual(block._discarded_signals, 3)
+        block.stop()
+
+    def test_collects_while_notifying(self):
+        """Signals can be collected while collected ones are notified"""
+        block = CollectingBlock()
+        self.configure_block(block, {
+            "collect": {'seconds': 2},
+            "max_batch_size": 2
+        })
+        with patch('nio.block.mixins.collector.collector.Job'):
+            block.start()
+        notified = []
+
+        def notify_downstream(signals, output_id):
+            # the collect lock is released while notifying downstream
+            self.assertFalse(block._collect_lock.locked())
+            if not notified:
+                # a batch filling up while notifying gets notified next
+                block.notify_signals([Signal(), Signal()])
+            notified.append(len(signals))
+
+        with patch.object(Block, 'notify_signals',
+                          side_effect=notify_downstream):
+            block.notify_signals([Signal()])
+            block._dump_signals()
+            # the full batch is notified from another thread
+            ensure_condition(lambda: len(notified) == 2)
+        self.assertEqual(notified, [1, 2])
+        block.stop()
+
+    def test_spill_to_disk(self):
+        """Signals over the spill threshold are notified in order from disk"""
+        block = CollectingBlock()
+        with TemporaryDirectory() as spill_directory:
+            self.configure_block(block, {
+                "collect": {'seconds': 2},
+                "spill_threshold": 2,
+                "spill_directory": spill_directory
+            })
+            with patch('nio.block.mixins.collector.collector.Job'):
+                block.start()
+            block.notify_signals([Signal({"index": 0})])
+            block.notify_signals([Signal({"index": 1}), Signal({"index": 2})])
+            block.notify_signals([Signal({"index": 3}), Signal({"index": 4})])
+            block.notify_signals([Signal({"index": 5})], 'output2')
+            # signals over the threshold are on disk
+            self.assertEqual(len(block._sigs_out[None]), 2)
+            self.assertEqual(len(block._spilled[None]), 3)
+            self.assertEqual(len(os.listdir(spill_directory)), 2)
+            block._dump_signals()
+            self.assertEqual(
+                [signal.index for signal in
+                 self.last_notified[DEFAULT_TERMINAL]], [0, 1, 2, 3, 4])
+            self.assert_num_signals_notified(1, block, 'output2')
+            self.assertEqual(os.listdir(spill_directory), [])
+            # once spilled signals are notified, signals are kept in memory
+            block.notify_signals([Signal({"index": 6})])
+            self.assertEqual(len(block._sigs_out[None]), 1)
+            block.stop()
+
+    def test_spilled_signals_keep_order(self):
+        """Signals keep spilling until the spilled ones are notified"""
+        block = CollectingBlock()
+        with TemporaryDirectory() as spill_directory:
+            self.configure_block(block, {
+                "collect": {'seconds': 2},
+                "spill_threshold": 1,
+                "spill_directory": spill_directory
+            })
+            with patch('nio.block.mixins.collector.collector.Job'):
+                block.start()
+            block.notify_signals([Signal({"index": 0}), Signal({"index": 1})])
+            with block._collect_lock:
+                # memory empties out while spilled signals are pending
+                block._sigs_out.clear()
+            block.notify_signals([Signal({"index": 2})])
+            self.assertEqual(len(block._spilled[None]), 2)
+            block._dump_signals()
+            self.assertEqual(
+                [signal.index for signal in
+                 self.last_notified[DEFAULT_TERMINAL]], [1, 2])
+            # spilled signals are notified when stopping
+            block.notify_signals([Signal({"index": 3}), Signal({"index": 4}),
+                                  Signal({"index": 5})])
+            self.assertEqual(len(os.listdir(spill_directory)), 2)
+            block.stop()
+            self.assertEqual(
+                [signal.index for signal in
+                 self.last_notified[DEFAULT_TERMINAL]], [1, 2, 3, 4, 5])
+            self.assertEqual(os.listdir(spill_directory), [])
+
+    def test_spilled_signals_intact(self):
+        """Spilled signals are notified as they were collected"""
+        block = CollectingBlock()
+        with TemporaryDirectory() as spill_directory:
+            self.configure_block(block, {
+                "collect": {'seconds': 2},
+                "spill_threshold": 1,
+                "spill_directory": spill_directory
+            })
+            with patch('nio.block.mixins.collector.collector.Job'):
+                block.start()
+            overlay = OverlaySignal(
+                Signal({"id": 1, "payload": [1, 2]}), {"result": 1})
+            nested = CustomSignal({"_hidden": 2, "inner": Signal({"a": 3}),
+                                   "amount": Decimal("1.5")})
+            lock = Lock()
+            block.notify_signals([Signal({"index": 0}), overlay, nested])
+            # a signal that can not be spilled keeps its batch in memory
+            block.notify_signals([Signal({"index": 3}),
+                                  Signal({"index": 4, "lock": lock})])
+            block.notify_signals([Signal({"index": 5})])
+            self.assertEqual(len(block._sigs_out[None]), 1)
+            self.assertEqual(len(block._spilled[None]), 5)
+            block._dump_signals()
+            notified = self.last_notified[DEFAULT_TERMINAL]
+            self.assertEqual(len(notified), 6)
+            self.assertIsInstance(notified[1], OverlaySignal)
+            self.assertDictEqual(notified[1].to_dict(),
+                                 {"id": 1, "payload": [1, 2], "result": 1})
+            self.assertIsInstance(notified[2], CustomSignal)
+            self.assertEqual(notified[2]._hidden, 2)
+            self.assertIsInstance(notified[2].inner, Signal)
+            self.assertEqual(notified[2].inner.a, 3)
+            self.assertEqual(notified[2].amount, Decimal("1.5"))
+            self.assertEqual([notified[3].index, notified[4].index,
+                              notified[5].index], [3, 4, 5])
+            self.assertIs(notified[4].lock, lock)
+            self.assertEqual(os.listdir(spill_directory), [])
+            block.stop()
@@ -1,5 +1,6 @@
 from copy import deepcopy
 from nio.signal.base import Signal
+from nio.signal.overlay import OverlaySignal
 from nio.properties import StringProperty, BoolProperty, \
     ObjectProperty, PropertyHolder
 
@@ -29,7 +30,9 @@ class EnrichSignals(object):
             incoming_signal (Signal): The signal object that powered this
                 particular operation
             copy (bool): Whether or not to perform a deep copy on the
-                incoming signal before operating on it
+                incoming signal before operating on it. Plain signals are not
+                copied right away, the output signal is an overlay of the
+                results over the incoming signal, see OverlaySignal.
 
         Returns:
             sig (Signal): A single Signal formatted according to the block
@@ -38,14 +41,23 @@ class EnrichSignals(object):
             # This is the easy case, we don't want any of the previous data
             return Signal(signal_data)
 
+        enrich_field = self.enrich().enrich_field()
+        if copy and type(incoming_signal) in (Signal, OverlaySignal):
+            # Overlay the results instead of copying the incoming signal,
+            # other signal types are copied to keep their type
+            if enrich_field:
+                return OverlaySignal(
+                    incoming_signal, {enrich_field: signal_data})
+            return OverlaySignal(incoming_signal, signal_data)
+
         if copy:
             new_sig = deepcopy(incoming_signal)
         else:
             new_sig = incoming_signal
 
-        if self.enrich().enrich_field():
+        if enrich_field:
             # Just set the signal data to a result attribute
-            setattr(new_sig, self.enrich().enrich_field(), signal_data)
+            setattr(new_sig, enrich_field, signal_data)
             return new_sig
 
         # If we're here, we need to merge the signal data onto the incoming
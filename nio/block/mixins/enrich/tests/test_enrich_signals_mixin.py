@@ -1,6 +1,7 @@
 from nio.block.mixins.enrich.enrich_signals import EnrichSignals
 from nio.block.base import Block, DEFAULT_TERMINAL
 from nio.signal.base import Signal
+from nio.signal.overlay import OverlaySignal
 from nio.testing.block_test_case import NIOBlockTestCase
 
 
@@ -129,3 +130,35 @@ class TestEnrichSignals(NIOBlockTestCase):
                 'enrich_field': field
             }
         })
+
+    def test_copy_overlays_results(self):
+        """ Plain signals are not copied until the output is modified """
+        blk = EnrichingBlock()
+        self.set_up_block(blk, False, '')
+        incoming_signal = Signal({
+            'key1': 'val1',
+            'nested': {'key2': 'val2'}
+        })
+        out_sig = blk.get_output_signal({'a': 1}, incoming_signal, copy=True)
+        self.assertIsInstance(out_sig, OverlaySignal)
+        self.assertEqual(out_sig.key1, 'val1')
+        self.assertEqual(out_sig.a, 1)
+        # nested values are still copied before they can be modified
+        out_sig.nested['key2'] = 'updated val2'
+        self.assertEqual(incoming_signal.nested['key2'], 'val2')
+        self.assertFalse(hasattr(incoming_signal, 'a'))
+
+    def test_copy_keeps_signal_type(self):
+        """ Signals of other types are copied keeping their type """
+
+        class OtherSignal(Signal):
+            pass
+
+        blk = EnrichingBlock()
+        self.set_up_block(blk, False, 'results')
+        incoming_signal = OtherSignal({'key1': 'val1'})
+        out_sig = blk.get_output_signal({'a': 1}, incoming_signal, copy=True)
+        self.assertIsInstance(out_sig, OtherSignal)
+        self.assertDictEqual(out_sig.to_dict(),
+                             {'key1': 'val1', 'results': {'a': 1}})
+        self.assertFalse(hasattr(incoming_signal, 'results'))
@@ -1,9 +1,14 @@
+from concurrent.futures import CancelledError, Future
 from copy import copy
-from collections import defaultdict, Hashable
-from nio.properties import Property
+from collections import defaultdict, deque, OrderedDict
+from functools import partial
+from threading import Lock
+from nio.util.clock import monotonic
+from nio.properties import Property, IntProperty, TimeDeltaProperty
 from nio.util.ensure_types import ensure_list
 from nio.command import command
 from nio.command.holder import CommandHolder
+from nio.util.threading.pool import ThreadPool
 
 
 @command("groups", method='_groups_command')
@@ -25,16 +30,75 @@ class GroupBy(CommandHolder):
     grouping all incoming signals and processing them independently by not
     overriding process_signals but instead overriding process_group_signals.
 
+    Groups can be evicted once they have not been seen for a while or when
+    there are too many of them, least recently seen groups first. Override
+    group_evicted to release any state kept for a group.
+
+    Groups can also be processed in parallel by a pool of group_workers
+    threads. Calls for the same group still run one at a time, in the order
+    they were made, and results keep the order groups were found in. Once
+    the block stops, calls not started yet run in the calling thread.
+
     Properties:
         group_by: The expression by which signals will be grouped.
+        group_expiration: How long a group is kept after it was last seen,
+            groups never expire when zero.
+        max_groups: Maximum number of groups to keep, unlimited when zero.
+        group_workers: Number of threads processing groups in parallel,
+            groups are processed in the calling thread when zero.
 
     """
 
     group_by = Property(title="Group By", default=None, order=100, allow_none=True)
+    group_expiration = TimeDeltaProperty(
+        title="Group Expiration", default={"seconds": 0}, advanced=True,
+        order=101)
+    max_groups = IntProperty(
+        title="Max Groups", default=0, advanced=True, order=102)
+    group_workers = IntProperty(
+        title="Group Workers", default=0, advanced=True, order=103)
 
     def __init__(self):
         super().__init__()
         self._groups = set()
+        # time each group was last seen, least recently seen first, only kept
+        # when groups can be evicted
+        self._groups_last_seen = OrderedDict()
+        self._groups_lock = Lock()
+        self._group_expiration = 0
+        self._max_groups = 0
+        self._evicted_groups = {"expired": 0, "capacity": 0}
+        # function returning the group of a signal, set when configured
+        self._group_key = None
+        self._group_executor = None
+        # calls waiting for their group to be free, per group being
+        # processed, also guards the group executor
+        self._pending_group_calls = {}
+        self._pending_group_calls_lock = Lock()
+
+    def configure(self, context):
+        super().configure(context)
+        self._group_key = self.group_by.compile()
+        self._group_expiration = self.group_expiration().total_seconds()
+        self._max_groups = self.max_groups()
+        if self.group_workers() > 0:
+            self._group_executor = ThreadPool(
+                "GroupBy", self.group_workers())
+
+    def stop(self):
+        with self._pending_group_calls_lock:
+            group_executor = self._group_executor
+            # calls made from now on run in the calling thread
+            self._group_executor = None
+            pending_group_calls = self._pending_group_calls
+            self._pending_group_calls = {}
+        if group_executor:
+            group_executor.shutdown()
+            # calls not started are run by the thread waiting for them
+            for pending_calls in pending_group_calls.values():
+                for (_, future) in pending_calls:
+                    future.cancel()
+        super().stop()
 
     def for_each_group(self, target, signals=None, *args, **kwargs):
         """ Execute a function once for every group
@@ -45,7 +109,8 @@ class GroupBy(CommandHolder):
         processed in this block.
 
         Note that the required template for 'target' depends on
-        whether or not signals are provided for grouping.
+        whether or not signals are provided for grouping. When groups are
+        processed in parallel, 'target' must not call for_each_group.
 
         Args:
             target (callable): The target function.
@@ -64,23 +129,32 @@ class GroupBy(CommandHolder):
         # if there are no signals, assume that the target function has
         # only one parameter, the group key
         if signals is None:
+            self._evict_groups()
             # We are going to map each group key over the target function
             # and produce the output along the way.
             # We need to send a copy of self._groups so that in case the target
             # function alters the groups list it doesn't affect iteration
-            for group in copy(self._groups):
-                result = target(group, *args, **kwargs)
-                if result:
-                    output.extend(ensure_list(result))
+            calls = [(group, partial(target, group, *args, **kwargs))
+                     for group in copy(self._groups)]
 
         # otherwise, assume that the target function has two arguments,
         # the signal and its group key
         else:
-            for group, group_sigs in self._group_signals(signals).items():
-                result = target(group_sigs, group, *args, **kwargs)
-                if result:
-                    output.extend(ensure_list(result))
+            signal_groups = self._group_signals(signals)
+            calls = [(group, partial(target, group_sigs, group,
+                                     *args, **kwargs))
+                     for group, group_sigs in signal_groups.items()]
 
+        if self._group_executor is None:
+            results = (call() for (_, call) in calls)
+        else:
+            futures = [(self._submit_group_call(group, call), call)
+                       for (group, call) in calls]
+            results = (self._group_call_result(future, call)
+                       for (future, call) in futures)
+        for result in results:
+            if result:
+                output.extend(ensure_list(result))
         return output
 
     def process_signals(self, signals, input_id=None):
@@ -114,6 +188,14 @@ class GroupBy(CommandHolder):
         """
         raise NotImplementedError
 
+    def group_evicted(self, group):
+        """Override this method to release the state kept for a group.
+
+        Called every time a group expires or is evicted to keep the number of
+        groups under max_groups.
+        """
+        pass
+
     def _group_signals(self, signals):
         """ Groups the provided signals according to the configuration
 
@@ -124,26 +206,129 @@ class GroupBy(CommandHolder):
             dict: A dictionary where keys are group names and values are lists
                 of the signals in that group
         """
+        group_key = self._group_key or self.group_by
         signal_groups = defaultdict(list)
-        for s in signals:
-            key = self.group_by(s)
+        unhashable_keys = 0
+        try:
+            for s in signals:
+                key = group_key(s)
+                try:
+                    signal_groups[key].append(s)
+                except TypeError:
+                    # keys that are not hashable are grouped by their str
+                    # representation instead
+                    unhashable_keys += 1
+                    signal_groups[str(key)].append(s)
+        finally:
+            # Record the groups found, even when grouping failed midway
+            self._groups.update(signal_groups)
+        if unhashable_keys:
+            self.logger.warning(
+                "{} signals had a group that is not hashable, grouped by its "
+                "str representation instead".format(unhashable_keys))
 
-            # Need to make sure that the key is a hashable object
-            if not isinstance(key, Hashable):
-                self.logger.warning(
-                    "{} is not hashable cannot be grouped by. Using str "
-                    "representation instead".format(key))
-                key = str(key)
+        self._evict_groups(signal_groups)
+        return signal_groups
 
-            # Add the key to our set of groups and the signal to the list
-            # corresponding to the group
-            self._groups.add(key)
-            signal_groups[key].append(s)
+    def _submit_group_call(self, group, call):
+        """ Execute a call for a group in the group executor
 
-        return signal_groups
+        Calls for a group being processed wait for it to be done and are
+        then executed in the same thread, in the order they were submitted.
+        The call is cancelled when the block is stopped.
+
+        Returns:
+            Future: the call result
+        """
+        future = Future()
+        with self._pending_group_calls_lock:
+            if self._group_executor is None:
+                # the block stopped
+                future.cancel()
+                return future
+            pending_calls = self._pending_group_calls.get(group)
+            submit = pending_calls is None
+            if submit:
+                pending_calls = self._pending_group_calls[group] = deque()
+            pending_calls.append((call, future))
+            if submit:
+                self._group_executor.submit(
+                    self._execute_group_calls, group, pending_calls)
+        return future
+
+    def _execute_group_calls(self, group, pending_calls):
+        """ Execute the calls pending for a group until there are none """
+        while True:
+            with self._pending_group_calls_lock:
+                if not pending_calls:
+                    if self._pending_group_calls.get(group) is pending_calls:
+                        del self._pending_group_calls[group]
+                    return
+                call, future = pending_calls.popleft()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(call())
+                except BaseException as e:
+                    future.set_exception(e)
+
+    @staticmethod
+    def _group_call_result(future, call):
+        """ Wait for a group call, run it if it was cancelled """
+        try:
+            return future.result()
+        except CancelledError:
+            return call()
+
+    def _evict_groups(self, seen_groups=()):
+        """ Evict expired groups and groups over max_groups
+
+        The groups just seen are never evicted since they are about to be
+        processed, signals with more than max_groups groups leave that many
+        groups until further signals are grouped.
+
+        Args:
+            seen_groups (collection): groups that were just seen
+        """
+        if not self._group_expiration and not self._max_groups:
+            return
+        now = monotonic()
+        evicted = []
+        with self._groups_lock:
+            last_seen = self._groups_last_seen
+            for group in seen_groups:
+                last_seen[group] = now
+                last_seen.move_to_end(group)
+            if self._group_expiration:
+                while last_seen:
+                    group, seen = next(iter(last_seen.items()))
+                    if now - seen < self._group_expiration:
+                        break
+                    del last_seen[group]
+                    evicted.append(group)
+                    self._evicted_groups["expired"] += 1
+            if self._max_groups:
+                while len(last_seen) > self._max_groups:
+                    group = next(iter(last_seen))
+                    if group in seen_groups:
+                        # every older group is evicted already, the groups
+                        # about to be processed are kept
+                        break
+                    del last_seen[group]
+                    evicted.append(group)
+                    self._evicted_groups["capacity"] += 1
+            for group in evicted:
+                self._groups.discard(group)
+        for group in evicted:
+            self.group_evicted(group)
 
     def groups(self):
+        self._evict_groups()
         return self._groups
 
     def _groups_command(self):
-        return {"groups": list(self._groups)}
+        groups = list(self.groups())
+        return {
+            "groups": groups,
+            "count": len(groups),
+            "evicted": dict(self._evicted_groups)
+        }
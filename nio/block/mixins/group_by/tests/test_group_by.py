@@ -1,4 +1,6 @@
-from unittest.mock import MagicMock
+from functools import partial
+from threading import Barrier, Event, current_thread
+from unittest.mock import MagicMock, patch
 from nio.block.mixins.group_by.group_by import GroupBy
 from nio.block.base import Block, DEFAULT_TERMINAL
 from nio.signal.base import Signal
@@ -19,6 +21,9 @@ class GroupingBlock(GroupBy, Block):
     def process_group_without_signals(self, group):
         self._group_count += 1
 
+    def group_evicted(self, group):
+        del self._data[group]
+
 
 class NoOutputBlock(GroupBy, Block):
 
@@ -217,7 +222,11 @@ class TestGroupBy(NIOBlockTestCase):
         })
 
         block_groups = block._groups_command()
-        self.assertDictEqual(block_groups, {"groups": []})
+        self.assertDictEqual(block_groups, {
+            "groups": [],
+            "count": 0,
+            "evicted": {"expired": 0, "capacity": 0}
+        })
 
         # Notify 3 signals into the block
         block.process_signals([
@@ -227,17 +236,17 @@ class TestGroupBy(NIOBlockTestCase):
         ])
 
         # verify created groups
-        expected_groups = {"groups": [1, 2]}
         block_groups = block._groups_command()
-        self.assertDictEqual(expected_groups, block_groups)
+        self.assertEqual(block_groups["groups"], [1, 2])
+        self.assertEqual(block_groups["count"], 2)
 
         block.process_signals([
             Signal({"group": 3, "value": 3})
         ])
 
-        expected_groups = {"groups": [1, 2, 3]}
         block_groups = block._groups_command()
-        self.assertDictEqual(expected_groups, block_groups)
+        self.assertEqual(block_groups["groups"], [1, 2, 3])
+        self.assertEqual(block_groups["count"], 3)
 
     def test_no_output(self):
         """If process_group_signals returns empty lists, don't notify them"""
@@ -250,3 +259,148 @@ class TestGroupBy(NIOBlockTestCase):
             Signal({"group": 1, "value": 2})
         ])
         self.assertFalse(block.notify_signals.called)
+
+    def test_group_expiration(self):
+        """Groups not seen for longer than the expiration are evicted"""
+        block = GroupingBlock()
+        self.configure_block(block, {
+            "group_by": "{{ $group }}",
+            "group_expiration": {"seconds": 10}
+        })
+        with patch("nio.block.mixins.group_by.group_by.monotonic") as now:
+            now.return_value = 100
+            block.process_signals([Signal({"group": 1}), Signal({"group": 2})])
+            now.return_value = 105
+            block.process_signals([Signal({"group": 1})])
+            now.return_value = 111
+            # group 2 was last seen 11 seconds ago
+            self.assertEqual(block.groups(), {1})
+            self.assertEqual(list(block._data), [1])
+            block.for_each_group(block.process_group_without_signals)
+            self.assertEqual(block._group_count, 1)
+            now.return_value = 115
+            block_groups = block._groups_command()
+        self.assertEqual(block_groups["groups"], [])
+        self.assertEqual(block_groups["count"], 0)
+        self.assertDictEqual(block_groups["evicted"],
+                             {"expired": 2, "capacity": 0})
+
+    def test_max_groups(self):
+        """Least recently seen groups are evicted over max groups"""
+        block = GroupingBlock()
+        self.configure_block(block, {
+            "group_by": "{{ $group }}",
+            "max_groups": 2
+        })
+        block.process_signals([Signal({"group": 1}), Signal({"group": 2})])
+        block.process_signals([Signal({"group": 1})])
+        block.process_signals([Signal({"group": 3})])
+        self.assertEqual(block.groups(), {1, 3})
+        self.assertEqual(sorted(block._data), [1, 3])
+        self.assertDictEqual(block._groups_command()["evicted"],
+                             {"expired": 0, "capacity": 1})
+
+    def test_max_groups_exceeded_by_signals(self):
+        """Groups of the signals being processed are never evicted"""
+        block = GroupingBlock()
+        self.configure_block(block, {
+            "group_by": "{{ $group }}",
+            "max_groups": 2
+        })
+        block.process_signals([Signal({"group": 1})])
+        block.process_signals(
+            [Signal({"group": group}) for group in (2, 3, 4)])
+        self.assertEqual(sorted(block._data), [2, 3, 4])
+        self.assertEqual(list(block._groups_last_seen), [2, 3, 4])
+        # groups over max_groups are evicted once no longer being processed
+        self.assertEqual(block.groups(), {3, 4})
+        self.assertEqual(sorted(block._data), [3, 4])
+        self.assertDictEqual(block._groups_command()["evicted"],
+                             {"expired": 0, "capacity": 2})
+
+    def test_group_workers(self):
+        """Groups are processed in parallel keeping the order of results"""
+        block = GroupingBlock()
+        self.configure_block(block, {
+            "group_by": "{{ $group }}",
+            "group_workers": 3
+        })
+        threads = set()
+        all_running = Barrier(3, timeout=5)
+
+        def target(signals, group):
+            threads.add(current_thread())
+            # only returns when all groups are being processed at once
+            all_running.wait()
+            return [s.value for s in signals]
+
+        out = block.for_each_group(target, [
+            Signal({"group": "b", "value": 1}),
+            Signal({"group": "a", "value": 2}),
+            Signal({"group": "c", "value": 3}),
+            Signal({"group": "b", "value": 4})
+        ])
+        self.assertEqual(out, [1, 4, 2, 3])
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(current_thread(), threads)
+        block.stop()
+
+    def test_group_workers_keep_group_order(self):
+        """Calls for a group run one at a time in the order they were made"""
+        block = GroupingBlock()
+        self.configure_block(block, {
+            "group_by": "{{ $group }}",
+            "group_workers": 2
+        })
+        release = Event()
+        calls = []
+
+        def target(group, index):
+            if index == 0:
+                release.wait(5)
+            calls.append(index)
+            return index
+
+        first = block._submit_group_call("a", partial(target, "a", 0))
+        second = block._submit_group_call("a", partial(target, "a", 1))
+        other = block._submit_group_call("b", partial(target, "b", 2))
+        # other groups are not held back
+        self.assertEqual(other.result(5), 2)
+        self.assertFalse(second.done())
+        release.set()
+        self.assertEqual(second.result(5), 1)
+        self.assertEqual(first.result(), 0)
+        self.assertEqual(calls, [2, 0, 1])
+        self.assertEqual(block._pending_group_calls, {})
+        block.stop()
+
+    def test_group_workers_stopped(self):
+        """Calls not started when stopping run in the calling thread"""
+        block = GroupingBlock()
+        self.configure_block(block, {
+            "group_by": "{{ $group }}",
+            "group_workers": 1
+        })
+        started = Event()
+        release = Event()
+
+        def target(group):
+            if group == "a":
+                started.set()
+                release.wait(5)
+            return current_thread()
+
+        first = block._submit_group_call("a", partial(target, "a"))
+        second = block._submit_group_call("a", partial(target, "a"))
+        # the first call is running when stopping
+        self.assertTrue(started.wait(5))
+        block.stop()
+        self.assertTrue(second.cancelled())
+        release.set()
+        self.assertNotEqual(first.result(5), current_thread())
+        # calls made once stopped do not reach the pool
+        out = block.for_each_group(
+            lambda signals, group: current_thread(), [Signal({"group": "b"})])
+        self.assertEqual(out, [current_thread()])
+        self.assertTrue(
+            block._submit_group_call("b", partial(target, "b")).cancelled())
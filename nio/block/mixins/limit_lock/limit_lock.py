@@ -1,10 +1,26 @@
-from threading import Lock
+from threading import Condition, Lock
+from time import monotonic
 
 
 class LockQueueFull(Exception):
     pass
 
 
+class LockTimeout(LockQueueFull):
+    pass
+
+
+class _KeyLock(object):
+
+    """ Permits and waiting threads of a lock key """
+
+    def __init__(self, lock, permits):
+        self.condition = Condition(lock)
+        self.permits = permits
+        self.holders = 0
+        self.waiting = 0
+
+
 class LimitLock(object):
 
     """ A block mixin that provides lock functionality.
@@ -19,16 +35,32 @@ class LimitLock(object):
         and any keyword arguments. The arg max_locks defines how many threads
         will wait for this lock before aborting.
 
-    Note: This method can only be used in one place in your block code.
+    The lock can be held by more than one thread at a time by giving it more
+    permits, waiting for it can be limited in time and separate locks can be
+    used for different keys, for example one per target host.
+
+    Note: This method can only be used in one place in your block code, unless
+    each place uses its own lock key.
 
     """
 
     def __init__(self):
         super().__init__()
+        # guards every key lock and counter
         self._exceute_lock = Lock()
+        self._key_locks = {}
         self._number_of_locks = 0
+        self._lock_metrics = {
+            "acquired": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "wait_time": 0.0,
+            "max_wait_time": 0.0,
+        }
 
-    def execute_with_lock(self, execute_method, max_locks, *args, **kwargs):
+    def execute_with_lock(self, execute_method, max_locks, *args,
+                          lock_permits=1, lock_timeout=None, lock_key=None,
+                          **kwargs):
         """ Execute a given method inside of a limited lock
 
         This method will wait to acquire a lock before executing the specified
@@ -38,26 +70,105 @@ class LimitLock(object):
         Args:
             execute_method (function): The function to execute once the lock
                 is acquired
-            max_locks (int): The maximum number of threads allowed to wait for
-                the lock to acquire
+            max_locks (int): The maximum number of threads allowed to hold or
+                wait for the lock
             *args, **kwargs: Additional arguments to pass to the execute_method
 
+        Keyword Args:
+            lock_permits (int): Number of threads that can hold the lock at
+                the same time, set by the first call for a lock key
+            lock_timeout (float): Maximum number of seconds to wait for the
+                lock, wait indefinitely when None
+            lock_key: Key of the lock to use, calls with different keys use
+                separate locks and are limited separately
+
         Returns:
             The result of the execute_method, once it actually executes
 
         Raises:
             LockQueueFull: If the call exceeds the maximum number of threads
                 that can wait for the lock.
+            LockTimeout: If the lock was not acquired within lock_timeout
+        """
+        key_lock = self._acquire_lock(
+            max_locks, lock_permits, lock_timeout, lock_key)
+        try:
+            return execute_method(*args, **kwargs)
+        finally:
+            self._release_lock(key_lock, lock_key)
+
+    def lock_metrics(self):
+        """ Get the lock metrics
+
+        Returns:
+            dict: number of times the lock was acquired, rejected because too
+                many threads were waiting and timed out, and the total and
+                maximum time in seconds spent waiting for the lock
         """
-        if self._number_of_locks >= max_locks:
-            self.logger.warning(
-                "Currently {} locks waiting to be acquired. This is more than "
-                "the max. Aborting call to method in this thread.".format(
-                    self._number_of_locks))
-            raise LockQueueFull
-        self._number_of_locks += 1
         with self._exceute_lock:
-            try:
-                return execute_method(*args, **kwargs)
-            finally:
+            return dict(self._lock_metrics)
+
+    def _acquire_lock(self, max_locks, permits, timeout, key):
+        with self._exceute_lock:
+            key_lock = self._key_locks.get(key)
+            if key_lock is None:
+                key_lock = _KeyLock(self._exceute_lock, permits)
+                self._key_locks[key] = key_lock
+            number_of_locks = key_lock.holders + key_lock.waiting
+            if number_of_locks < max_locks:
+                self._number_of_locks += 1
+                if self._wait_for_lock(key_lock, timeout):
+                    key_lock.holders += 1
+                    self._lock_metrics["acquired"] += 1
+                    return key_lock
                 self._number_of_locks -= 1
+                self._lock_metrics["timed_out"] += 1
+                self._discard_key_lock(key_lock, key)
+                timed_out = True
+            else:
+                self._lock_metrics["rejected"] += 1
+                self._discard_key_lock(key_lock, key)
+                timed_out = False
+        if timed_out:
+            raise LockTimeout
+        self.logger.warning(
+            "Currently {} locks waiting to be acquired. This is more than "
+            "the max. Aborting call to method in this thread.".format(
+                number_of_locks))
+        raise LockQueueFull
+
+    def _wait_for_lock(self, key_lock, timeout):
+        """ Wait for a permit, to be called holding the lock
+
+        Returns:
+            bool: False if the timeout expired
+        """
+        if not key_lock.waiting and key_lock.holders < key_lock.permits:
+            return True
+        start = monotonic()
+        key_lock.waiting += 1
+        try:
+            acquired = key_lock.condition.wait_for(
+                lambda: key_lock.holders < key_lock.permits, timeout)
+        finally:
+            key_lock.waiting -= 1
+        waited = monotonic() - start
+        self._lock_metrics["wait_time"] += waited
+        self._lock_metrics["max_wait_time"] = max(
+            self._lock_metrics["max_wait_time"], waited)
+        if not acquired:
+            # a permit released while timing out goes to the next thread
+            key_lock.condition.notify()
+        return acquired
+
+    def _release_lock(self, key_lock, key):
+        with self._exceute_lock:
+            key_lock.holders -= 1
+            self._number_of_locks -= 1
+            key_lock.condition.notify()
+            self._discard_key_lock(key_lock, key)
+
+    def _discard_key_lock(self, key_lock, key):
+        """ Forget about a key lock nobody holds or waits for """
+        if not key_lock.holders and not key_lock.waiting:
+            del self._key_locks[key]
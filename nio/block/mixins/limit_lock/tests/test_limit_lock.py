@@ -3,7 +3,8 @@ from time import sleep
 from unittest.mock import MagicMock
 
 from nio.block.base import Block
-from nio.block.mixins.limit_lock.limit_lock import LimitLock, LockQueueFull
+from nio.block.mixins.limit_lock.limit_lock import LimitLock, LockQueueFull, \
+    LockTimeout
 from nio.signal.base import Signal
 from nio.testing.block_test_case import NIOBlockTestCase
 from nio.util.threading import spawn
@@ -149,3 +150,67 @@ class TestLock(NIOBlockTestCase):
         block.logger = MagicMock()
         block.execute_with_lock(execute_method, 1, 1, 2, arg4=4)
         self.assertEqual(block._number_of_locks, 0)
+
+    def test_lock_permits(self):
+        """The lock can be held by as many threads as permits"""
+        running = []
+        release = Event()
+
+        def execute_method():
+            running.append(None)
+            release.wait(2)
+        block = LimitLock()
+        block.logger = MagicMock()
+        threads = [spawn(block.execute_with_lock, execute_method, 5,
+                         lock_permits=2) for _ in range(3)]
+        sleep(0.1)
+        # two threads hold the lock and one waits for it
+        self.assertEqual(len(running), 2)
+        self.assertEqual(block._number_of_locks, 3)
+        release.set()
+        for thread in threads:
+            thread.join(1)
+        self.assertEqual(len(running), 3)
+        self.assertEqual(block._number_of_locks, 0)
+        self.assertEqual(block._key_locks, {})
+        metrics = block.lock_metrics()
+        self.assertEqual(metrics["acquired"], 3)
+        self.assertGreater(metrics["max_wait_time"], 0)
+
+    def test_lock_timeout(self):
+        """Waiting for the lock can time out"""
+        release = Event()
+        block = LimitLock()
+        block.logger = MagicMock()
+        holder = spawn(block.execute_with_lock, release.wait, 5, 2)
+        sleep(0.05)
+        with self.assertRaises(LockTimeout):
+            block.execute_with_lock(MagicMock(), 5, lock_timeout=0.05)
+        self.assertEqual(block._number_of_locks, 1)
+        release.set()
+        holder.join(1)
+        # lock is free again once the holder is done
+        block.execute_with_lock(MagicMock(), 5, lock_timeout=0.05)
+        metrics = block.lock_metrics()
+        self.assertEqual(metrics["timed_out"], 1)
+        self.assertEqual(metrics["acquired"], 2)
+        self.assertGreaterEqual(metrics["wait_time"], 0.05)
+
+    def test_lock_keys(self):
+        """Each key is a separate lock, limited on its own"""
+        release = Event()
+        block = LimitLock()
+        block.logger = MagicMock()
+        holder = spawn(block.execute_with_lock, release.wait, 1, 2,
+                       lock_key="host1")
+        sleep(0.05)
+        with self.assertRaises(LockQueueFull):
+            block.execute_with_lock(MagicMock(), 1, lock_key="host1")
+        execute_method = MagicMock(return_value=3)
+        self.assertEqual(block.execute_with_lock(
+            execute_method, 1, "arg", lock_key="host2", kwarg=4), 3)
+        execute_method.assert_called_once_with("arg", kwarg=4)
+        release.set()
+        holder.join(1)
+        self.assertEqual(block.lock_metrics()["rejected"], 1)
+        self.assertEqual(block._key_locks, {})
@@ -1,3 +1,8 @@
+import pickle
+from functools import partial
+from hashlib import sha1
+
+from nio.block.mixins.persistence.writer import PersistenceWriter
 from nio.modules.persistence import Persistence as PersistenceModule
 from nio.modules.scheduler import Job
 from nio.properties import TimeDeltaProperty, BoolProperty
@@ -11,6 +16,11 @@ class Persistence(object):
     on your class you wish to have persisted. The values should be strings
     that correspond to the variable names to be saved.
 
+    Values are only saved when they changed since they were last saved or
+    loaded, and they are written by a background thread, stopping waits for
+    them to be written. Blocks with large state can also save separate keys
+    as they change with persistence_save_key.
+
     """
 
     backup_interval = TimeDeltaProperty(
@@ -23,6 +33,9 @@ class Persistence(object):
         super().__init__()
         self._persistence = None
         self._backup_job = None
+        self._writer = None
+        # fingerprint of the data last saved or loaded
+        self._saved_fingerprint = None
         self._warn_on_override("persistence_serialize", "persisted_values")
         self._warn_on_override("persistence_deserialize", "persisted_values")
 
@@ -52,6 +65,7 @@ class Persistence(object):
         data = self._persistence.load(self.id(), default={})
         if not data:
             return
+        self._saved_fingerprint = self._fingerprint(data)
 
         try:
             self.persistence_deserialize(data)
@@ -70,8 +84,10 @@ class Persistence(object):
 
     def _save(self):
         """ Save the values to persistence
+
+        Values are queued to be written by the background writer, nothing is
+        saved if they did not change since they were last saved.
         """
-        self.logger.debug("Saving to persistence")
         try:
             data = self.persistence_serialize()
         except NotImplementedError:
@@ -81,13 +97,46 @@ class Persistence(object):
             data = {persisted_var: getattr(self, persisted_var)
                     for persisted_var in self.persisted_values()}
 
-        # save generated dictionary under block's id
-        self._persistence.save(data, self.id())
+        data, fingerprint = self._snapshot(data)
+        if fingerprint is not None and fingerprint == self._saved_fingerprint:
+            self.logger.debug("Nothing changed, skipping save")
+            return
+        self.logger.debug("Saving to persistence")
+        # save generated dictionary under block's id, the data counts as
+        # saved once written so that a failed write is retried next time
+        self._writer.save(data, self.id(),
+                          on_written=partial(self._saved, fingerprint))
+
+    def _saved(self, fingerprint):
+        self._saved_fingerprint = fingerprint
+
+    @staticmethod
+    def _snapshot(data):
+        """ Get a copy of the data to save along with its fingerprint
+
+        The block may change its data before the writer gets to write it,
+        the copy is what the fingerprint describes. When the data can't be
+        pickled it is saved as it is, without a fingerprint.
+        """
+        try:
+            pickled = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return data, None
+        return pickle.loads(pickled), sha1(pickled).digest()
+
+    @staticmethod
+    def _fingerprint(data):
+        """ Get a digest of the data to save, None if it can't be pickled """
+        try:
+            return sha1(pickle.dumps(data, pickle.HIGHEST_PROTOCOL)).digest()
+        except Exception:
+            return None
 
     def configure(self, context):
         super().configure(context)
         # Create a persistence object using the block's id
         self._persistence = PersistenceModule()
+        self._writer = PersistenceWriter(self._persistence, self.logger)
         if self.load_from_persistence():
             self._load()
 
@@ -103,10 +152,54 @@ class Persistence(object):
         if self._backup_job:
             self._backup_job.cancel()
 
-        # Do one last save before stopping
+        # Do one last save before stopping, waiting for it to be written
         self._save()
+        self._writer.flush()
         super().stop()
 
+    def persistence_save_key(self, key, value):
+        """ Save a single value of the block
+
+        Blocks with large state can save values as they change instead of
+        saving all of them every time. Values are saved under the block
+        collection, separately from the values saved by persisted_values or
+        persistence_serialize.
+
+        Args:
+            key (str): identifier of the value
+            value: value to save
+        """
+        self._writer.save(value, key, self.id())
+
+    def persistence_remove_key(self, key):
+        """ Remove a value saved with persistence_save_key
+
+        Args:
+            key (str): identifier of the value
+        """
+        self._writer.remove(key, self.id())
+
+    def persistence_load_keys(self):
+        """ Load the values saved with persistence_save_key
+
+        Returns:
+            dict: saved values indexed by key
+        """
+        self._writer.flush()
+        return self._persistence.load_collection(self.id(), default={})
+
+    def persistence_flush(self, timeout=None):
+        """ Wait for saved values to be written to persistence
+
+        Args:
+            timeout (float): maximum number of seconds to wait, wait until
+                done when None
+
+        Returns:
+            bool: False if the timeout expired before values were written
+        """
+        return self._writer.flush(timeout)
+
     def persistence_serialize(self):
         """ Serializes block data
 
@@ -1,4 +1,5 @@
 from datetime import timedelta
+from threading import Event
 from unittest.mock import MagicMock, patch
 
 from nio.block.base import Block
@@ -86,12 +87,121 @@ class TestPersistence(NIOBlockTestCase):
                 block._save, timedelta(seconds=1), True)
         # Simulate 2 saves occurring, change the value of the variable once
         block._save()
+        block.persistence_flush(1)
         block._to_be_saved = 'new_value'
         block._save()
+        block.persistence_flush(1)
         # Stop the block to initiate one more save
         block.stop()
-        # We should have had 3 saves, 2 during execution and 1 on the stop
-        self.assertEqual(block._persistence.save.call_count, 3)
+        # We should have had 2 saves during execution, the one on the stop
+        # is skipped since nothing changed
+        self.assertEqual(block._persistence.save.call_count, 2)
+
+    def test_skips_unchanged_saves(self):
+        """ Values are saved only when they change """
+        block = PersistingBlock()
+        self.configure_block(block, {"id": "test_block"})
+        block._persistence.save = MagicMock()
+        block._save()
+        block.persistence_flush(1)
+        block._save()
+        block._to_be_saved_again = 'updated value'
+        block._save()
+        block.persistence_flush(1)
+        self.assertEqual(block._persistence.save.call_count, 2)
+        block._persistence.save.assert_called_with({
+            '_to_be_saved': 'value',
+            '_to_be_saved_again': 'updated value'
+        }, 'test_block', None)
+
+    def test_retries_failed_save(self):
+        """ Values that failed to be written are saved again """
+        block = PersistingBlock()
+        self.configure_block(block, {"id": "test_block"})
+        block._persistence.save = MagicMock(side_effect=[IOError, None])
+        block._save()
+        block.persistence_flush(1)
+        block._save()
+        block.persistence_flush(1)
+        self.assertEqual(block._persistence.save.call_count, 2)
+        # once written, unchanged values are skipped
+        block._save()
+        block.persistence_flush(1)
+        self.assertEqual(block._persistence.save.call_count, 2)
+
+    def test_skips_save_of_loaded_values(self):
+        """ Values just loaded are not saved again """
+        PersistenceModule().save(
+            {'_to_be_saved': 3, '_to_be_saved_again': 4}, 'test_block')
+        block = PersistingBlock()
+        self.configure_block(block, {"id": "test_block"})
+        block._persistence.save = MagicMock()
+        block.start()
+        block.stop()
+        block.persistence_flush(1)
+        self.assertEqual(block._persistence.save.call_count, 0)
+
+    def test_saves_in_background(self):
+        """ Saves don't wait for values to be written """
+        block = PersistingBlock()
+        self.configure_block(block, {"id": "test_block"})
+        writing = Event()
+        written = Event()
+
+        def save(*args):
+            writing.set()
+            written.wait(1)
+        block._persistence.save = MagicMock(side_effect=save)
+        block._save()
+        self.assertTrue(writing.wait(1))
+        self.assertFalse(block.persistence_flush(0.01))
+        # a newer version replaces the pending one
+        block._to_be_saved = 'first'
+        block._save()
+        block._to_be_saved = 'second'
+        block._save()
+        written.set()
+        self.assertTrue(block.persistence_flush(1))
+        self.assertEqual(block._persistence.save.call_count, 2)
+        self.assertEqual(
+            block._persistence.save.call_args[0][0]['_to_be_saved'], 'second')
+
+    def test_saves_values_as_queued(self):
+        """ Values changed before being written are saved again """
+        block = PersistingBlock()
+        self.configure_block(block, {"id": "test_block"})
+        written = Event()
+        saved = []
+
+        def save(item, *args):
+            written.wait(1)
+            saved.append(item['_to_be_saved'])
+        block._persistence.save = MagicMock(side_effect=save)
+        block._to_be_saved = ['first']
+        block._save()
+        # changed in place while waiting to be written
+        block._to_be_saved.append('second')
+        written.set()
+        self.assertTrue(block.persistence_flush(1))
+        self.assertEqual(saved, [['first']])
+        block._save()
+        self.assertTrue(block.persistence_flush(1))
+        self.assertEqual(saved, [['first'], ['first', 'second']])
+
+    def test_save_keys(self):
+        """ Values can be saved separately under the block collection """
+        block = PersistingBlock()
+        self.configure_block(block, {"id": "test_block"})
+        block.persistence_save_key("key1", {"value": 1})
+        block.persistence_save_key("key2", [2])
+        block.persistence_save_key("key1", {"value": 3})
+        block.persistence_remove_key("key2")
+        self.assertDictEqual(block.persistence_load_keys(),
+                             {"key1": {"value": 3}})
+        # keys are not mixed with the block values
+        block.stop()
+        block.persistence_flush(1)
+        self.assertEqual(len(block._persistence.load(block.id())), 2)
 
     def test_no_backup(self):
         """ Backup interval of 0 means no backing up """
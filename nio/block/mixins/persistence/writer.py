@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from threading import Condition
+
+from nio.util.threading.thread import NIOThread
+
+
+class PersistenceWriter(object):
+
+    """ Writes to persistence from a background thread
+
+    Saves and removals are queued and written in order by a thread that is
+    started when there is something to write and finishes once everything
+    is written. Writing an item that is still waiting to be written replaces
+    the pending write, only the latest version gets written.
+
+    The writing thread is not a daemon thread, pending writes are completed
+    before the process exits.
+
+    Args:
+        persistence (Persistence): persistence module instance to write to
+        logger: logger used to report failed writes
+
+    """
+
+    def __init__(self, persistence, logger):
+        self._persistence = persistence
+        self._logger = logger
+        # pending writes, indexed by (collection, id)
+        self._pending = OrderedDict()
+        self._condition = Condition()
+        self._thread = None
+
+    def save(self, item, id, collection=None, on_written=None):
+        """ Queue an item to be saved, see Persistence.save
+
+        Args:
+            on_written (callable): called once the item is written, not
+                called if writing it fails or a newer version replaces it
+        """
+        self._queue(id, collection, on_written, self._persistence.save, item)
+
+    def remove(self, id, collection=None):
+        """ Queue an item to be removed, see Persistence.remove """
+        self._queue(id, collection, None, self._persistence.remove)
+
+    def flush(self, timeout=None):
+        """ Wait for pending writes to be written
+
+        Args:
+            timeout (float): maximum number of seconds to wait, wait until
+                done when None
+
+        Returns:
+            bool: False if the timeout expired before everything was written
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._thread is None, timeout)
+
+    def _queue(self, id, collection, on_written, method, *args):
+        with self._condition:
+            key = (collection, id)
+            self._pending[key] = (method, args + (id, collection), on_written)
+            if self._thread is None:
+                self._thread = NIOThread(
+                    target=self._write, name="PersistenceWriter")
+                self._thread.start()
+
+    def _write(self):
+        while True:
+            with self._condition:
+                if not self._pending:
+                    self._thread = None
+                    self._condition.notify_all()
+                    return
+                _, (method, args, on_written) = \
+                    self._pending.popitem(last=False)
+            try:
+                method(*args)
+            except Exception:
+                self._logger.exception(
+                    "Failed to write item {} to persistence".format(args[-2]))
+                continue
+            if on_written is not None:
+                on_written()
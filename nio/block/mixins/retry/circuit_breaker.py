@@ -0,0 +1,100 @@
+from enum import Enum
+from threading import Lock
+from nio.util.clock import monotonic
+
+
+class CircuitOpen(Exception):
+    """ Raised instead of executing a method while a circuit is open """
+    pass
+
+
+class CircuitState(Enum):
+    closed = "closed"
+    open = "open"
+    half_open = "half_open"
+
+
+class CircuitBreaker(object):
+
+    """ Stops executing requests to a resource that keeps failing
+
+    The circuit starts closed, letting requests through. After
+    failure_threshold consecutive failures it opens and requests fail fast
+    without being executed. Once reset_timeout seconds elapse it goes half
+    open, letting one trial request through: the circuit closes again if it
+    succeeds and opens again if it fails.
+
+    Circuit breakers can be shared by every block using the same resource
+    through CircuitBreaker.get.
+
+    Args:
+        failure_threshold (int): consecutive failures opening the circuit
+        reset_timeout (float): seconds the circuit stays open before letting
+            a trial request through
+    """
+
+    _breakers = {}
+    _breakers_lock = Lock()
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        super().__init__()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.closed
+        self._failures = 0
+        self._opened_at = None
+        self._lock = Lock()
+
+    @classmethod
+    def get(cls, name, *args, **kwargs):
+        """ Get the circuit breaker of a resource, shared by the process
+
+        The circuit breaker is created with the given arguments the first
+        time it is requested.
+
+        Args:
+            name (str): resource name
+            args/kwargs: arguments to create the circuit breaker with
+
+        Returns:
+            CircuitBreaker: circuit breaker of the resource
+        """
+        with cls._breakers_lock:
+            breaker = cls._breakers.get(name)
+            if breaker is None:
+                breaker = cls._breakers[name] = cls(*args, **kwargs)
+            return breaker
+
+    def allow_request(self):
+        """ Whether a request can be executed now
+
+        Returns:
+            bool: True if the request can go through, in which case its
+                outcome must be reported with record_success or
+                record_failure
+        """
+        with self._lock:
+            if self.state is CircuitState.closed:
+                return True
+            if self.state is CircuitState.open and \
+                    monotonic() - self._opened_at >= self.reset_timeout:
+                # let a trial request through, until it is done the circuit
+                # is half open and rejects any other request
+                self.state = CircuitState.half_open
+                return True
+            return False
+
+    def record_success(self):
+        """ Report that a request succeeded """
+        with self._lock:
+            self.state = CircuitState.closed
+            self._failures = 0
+
+    def record_failure(self):
+        """ Report that a request failed """
+        with self._lock:
+            self._failures += 1
+            if self.state is CircuitState.half_open or \
+                    self._failures >= self.failure_threshold:
+                self.state = CircuitState.open
+                self._opened_at = monotonic()
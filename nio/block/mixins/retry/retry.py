@@ -1,7 +1,13 @@
+from concurrent.futures import Future
+from datetime import timedelta
 from enum import Enum
-from threading import Event
+from threading import Event, Lock
+from nio.modules.scheduler import Job
 from nio.properties import PropertyHolder, ObjectProperty, BoolProperty, \
-    IntProperty, SelectProperty, FloatProperty
+    IntProperty, SelectProperty, FloatProperty, StringProperty
+from nio.block.mixins.retry.circuit_breaker import CircuitBreaker, \
+    CircuitOpen
+from nio.block.mixins.retry.retry_budget import RetryBudget
 from nio.block.mixins.retry.strategy import BackoffStrategy
 from nio.block.mixins.retry.strategies import LinearBackoff, ExponentialBackoff
 
@@ -14,7 +20,8 @@ class RetryStrategies(Enum):
 class RetryOptions(PropertyHolder):
     """ Options the block can be configured with to control how it retries.
 
-    The properties will be passed to the backoff strategy's constructor.
+    The properties will be passed to the backoff strategy's constructor,
+    except for the circuit breaker and retry budget ones.
     """
 
     strategy = SelectProperty(RetryStrategies, title="Strategy to Use",
@@ -25,15 +32,117 @@ class RetryOptions(PropertyHolder):
                                allow_expr=False)
     indefinite = BoolProperty(title="Continue Indefinitely?", default=False,
                               allow_expr=False)
+    jitter = BoolProperty(title="Full Jitter?", default=False,
+                          allow_expr=False)
+    resource = StringProperty(title="Resource Name", default="",
+                              allow_expr=False)
+    failure_threshold = IntProperty(title="Circuit Breaker Failures",
+                                    default=0, allow_expr=False)
+    reset_timeout = FloatProperty(title="Circuit Breaker Reset Timeout",
+                                  default=30, allow_expr=False)
+    retry_rate = FloatProperty(title="Retry Budget (retries per second)",
+                               default=0, allow_expr=False)
+    retry_burst = IntProperty(title="Retry Budget Burst", default=10,
+                              allow_expr=False)
 
     def get_options_dict(self):
         return {
             "max_retry": self.max_retry(),
             "multiplier": self.multiplier(),
-            "indefinite": self.indefinite()
+            "indefinite": self.indefinite(),
+            "jitter": self.jitter()
         }
 
 
+class _AsyncRetry(object):
+    """ A method executed by Retry.execute_with_retry_async
+
+    Each retry is executed by a scheduled Job once the backoff strategy delay
+    elapses, no thread is held meanwhile.
+    """
+
+    def __init__(self, block, backoff_strategy, stop_retry_event,
+                 execute_method, args, kwargs):
+        self.future = Future()
+        self._block = block
+        self._backoff_strategy = backoff_strategy
+        self._stop_retry_event = stop_retry_event
+        self._execute_method = execute_method
+        self._execute_method_name = getattr(
+            execute_method, '__name__', str(execute_method))
+        self._args = args
+        self._kwargs = kwargs
+        self._job = None
+        self._job_lock = Lock()
+        self.future.add_done_callback(self._cancel_job)
+
+    def execute(self):
+        if self._stop_retry_event and self._stop_retry_event.is_set():
+            self.future.cancel()
+        if self.future.done():
+            return
+        try:
+            result = self._block._execute_attempt(
+                self._execute_method, self._args, self._kwargs)
+        except CircuitOpen as exc:
+            self._block.logger.warning(
+                "Circuit is open, not executing method {}".format(
+                    self._execute_method_name))
+            self._set_result(exception=exc)
+        except Exception as exc:
+            self._block.logger.warning(
+                "Retryable execution on method {} failed".format(
+                    self._execute_method_name), exc_info=True)
+            self._backoff_strategy.request_failed(exc)
+            if not self._backoff_strategy.should_retry():
+                self._block.logger.exception(
+                    "Out of retries for method {}.".format(
+                        self._execute_method_name))
+                self._set_result(exception=exc)
+                return
+            if not self._block._acquire_retry():
+                self._block.logger.exception(
+                    "Retry budget exhausted for method {}.".format(
+                        self._execute_method_name))
+                self._set_result(exception=exc)
+                return
+            delay = self._backoff_strategy.get_retry_delay()
+            with self._job_lock:
+                if not self.future.done():
+                    self._job = Job(
+                        self._retry, timedelta(seconds=delay), False)
+        else:
+            self._backoff_strategy.request_succeeded()
+            self._set_result(result=result)
+
+    def _retry(self):
+        with self._job_lock:
+            self._job = None
+        try:
+            self._block.before_retry(*self._args, **self._kwargs)
+        except Exception as exc:
+            self._set_result(exception=exc)
+            return
+        self.execute()
+
+    def _set_result(self, result=None, exception=None):
+        # the future may be cancelled at any time, once running it no longer
+        # can be, and it is not set running if cancelled meanwhile
+        if self.future.done() or \
+                not self.future.set_running_or_notify_cancel():
+            return
+        if exception is None:
+            self.future.set_result(result)
+        else:
+            self.future.set_exception(exception)
+
+    def _cancel_job(self, future):
+        with self._job_lock:
+            if self._job is not None:
+                self._job.cancel()
+                self._job = None
+
+
 class Retry(object):
     """ A block mixin that provides retry functionality.
 
@@ -50,6 +159,10 @@ class Retry(object):
     Block developers can implement their own backoff strategies and employ
     those instead by overriding the setup_backoff_strategy method.
 
+    A circuit breaker can stop executing methods of a resource that keeps
+    failing and a retry budget can limit how often retries happen. Both are
+    shared with every block using the same resource name.
+
     How to use this mixin:
         1. Configure your block by selecting a backoff strategy as well as
         providing some options to determine how long it will wait between
@@ -89,10 +202,69 @@ class Retry(object):
     retry_options = ObjectProperty(RetryOptions, title="Retry Options",
                                    advanced=True, order=100, default=RetryOptions())
 
+    def __init__(self):
+        super().__init__()
+        # futures of the retries executing asynchronously
+        self._async_retries = set()
+        self._async_retries_lock = Lock()
+        self._circuit_breaker = None
+        self._retry_budget = None
+
     def configure(self, context):
         """ This implementation will use the configured backoff strategy """
         super().configure(context)
         self.setup_backoff_strategy()
+        self.setup_retry_limits()
+
+    def setup_retry_limits(self):
+        """ Define the circuit breaker and retry budget the block uses.
+
+        This implementation uses the ones configured in the retry options,
+        shared by every block using the same resource name. Without a
+        resource name they are only used by this block.
+
+        Block developers can override this function to use their own, see
+        use_circuit_breaker and use_retry_budget.
+        """
+        options = self.retry_options()
+        resource = options.resource()
+        circuit_breaker = retry_budget = None
+        if options.failure_threshold() > 0:
+            args = (options.failure_threshold(), options.reset_timeout())
+            circuit_breaker = CircuitBreaker.get(resource, *args) \
+                if resource else CircuitBreaker(*args)
+        if options.retry_rate() > 0:
+            args = (options.retry_rate(), options.retry_burst())
+            retry_budget = RetryBudget.get(resource, *args) \
+                if resource else RetryBudget(*args)
+        self.use_circuit_breaker(circuit_breaker)
+        self.use_retry_budget(retry_budget)
+
+    def use_circuit_breaker(self, circuit_breaker):
+        """ Execute methods only when the circuit breaker allows it
+
+        Args:
+            circuit_breaker (CircuitBreaker): circuit breaker to use, None
+                to stop using one
+        """
+        self._circuit_breaker = circuit_breaker
+
+    def use_retry_budget(self, retry_budget):
+        """ Retry only when the retry budget allows it
+
+        Args:
+            retry_budget (RetryBudget): retry budget to use, None to stop
+                using one
+        """
+        self._retry_budget = retry_budget
+
+    def stop(self):
+        """ Cancel any retry executing asynchronously """
+        with self._async_retries_lock:
+            async_retries = list(self._async_retries)
+        for future in async_retries:
+            future.cancel()
+        super().stop()
 
     def setup_backoff_strategy(self):
         """ Define which backoff strategy the block should use.
@@ -134,11 +306,17 @@ class Retry(object):
         backoff_strategy = self.__new_backoff_strategy()
         while not stop_retry_event or not stop_retry_event.is_set():
             try:
-                result = execute_method(*args, **kwargs)
+                result = self._execute_attempt(execute_method, args, kwargs)
                 # If we got here, the request succeeded, let the backoff
                 # strategy know then return the result
                 backoff_strategy.request_succeeded()
                 return result
+            except CircuitOpen:
+                # Fail fast, retrying would not execute the method either
+                self.logger.warning(
+                    "Circuit is open, not executing method {}".format(
+                        execute_method_name))
+                raise
             except Exception as exc:
                 self.logger.warning(
                     "Retryable execution on method {} failed".format(
@@ -152,6 +330,11 @@ class Retry(object):
                         "Out of retries for method {}.".format(
                             execute_method_name))
                     raise
+                elif not self._acquire_retry():
+                    self.logger.exception(
+                        "Retry budget exhausted for method {}.".format(
+                            execute_method_name))
+                    raise
                 else:
                     # Backoff strategy has instructed us to retry again. First
                     # let the strategy do any waiting, then execute any
@@ -159,6 +342,84 @@ class Retry(object):
                     backoff_strategy.wait_for_retry()
                     self.before_retry(*args, **kwargs)
 
+    def execute_with_retry_async(self, execute_method, *args,
+                                 stop_retry_event=None, **kwargs):
+        """ Execute a method and retry it later if it raises an exception
+
+        The method is executed right away in the calling thread. If it fails,
+        this method returns and the retries are executed by scheduled jobs
+        once the backoff strategy delay elapses, so no thread is held while
+        waiting. The backoff strategy must define next_retry_delay, its
+        wait_for_retry method is not used.
+
+        Args:
+            execute_method (callable): A function to attempt to execute. The
+                function may be called multiple times if retries occur.
+            args/kwargs: Optional arguments to pass to the execute method
+            stop_retry_event (Event): Event that stops retrying when set
+
+        Returns:
+            Future: resolves to the result of execute_method upon success, or
+                to the exception execute_method raised when the backoff
+                strategy decided to stop retrying. Cancelling the future, or
+                stopping the block, stops retrying. Use add_done_callback to
+                be called back once done.
+
+        Raises:
+            TypeError: the backoff strategy waits in wait_for_retry without
+                defining next_retry_delay
+        """
+        # verify incoming event type if set
+        if stop_retry_event and not isinstance(stop_retry_event, Event):
+            raise TypeError("stop_retry_event must be an instance of Event")
+        backoff_strategy = self.__new_backoff_strategy()
+        strategy_type = type(backoff_strategy)
+        if strategy_type.next_retry_delay is \
+                BackoffStrategy.next_retry_delay and \
+                strategy_type.wait_for_retry is not \
+                BackoffStrategy.wait_for_retry:
+            # retrying right away instead of waiting would flood the
+            # resource being retried
+            raise TypeError(
+                "Backoff strategy {} does not define next_retry_delay, it "
+                "can not retry asynchronously".format(strategy_type.__name__))
+        async_retry = _AsyncRetry(
+            self, backoff_strategy, stop_retry_event,
+            execute_method, args, kwargs)
+        future = async_retry.future
+        with self._async_retries_lock:
+            self._async_retries.add(future)
+        future.add_done_callback(self._async_retry_done)
+        async_retry.execute()
+        return future
+
+    def _async_retry_done(self, future):
+        with self._async_retries_lock:
+            self._async_retries.discard(future)
+
+    def _execute_attempt(self, execute_method, args, kwargs):
+        """ Execute a method once, through the circuit breaker if any
+
+        Raises:
+            CircuitOpen: the circuit breaker did not let the method execute
+        """
+        circuit_breaker = self._circuit_breaker
+        if circuit_breaker is None:
+            return execute_method(*args, **kwargs)
+        if not circuit_breaker.allow_request():
+            raise CircuitOpen()
+        try:
+            result = execute_method(*args, **kwargs)
+        except Exception:
+            circuit_breaker.record_failure()
+            raise
+        circuit_breaker.record_success()
+        return result
+
+    def _acquire_retry(self):
+        """ Whether the retry budget, if any, allows another retry """
+        return self._retry_budget is None or self._retry_budget.acquire()
+
     def use_backoff_strategy(self, strategy, *args, **kwargs):
         """ Tell this mixin which backoff strategy to use.
 
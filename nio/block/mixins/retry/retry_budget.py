@@ -0,0 +1,68 @@
+from threading import Lock
+from nio.util.clock import monotonic
+
+
+class RetryBudget(object):
+
+    """ Limits how often retries can happen using a token bucket
+
+    Every retry takes a token from the bucket, which holds up to capacity
+    tokens and is refilled at rate tokens per second. When the bucket is
+    empty retrying should stop.
+
+    Retry budgets can be shared by every block using the same resource
+    through RetryBudget.get, bounding the retries sent to it from the whole
+    process.
+
+    Args:
+        rate (float): tokens added per second
+        capacity (int): maximum number of tokens, the burst of retries allowed
+    """
+
+    _budgets = {}
+    _budgets_lock = Lock()
+
+    def __init__(self, rate, capacity=10):
+        super().__init__()
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._refilled_at = monotonic()
+        self._lock = Lock()
+
+    @classmethod
+    def get(cls, name, *args, **kwargs):
+        """ Get the retry budget of a resource, shared by the process
+
+        The retry budget is created with the given arguments the first time
+        it is requested.
+
+        Args:
+            name (str): resource name
+            args/kwargs: arguments to create the retry budget with
+
+        Returns:
+            RetryBudget: retry budget of the resource
+        """
+        with cls._budgets_lock:
+            budget = cls._budgets.get(name)
+            if budget is None:
+                budget = cls._budgets[name] = cls(*args, **kwargs)
+            return budget
+
+    def acquire(self):
+        """ Take a token to retry
+
+        Returns:
+            bool: True if there was a token for the retry
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
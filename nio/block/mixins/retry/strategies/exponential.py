@@ -1,11 +1,15 @@
-from time import sleep
+from nio.util.clock import sleep
 from nio.block.mixins.retry.strategy import BackoffStrategy
 
 
 class ExponentialBackoff(BackoffStrategy):
 
     def wait_for_retry(self):
-        """Sleep a certain number of seconds before we do the retry.
+        """Sleep a certain number of seconds before we do the retry."""
+        sleep(self.get_retry_delay())
+
+    def next_retry_delay(self):
+        """Number of seconds to wait before the next retry.
 
         We will wait the multiplier times 2 raised to one less than the
         current retry number.
@@ -15,4 +19,4 @@ class ExponentialBackoff(BackoffStrategy):
         number of retries, then we want to use the max number of retries.
         This can happen if the strategy is configured to run indefinitely.
         """
-        sleep(self.multiplier * 2**(min(self.retry_num, self.max_retry)-1))
+        return self.multiplier * 2**(min(self.retry_num, self.max_retry)-1)
@@ -1,11 +1,15 @@
-from time import sleep
+from nio.util.clock import sleep
 from nio.block.mixins.retry.strategy import BackoffStrategy
 
 
 class LinearBackoff(BackoffStrategy):
 
     def wait_for_retry(self):
-        """Sleep a certain number of seconds before we do the retry.
+        """Sleep a certain number of seconds before we do the retry."""
+        sleep(self.get_retry_delay())
+
+    def next_retry_delay(self):
+        """Number of seconds to wait before the next retry.
 
         We will wait the current retry number times the multiplier,
         so first retry will be 1*mult, second will be 2*mult, etc.
@@ -14,4 +18,4 @@ class LinearBackoff(BackoffStrategy):
         number of retries, then we want to use the max number of retries.
         This can happen if the strategy is configured to run indefinitely.
         """
-        sleep(min(self.retry_num, self.max_retry) * self.multiplier)
+        return min(self.retry_num, self.max_retry) * self.multiplier
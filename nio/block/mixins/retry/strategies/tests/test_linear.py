@@ -91,3 +91,19 @@ class TestLinearBackoff(NIOTestCase):
             strat.request_failed(Exception())
             self.assertFalse(strat.should_retry())
             sleep.assert_not_called()
+
+    def test_jitter(self):
+        """Test that jitter waits a random time up to the retry delay"""
+        strat = LinearBackoff(
+            logger=get_nio_logger('LinearTest'),
+            max_retry=5,
+            multiplier=2,
+            jitter=True
+        )
+        strat.request_failed(Exception())
+        strat.request_failed(Exception())
+        self.assertEqual(strat.next_retry_delay(), 4)
+        with patch('nio.block.mixins.retry.strategy.uniform',
+                   return_value=1.5) as uniform:
+            self.assert_next_retry_sleeps_for(strat, 1.5)
+            uniform.assert_called_once_with(0, 6)
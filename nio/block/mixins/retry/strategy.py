@@ -1,7 +1,10 @@
+from random import uniform
+
+
 class BackoffStrategy(object):
 
     def __init__(self, logger=None, max_retry=0, multiplier=1,
-                 indefinite=False, **kwargs):
+                 indefinite=False, jitter=False, **kwargs):
         """ Create an instance of a backoff strategy
 
         Args:
@@ -17,12 +20,16 @@ class BackoffStrategy(object):
                 to sleep for 7.5 seconds instead.
             indefinite (bool): Whether to continue on retrying indefinitely
                 once the max duration is reached
+            jitter (bool): Whether to wait a random amount of time between
+                zero and the retry delay instead (full jitter), which keeps
+                many clients from retrying at the same time
         """
         super().__init__()
         self.logger = logger
         self.max_retry = max_retry
         self.multiplier = multiplier
         self.indefinite = indefinite
+        self.jitter = jitter
         self.retry_num = 0
 
     def request_failed(self, exc):
@@ -72,6 +79,30 @@ class BackoffStrategy(object):
         """
         pass
 
+    def next_retry_delay(self):
+        """ Number of seconds to wait before the next retry.
+
+        Strategies should override this method for retries that do not wait
+        in wait_for_retry, see Retry.execute_with_retry_async, which refuses
+        strategies overriding wait_for_retry but not this method.
+
+        Returns:
+            float: seconds to wait, not counting any jitter
+        """
+        return 0
+
+    def get_retry_delay(self):
+        """ Number of seconds to wait before the next retry, with jitter
+
+        Returns:
+            float: next_retry_delay, or a random number of seconds between
+                zero and it when using jitter
+        """
+        delay = self.next_retry_delay()
+        if self.jitter:
+            return uniform(0, delay)
+        return delay
+
     def use_logger(self, logger):
         """Use a logger instance in this backoff strategy.
 
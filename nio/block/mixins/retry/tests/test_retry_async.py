@@ -0,0 +1,127 @@
+from threading import Event
+from unittest.mock import MagicMock
+from nio.block.base import Block
+from nio.testing.block_test_case import NIOBlockTestCase
+from nio.block.mixins.retry.retry import Retry
+from nio.block.mixins.retry.strategy import BackoffStrategy
+
+
+class DelayBackoffStrategy(BackoffStrategy):
+    """ A backoff strategy that retries after a fixed delay """
+
+    def __init__(self, delay, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._delay = delay
+
+    def next_retry_delay(self):
+        return self._delay
+
+    def wait_for_retry(self):
+        raise AssertionError("retries should not wait")
+
+
+class RetryingBlock(Retry, Block):
+
+    def __init__(self, delay=0, max_retry=5):
+        super().__init__()
+        self._delay = delay
+        self._max_retry = max_retry
+        self.before_retry = MagicMock()
+
+    def setup_backoff_strategy(self):
+        self.use_backoff_strategy(
+            DelayBackoffStrategy, self._delay, max_retry=self._max_retry)
+
+
+class TestRetryAsync(NIOBlockTestCase):
+
+    def test_retries(self):
+        """Failed executions are retried until they succeed"""
+        block = RetryingBlock()
+        self.configure_block(block, {})
+        target_func = MagicMock(side_effect=[Exception, Exception, 5])
+        future = block.execute_with_retry_async(target_func, "arg", key="val")
+        self.assertEqual(future.result(1), 5)
+        self.assertEqual(target_func.call_count, 3)
+        target_func.assert_called_with("arg", key="val")
+        self.assertEqual(block.before_retry.call_count, 2)
+        block.before_retry.assert_called_with("arg", key="val")
+        self.assertEqual(block._async_retries, set())
+
+    def test_first_execution(self):
+        """Successful executions resolve the future right away"""
+        block = RetryingBlock()
+        self.configure_block(block, {})
+        callback = MagicMock()
+        future = block.execute_with_retry_async(MagicMock(return_value=3))
+        self.assertTrue(future.done())
+        future.add_done_callback(callback)
+        callback.assert_called_once_with(future)
+        self.assertEqual(future.result(), 3)
+
+    def test_out_of_retries(self):
+        """The future holds the exception once retrying stops"""
+        block = RetryingBlock(max_retry=1)
+        self.configure_block(block, {})
+        target_func = MagicMock(side_effect=[Exception, ValueError])
+        future = block.execute_with_retry_async(target_func)
+        self.assertIsInstance(future.exception(1), ValueError)
+        self.assertEqual(target_func.call_count, 2)
+
+    def test_returns_while_waiting(self):
+        """Waiting for a retry holds no thread and can be cancelled"""
+        block = RetryingBlock(delay=10)
+        self.configure_block(block, {})
+        target_func = MagicMock(side_effect=Exception)
+        future = block.execute_with_retry_async(target_func)
+        self.assertFalse(future.done())
+        self.assertEqual(block._async_retries, {future})
+        self.assertTrue(future.cancel())
+        self.assertEqual(target_func.call_count, 1)
+        self.assertEqual(block._async_retries, set())
+
+    def test_stop_cancels(self):
+        """Stopping the block cancels pending retries"""
+        block = RetryingBlock(delay=10)
+        self.configure_block(block, {})
+        block.start()
+        future = block.execute_with_retry_async(
+            MagicMock(side_effect=Exception))
+        block.stop()
+        self.assertTrue(future.cancelled())
+
+    def test_stop_retry_event(self):
+        """Setting the stop retry event cancels pending retries"""
+        block = RetryingBlock(delay=0.1)
+        self.configure_block(block, {})
+        stop_event = Event()
+        target_func = MagicMock(side_effect=Exception)
+        future = block.execute_with_retry_async(
+            target_func, stop_retry_event=stop_event)
+        done = Event()
+        future.add_done_callback(lambda _: done.set())
+        stop_event.set()
+        # the scheduled retry finds the event set and stops retrying
+        self.assertTrue(done.wait(1))
+        self.assertTrue(future.cancelled())
+        self.assertEqual(target_func.call_count, 1)
+        with self.assertRaises(TypeError):
+            block.execute_with_retry_async(
+                target_func, stop_retry_event="not an event")
+
+    def test_strategy_without_delay(self):
+        """Strategies that only wait in wait_for_retry are refused"""
+
+        class WaitingBackoffStrategy(BackoffStrategy):
+
+            def wait_for_retry(self):
+                pass
+
+        block = RetryingBlock()
+        block.setup_backoff_strategy = lambda: block.use_backoff_strategy(
+            WaitingBackoffStrategy)
+        self.configure_block(block, {})
+        target_func = MagicMock()
+        with self.assertRaises(TypeError):
+            block.execute_with_retry_async(target_func)
+        target_func.assert_not_called()
@@ -0,0 +1,150 @@
+from unittest.mock import MagicMock, patch
+from nio.block.base import Block
+from nio.testing.block_test_case import NIOBlockTestCase
+from nio.block.mixins.retry.circuit_breaker import CircuitBreaker, \
+    CircuitOpen, CircuitState
+from nio.block.mixins.retry.retry import Retry
+from nio.block.mixins.retry.retry_budget import RetryBudget
+from nio.block.mixins.retry.strategy import BackoffStrategy
+
+
+class NoWaitBackoffStrategy(BackoffStrategy):
+
+    def wait_for_retry(self):
+        pass
+
+    def next_retry_delay(self):
+        return 0
+
+
+class RetryingBlock(Retry, Block):
+
+    def setup_backoff_strategy(self):
+        self.use_backoff_strategy(NoWaitBackoffStrategy, max_retry=5)
+
+
+class TestCircuitBreaker(NIOBlockTestCase):
+
+    @patch("nio.block.mixins.retry.circuit_breaker.monotonic")
+    def test_states(self, monotonic):
+        """The circuit opens on failures and closes after a trial"""
+        monotonic.return_value = 0
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+        self.assertTrue(breaker.allow_request())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.closed)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.open)
+        self.assertFalse(breaker.allow_request())
+        # the reset timeout lets one trial request through
+        monotonic.return_value = 10
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.state, CircuitState.half_open)
+        self.assertFalse(breaker.allow_request())
+        # a failed trial opens the circuit right away
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.open)
+        self.assertFalse(breaker.allow_request())
+        monotonic.return_value = 20
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CircuitState.closed)
+        # failures are counted again from scratch
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitState.closed)
+
+    def test_shared_by_name(self):
+        """Circuit breakers are shared by resource name"""
+        breaker = CircuitBreaker.get("test_shared_breaker", 3)
+        self.assertIs(CircuitBreaker.get("test_shared_breaker", 5), breaker)
+        self.assertEqual(breaker.failure_threshold, 3)
+        self.assertIsNot(CircuitBreaker.get("test_other_breaker"), breaker)
+
+    def test_fails_fast(self):
+        """An open circuit fails without executing the method"""
+        block = RetryingBlock()
+        self.configure_block(block, {
+            "retry_options": {"failure_threshold": 2, "max_retry": 5}})
+        execute_method = MagicMock(side_effect=Exception)
+        with self.assertRaises(CircuitOpen):
+            block.execute_with_retry(execute_method)
+        # the circuit opened after the second attempt, no more were made
+        self.assertEqual(execute_method.call_count, 2)
+        with self.assertRaises(CircuitOpen):
+            block.execute_with_retry(execute_method)
+        self.assertEqual(execute_method.call_count, 2)
+
+    def test_fails_fast_async(self):
+        """An open circuit fails asynchronous retries right away"""
+        block = RetryingBlock()
+        self.configure_block(block, {
+            "retry_options": {"failure_threshold": 1}})
+        block.use_circuit_breaker(CircuitBreaker(1))
+        execute_method = MagicMock(side_effect=Exception)
+        with self.assertRaises(Exception):
+            block.execute_with_retry(execute_method)
+        future = block.execute_with_retry_async(execute_method)
+        self.assertIsInstance(future.exception(1), CircuitOpen)
+        self.assertEqual(execute_method.call_count, 1)
+
+    def test_shared_by_blocks(self):
+        """Blocks using the same resource share the circuit breaker"""
+        block1 = RetryingBlock()
+        block2 = RetryingBlock()
+        options = {"retry_options": {
+            "resource": "test_shared_by_blocks", "failure_threshold": 1}}
+        self.configure_block(block1, options)
+        self.configure_block(block2, options)
+        with self.assertRaises(CircuitOpen):
+            block1.execute_with_retry(MagicMock(side_effect=Exception))
+        execute_method = MagicMock()
+        with self.assertRaises(CircuitOpen):
+            block2.execute_with_retry(execute_method)
+        execute_method.assert_not_called()
+
+
+class TestRetryBudget(NIOBlockTestCase):
+
+    @patch("nio.block.mixins.retry.retry_budget.monotonic")
+    def test_token_bucket(self, monotonic):
+        """Tokens are taken per retry and refilled over time"""
+        monotonic.return_value = 0
+        budget = RetryBudget(rate=2, capacity=3)
+        for _ in range(3):
+            self.assertTrue(budget.acquire())
+        self.assertFalse(budget.acquire())
+        monotonic.return_value = 0.5
+        self.assertTrue(budget.acquire())
+        self.assertFalse(budget.acquire())
+        # the bucket never holds more than its capacity
+        monotonic.return_value = 100
+        for _ in range(3):
+            self.assertTrue(budget.acquire())
+        self.assertFalse(budget.acquire())
+
+    def test_bounds_retries(self):
+        """Retrying stops once the budget is exhausted"""
+        block = RetryingBlock()
+        self.configure_block(block, {"retry_options": {
+            "resource": "test_bounds_retries", "retry_rate": 0.001,
+            "retry_burst": 3}})
+        execute_method = MagicMock(side_effect=Exception)
+        with self.assertRaises(Exception):
+            block.execute_with_retry(execute_method)
+        # the first attempt plus the 3 retries in the budget
+        self.assertEqual(execute_method.call_count, 4)
+        # another block using the same resource has no retries left
+        other_block = RetryingBlock()
+        self.configure_block(other_block, {"retry_options": {
+            "resource": "test_bounds_retries", "retry_rate": 0.001,
+            "retry_burst": 3}})
+        with self.assertRaises(Exception):
+            other_block.execute_with_retry(execute_method)
+        self.assertEqual(execute_method.call_count, 5)
+
+    def test_disabled_by_default(self):
+        """Neither a circuit breaker nor a retry budget is used by default"""
+        block = RetryingBlock()
+        self.configure_block(block, {})
+        self.assertIsNone(block._circuit_breaker)
+        self.assertIsNone(block._retry_budget)
@@ -2,6 +2,8 @@
     NIO Command Holder class
 
 """
+from copy import deepcopy
+
 from nio.command.base import Command, InvalidCommandArg
 
 
@@ -70,16 +72,24 @@ class CommandHolder(object):
 
         This is useful in serialization/deserialization.
 
+        Once this method is called, it assumes no new command definitions
+        are added to the class. A copy of the cached description is
+        returned.
+
         Returns:
             description (dict): a dictionary containing both property and
                 command data.
 
         """
-        class_commands = cls.get_commands()
-        commands = {}
-        for c in class_commands:
-            commands[c] = class_commands[c].get_description()
-        return commands
+        commands_attr = "{0}_commands_description".format(cls.__name__)
+        if not hasattr(cls, commands_attr):
+            class_commands = cls.get_commands()
+            commands = {}
+            for c in class_commands:
+                commands[c] = class_commands[c].get_description()
+
+            setattr(cls, commands_attr, commands)
+        return deepcopy(getattr(cls, commands_attr))
 
     def invoke(self, id, args):
         """ Call the instance method 'id' with the specified arguments.
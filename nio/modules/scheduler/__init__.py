@@ -1 +1 @@
-from nio.modules.scheduler.job import Job
+from nio.modules.scheduler.job import Job, OverrunPolicy
@@ -1,11 +1,32 @@
+from enum import Enum
+
 from nio.modules.proxy import ModuleProxy
 
 
+class OverrunPolicy(Enum):
+
+    """ What to do when a repeatable job is due while it is still running
+
+    skip: the run is skipped
+    queue_one: the run starts once the running one finishes, further runs
+        due meanwhile are skipped
+    allow_concurrent: the run starts, running along with the previous one
+    delay_next: runs are scheduled an interval after the previous run
+        finishes instead of an interval after it was due, so they never
+        overlap
+    """
+    skip = "skip"
+    queue_one = "queue-one"
+    allow_concurrent = "allow-concurrent"
+    delay_next = "delay-next"
+
+
 class Job(ModuleProxy):
 
     """A scheduled job in the scheduler module """
 
-    def __init__(self, target, delta, repeatable, *args, **kwargs):
+    def __init__(self, target, delta, repeatable, *args,
+                 overrun_policy=OverrunPolicy.allow_concurrent, **kwargs):
         """ Create a new job instance.
 
         Args:
@@ -17,9 +38,16 @@ class Job(ModuleProxy):
                 Otherwise, it is run repeatedly at an interval defined by
                 'delta'.
             args: Positional arguments to be passed to 'target'.
+            overrun_policy (OverrunPolicy): What to do when a repeatable job
+                is due while still running.
             kwargs: Keyword arguments to be passed to 'target'.
 
         """
+        # only forward a non default policy so that implementations not
+        # aware of overrun policies keep working with the default one
+        if OverrunPolicy(overrun_policy) is not \
+                OverrunPolicy.allow_concurrent:
+            kwargs["overrun_policy"] = overrun_policy
         super().__init__(target, delta, repeatable, *args, **kwargs)
 
     def cancel(self):
@@ -27,3 +55,14 @@ class Job(ModuleProxy):
 
         """
         raise NotImplementedError()
+
+    def metrics(self):
+        """ Get the metrics of this task.
+
+        Returns:
+            dict: start lateness and run time histograms of the task runs
+                and number of skipped, queued and overlapping runs, None if
+                the task is no longer scheduled
+
+        """
+        raise NotImplementedError()
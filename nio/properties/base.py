@@ -1,5 +1,4 @@
 import re
-from weakref import WeakKeyDictionary
 
 from nio.properties.exceptions import AllowNoneViolation
 from nio.properties.util.property_value import PropertyValue
@@ -43,20 +42,40 @@ class BaseProperty(object):
         self._cached_default = None
         self._default_property_value = PropertyValue(self, self._default)
 
-        # Set up a values dictionary to keep track of values per instance
-        # We want a WeakKeyDict so that instances aren't kept in memory
-        # based on this property
-        self._values = WeakKeyDictionary()
-
-        # Description needs to be serializble so save type as __name__
-        self.description = dict(type=_type.__name__,
-                                title=title,
-                                advanced=advanced,
-                                order=order,
-                                visible=visible,
-                                allow_none=allow_none,
-                                default=default,
-                                **kwargs)
+        # Values are kept in each instance's own __dict__. Until the property
+        # learns its attribute name (see __set_name__) use a key that is
+        # unique to this property
+        self._name = "_property_{}".format(id(self))
+
+        # The description is built the first time it is requested, keep
+        # the definition arguments around until then
+        self._description = None
+        self._description_kwargs = dict(title=title,
+                                        advanced=advanced,
+                                        order=order,
+                                        visible=visible,
+                                        allow_none=allow_none,
+                                        default=default,
+                                        **kwargs)
+
+    def __set_name__(self, owner, name):
+        """ Key instance values by the attribute name of this property """
+        self._name = name
+
+    @property
+    def description(self):
+        """ Property settings, built on first access and then cached """
+        if self._description is None:
+            self._description = self._build_description()
+        return self._description
+
+    def _build_description(self):
+        """ Description needs to be serializable so save type as __name__
+
+        Properties adding their own description entries override this method
+        and update the dictionary returned by their parent.
+        """
+        return dict(type=self.type.__name__, **self._description_kwargs)
 
     @property
     def default(self):
@@ -84,7 +103,10 @@ class BaseProperty(object):
             and allow_none is False.
 
         """
-        return self._values.get(instance, self._default_property_value)
+        if instance is None or isinstance(instance, type):
+            # Class level access, there is no instance storage to look into
+            return self._default_property_value
+        return instance.__dict__.get(self._name, self._default_property_value)
 
     def __set__(self, instance, value):
         """ Save the value as a PropertyValue
@@ -92,8 +114,12 @@ class BaseProperty(object):
         Overriding __set__ and __get__ so values can be saved and retrieved
         as callable PropertyValues instead of the raw value.
 
+        The PropertyValue is kept in the instance's own __dict__ under the
+        property name, since this property is a data descriptor it still
+        takes precedence over that entry on attribute lookups.
+
         """
-        self._values[instance] = PropertyValue(self, value)
+        instance.__dict__[self._name] = PropertyValue(self, value)
 
     def __str__(self):
         return "type is: {}, args are {}".format(self.type, self.kwargs)
@@ -145,14 +171,18 @@ class BaseProperty(object):
 
         """
         if not self.is_expression(value) and not self.is_env_var(value):
-            # Allow property kwargs to be overriden by call to serialize
-            merged_kwargs = self.kwargs.copy()
-            merged_kwargs.update(**kwargs)
-            if value is None and not self.allow_none:
-                raise AllowNoneViolation("Property value None is not allowed")
-            return self.type.deserialize(value, **merged_kwargs)
+            return self._deserialize(value, **kwargs)
         return value
 
+    def _deserialize(self, value, **kwargs):
+        """ Deserialize a value known not to be an expression or env var """
+        # Allow property kwargs to be overriden by call to serialize
+        merged_kwargs = self.kwargs.copy()
+        merged_kwargs.update(**kwargs)
+        if value is None and not self.allow_none:
+            raise AllowNoneViolation("Property value None is not allowed")
+        return self.type.deserialize(value, **merged_kwargs)
+
     def is_expression(self, value):
         """ A property value is an expression if contatins expression syntax
 
@@ -3,6 +3,19 @@ class AllowNoneViolation(Exception):
     pass
 
 
+class InvalidProperties(Exception):
+    """ Raised when validating property dictionaries in bulk fails
+
+    Attributes:
+        errors (dict): for every invalid dictionary, indexed by its position,
+            a dictionary of the exceptions raised, indexed by property name
+    """
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
 class NoClassVersion(Exception):
     pass
 
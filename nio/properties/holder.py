@@ -1,6 +1,8 @@
+from copy import deepcopy
+
 from nio.properties.base import BaseProperty
 from nio.properties.exceptions import NoClassVersion, NoInstanceVersion, \
-    OlderThanMinVersion
+    OlderThanMinVersion, InvalidProperties
 from nio.util.versioning.check import compare_versions, \
     VersionCheckResult, InvalidVersionFormat, is_version_valid, \
     get_major_version
@@ -77,16 +79,53 @@ class PropertyHolder(object):
             TypeError: Property value is invalid
 
         """
-        class_properties = cls.get_class_properties()
-        for (property_name, prop) in class_properties.items():
-            if property_name in properties:
-                value = properties[property_name]
-                # Deserialize to check for AllowNoneViolation and TypeError
-                prop.deserialize(value)
-                # Return the serialized version of the input dictionary
-                serialized_value = prop.type.serialize(value, **prop.kwargs)
-                properties[property_name] = serialized_value
-        return properties
+        return cls.get_validator().validate(properties)
+
+    @classmethod
+    def validate_many(cls, properties_list):
+        """ Validate many property dictionaries at once.
+
+        Every dictionary is fully validated, as in validate_dict valid values
+        are serialized in place.
+
+        Args:
+            properties_list (list): property dictionaries to validate
+
+        Returns:
+            properties_list (list): validated and serialized
+
+        Raises:
+            InvalidProperties: At least one property value is invalid, the
+                exception holds all errors found
+
+        """
+        validator = cls.get_validator()
+        errors = {}
+        for (index, properties) in enumerate(properties_list):
+            properties_errors = validator.get_errors(properties)
+            if properties_errors:
+                errors[index] = properties_errors
+        if errors:
+            raise InvalidProperties(errors)
+        return properties_list
+
+    @classmethod
+    def get_validator(cls):
+        """ Provide a validator for property dictionaries of this class.
+
+        The validator is compiled from the class properties the first time it
+        is requested and cached on the class.
+
+        Returns:
+            PropertyValidator: validator for this class
+
+        """
+        class_attribute = "{0}_validator".format(cls.__name__)
+        if not hasattr(cls, class_attribute):
+            from nio.properties.util.validator import PropertyValidator
+            # cache validator
+            setattr(cls, class_attribute, PropertyValidator(cls))
+        return getattr(cls, class_attribute)
 
     def from_dict(self, properties, logger=None):
         """ Load properties from the specified dict into the instance.
@@ -116,6 +155,10 @@ class PropertyHolder(object):
     def get_description(cls):
         """ Provide the instance properties.
 
+        The description is built the first time it is requested and cached
+        on the class, it assumes no new properties are added to the class
+        after that. A copy of the cached description is returned.
+
         Args:
             None
 
@@ -123,13 +166,19 @@ class PropertyHolder(object):
             Instance description as a dictionary of properties
 
         """
-        class_properties = cls.get_class_properties()
-        descriptions = {property_name: prop.description
-                        for (property_name, prop) in class_properties.items()}
-        if hasattr(cls, "__version__") and "version" not in descriptions:
-            descriptions["version"] = cls.__version__
+        class_attribute = "{0}_properties_description".format(cls.__name__)
+        if not hasattr(cls, class_attribute):
+            class_properties = cls.get_class_properties()
+            descriptions = {
+                property_name: prop.description
+                for (property_name, prop) in class_properties.items()}
+            if hasattr(cls, "__version__") and "version" not in descriptions:
+                descriptions["version"] = cls.__version__
 
-        return descriptions
+            # cache description
+            setattr(cls, class_attribute, descriptions)
+        # callers are free to modify the description they get
+        return deepcopy(getattr(cls, class_attribute))
 
     @classmethod
     def get_defaults(cls):
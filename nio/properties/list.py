@@ -29,7 +29,11 @@ class ListProperty(BaseProperty):
             raise TypeError("Specified list object type must be a "
                             "PropertyHolder or a nio Type")
         super().__init__(ListType, **kwargs)
-        self.description.update(self._get_description(**kwargs))
+
+    def _build_description(self):
+        description = super()._build_description()
+        description.update(self._get_description(**self._description_kwargs))
+        return description
 
     def _get_description(self, **kwargs):
         """ Description needs to be json serializable """
@@ -44,7 +48,7 @@ class ListProperty(BaseProperty):
         # add internal object description
         if "obj_type" in self.kwargs:
             # get description from PropertyHolder
-            sub_description = self.kwargs["obj_type"]().get_description()
+            sub_description = self.kwargs["obj_type"].get_description()
         else:
             # get class name from nio Type
             sub_description = self.kwargs["list_obj_type"].__name__
@@ -53,7 +57,9 @@ class ListProperty(BaseProperty):
     def _prepare_default(self, **kwargs):
         """ default in description should be serializable """
         serializable_defaults = []
-        defaults = kwargs.get('default', [])
+        defaults = kwargs.get('default')
+        if defaults is None:
+            defaults = []
         if self.is_expression(defaults) or self.is_env_var(defaults):
             # Don't mess with default if it's an expression or env var
             return {"default": defaults}
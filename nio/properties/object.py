@@ -32,7 +32,11 @@ class ObjectProperty(BaseProperty):
             kwargs['default'] = obj_type()
 
         super().__init__(ObjectType, **kwargs)
-        self.description.update(self._get_description(**kwargs))
+
+    def _build_description(self):
+        description = super()._build_description()
+        description.update(self._get_description(**self._description_kwargs))
+        return description
 
     def _get_description(self, **kwargs):
         """ Description needs to be json serializable """
@@ -43,7 +47,7 @@ class ObjectProperty(BaseProperty):
 
     def _prepare_template(self, **kwargs):
         # add object description
-        return {"template": self.kwargs["obj_type"]().get_description()}
+        return {"template": self.kwargs["obj_type"].get_description()}
 
     def _prepare_default(self, **kwargs):
         """ default in description should be serializable """
@@ -9,7 +9,11 @@ class SelectProperty(BaseProperty):
     def __init__(self, enum, **kwargs):
         kwargs['enum'] = enum
         super().__init__(SelectType, **kwargs)
-        self.description.update(self._get_description(**kwargs))
+
+    def _build_description(self):
+        description = super()._build_description()
+        description.update(self._get_description(**self._description_kwargs))
+        return description
 
     def _get_description(self, **kwargs):
         """ Description needs to be json serializable """
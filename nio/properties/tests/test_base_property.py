@@ -9,32 +9,28 @@ from nio.testing.test_case import NIOTestCaseNoModules
 class TestBaseProperty(NIOTestCaseNoModules):
 
     def test_set(self):
-        """Set a value and store a PropertyValue in Base._values."""
+        """Set a value and store a PropertyValue in the instance."""
         mocked_instance = MagicMock()
         property = BaseProperty(Type, title="property")
-        # Initially, _values is empty
-        self.assertEqual(len(property._values), 0)
+        # Initially, the instance holds no value for the property
+        self.assertNotIn(property._name, mocked_instance.__dict__)
         set_values = ["", "string", 1, {}, []]
         for set_value in set_values:
             property.__set__(mocked_instance, set_value)
-            self.assertEqual(len(property._values), 1)
             self.assertIsInstance(
-                property._values[mocked_instance], PropertyValue)
+                mocked_instance.__dict__[property._name], PropertyValue)
             self.assertEqual(
-                property._values[mocked_instance].value, set_value)
+                mocked_instance.__dict__[property._name].value, set_value)
 
     def test_get(self):
-        """Get the PropertyValue from Base._values for the given instance."""
+        """Get the PropertyValue stored in the given instance."""
         mocked_instance = MagicMock()
         mocked_property_value = MagicMock(spec=PropertyValue)
         property = BaseProperty(Type, title="property")
-        # Pre-populate _values with a value for this instance
-        property._values[mocked_instance] = mocked_property_value
-        self.assertEqual(len(property._values), 1)
+        # Pre-populate the instance with a value for this property
+        mocked_instance.__dict__[property._name] = mocked_property_value
         # The property value is the mocked one that was set
         property_value = property.__get__(mocked_instance, MagicMock())
-        self.assertEqual(len(property._values), 1)
-        self.assertIsInstance(property._values[mocked_instance], PropertyValue)
         self.assertEqual(property_value, mocked_property_value)
 
     def test_get_default(self):
@@ -42,13 +38,26 @@ class TestBaseProperty(NIOTestCaseNoModules):
         mocked_instance = MagicMock()
         default_value = MagicMock()
         property = BaseProperty(Type, title="property", default=default_value)
-        self.assertEqual(len(property._values), 0)
         # The property value's value is the property default value
         property_value = property.__get__(mocked_instance, MagicMock())
-        self.assertEqual(len(property._values), 0)
+        self.assertNotIn(property._name, mocked_instance.__dict__)
         self.assertIsInstance(property_value, PropertyValue)
         self.assertEqual(property_value.value, default_value)
 
+    def test_values_are_per_instance(self):
+        """Values live in each instance, keyed by the property name."""
+        class Holder(object):
+            prop = BaseProperty(Type, title="property", default="default")
+
+        holder1 = Holder()
+        holder2 = Holder()
+        holder1.prop = "value"
+        self.assertEqual(holder1.__dict__["prop"].value, "value")
+        self.assertEqual(holder1.prop(), "value")
+        self.assertEqual(holder2.prop(), "default")
+        # class level access returns the default
+        self.assertEqual(Holder.prop.value, "default")
+
     def test_set_and_get_value(self):
         """Test the whole set, get, and call process."""
         mocked_instance = MagicMock()
@@ -89,7 +98,7 @@ class TestBaseProperty(NIOTestCaseNoModules):
         property = BaseProperty(Type, title="property")
         property.is_expression = MagicMock(return_value=False)
         property.is_env_var = MagicMock(return_value=False)
-        property._values[mocked_instance] = MagicMock()
+        mocked_instance.__dict__[property._name] = MagicMock()
         with patch('nio.types.Type.serialize',
                    return_value=mocked_serialized_value):
             serialized_value = property.serialize(mocked_instance)
@@ -113,7 +122,7 @@ class TestBaseProperty(NIOTestCaseNoModules):
         property.is_expression = MagicMock(return_value=True)
         property.is_env_var = MagicMock(return_value=False)
         mocked_property_value = MagicMock()
-        property._values[mocked_instance] = mocked_property_value
+        mocked_instance.__dict__[property._name] = mocked_property_value
         with patch('nio.types.Type.serialize',
                    return_value=mocked_serialized_value):
             serialized_value = property.serialize(mocked_instance)
@@ -127,7 +136,7 @@ class TestBaseProperty(NIOTestCaseNoModules):
         property.is_expression = MagicMock(return_value=False)
         property.is_env_var = MagicMock(return_value=True)
         mocked_property_value = MagicMock()
-        property._values[mocked_instance] = mocked_property_value
+        mocked_instance.__dict__[property._name] = mocked_property_value
         with patch('nio.types.Type.serialize',
                    return_value=mocked_serialized_value):
             serialized_value = property.serialize(mocked_instance)
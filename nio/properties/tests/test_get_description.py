@@ -1,4 +1,6 @@
-from nio.properties import PropertyHolder
+from unittest.mock import patch
+
+from nio.properties import PropertyHolder, ObjectProperty, ListProperty
 from nio.properties import StringProperty
 from nio.testing.test_case import NIOTestCaseNoModules
 
@@ -34,3 +36,33 @@ class TestDefaults(NIOTestCaseNoModules):
         self.assertIn("version", with_version_as_property)
         self.assertNotEqual(with_version_as_property["version"],
                             "version_in_class")
+
+    def test_description_is_cached(self):
+        """Descriptions are built once per class."""
+        description = ClassWithVersion.get_description()
+        with patch.object(ClassWithVersion, "get_class_properties") as \
+                get_class_properties:
+            self.assertEqual(ClassWithVersion.get_description(), description)
+            self.assertEqual(get_class_properties.call_count, 0)
+        # changes to a description are not kept in the cache
+        description["version"] = None
+        description["string_property"]["default"] = None
+        self.assertNotEqual(ClassWithVersion.get_description(), description)
+        # a class with the same properties still gets its own description
+        self.assertEqual(
+            ClassWithoutVersion.get_description()["string_property"][
+                "default"], "ClassWithoutVersion")
+
+    def test_template_built_lazily(self):
+        """Object templates are not described when the class is defined."""
+        with patch.object(ClassWithVersion, "get_description",
+                          return_value={}) as get_description:
+            class ContainerClass(PropertyHolder):
+                object_property = ObjectProperty(ClassWithVersion,
+                                                 title="object_property")
+                list_property = ListProperty(ClassWithVersion,
+                                             title="list_property")
+
+            self.assertEqual(get_description.call_count, 0)
+            ContainerClass.get_description()
+            self.assertEqual(get_description.call_count, 2)
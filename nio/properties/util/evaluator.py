@@ -1,4 +1,6 @@
 import re
+from keyword import iskeyword
+from operator import attrgetter
 
 from nio.properties.exceptions import InvalidEvaluationCall
 from nio.properties.util.parser import Parser
@@ -31,14 +33,28 @@ class Evaluator:
 
     """
     delimiter = re.compile(r'(?<!\\)({{|}})|(\s)')
+    # an expression that only reads a signal attribute, e.g. {{ $a.b }}
+    attribute_access = re.compile(
+        r'{{\s*\$\.?([_A-Za-z][_A-Za-z0-9]*(\.[_A-Za-z][_A-Za-z0-9]*)*)\s*}}')
     expression_cache = {}
 
     def __init__(self, expression):
         self.expression = expression
+        # Resolved on first evaluation, False when the expression is not a
+        # plain attribute access
+        self._attribute_getter = None
 
     def evaluate(self, signal=None):
         if not isinstance(self.expression, str):
             return self.expression
+        if self._attribute_getter is None:
+            self._attribute_getter = \
+                self._get_attribute_getter(self.expression) or False
+        if self._attribute_getter:
+            # Plain attribute reads skip the general evaluation
+            if signal is None:
+                raise InvalidEvaluationCall
+            return self._attribute_getter(signal)
         cache_key = (self.expression)
         parsed = self.__class__.expression_cache.get(cache_key, None)
         if parsed is None:
@@ -77,6 +93,26 @@ class Evaluator:
             result.append(item)
         return result
 
+    def _get_attribute_getter(self, expression):
+        """ Build a direct accessor if expression is an attribute access
+
+        Matches expressions such as "{{ $field }}", "{{ $.field }}" or
+        "{{ $a.b }}", a missing attribute raises AttributeError just as
+        evaluating the expression would.
+
+        Returns:
+            callable: accessor taking the signal, or None when the expression
+                needs the general evaluation
+        """
+        match = self.attribute_access.fullmatch(expression)
+        if match is None:
+            return None
+        path = match.group(1)
+        # attributes named after keywords are a syntax error when evaluated
+        if any(iskeyword(name) for name in path.split('.')[1:]):
+            return None
+        return attrgetter(path)
+
     def tokenize(self, expression):
         """ Pad the delimiters with whitespace and split the expression. """
         tokens = self.delimiter.split(expression)
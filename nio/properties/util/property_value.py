@@ -12,14 +12,27 @@ class PropertyValue:
     """
 
     def __init__(self, property, value=None):
+        from nio.properties.base import BaseProperty
         self._property = property
         self.value = value
         self.evaluator = Evaluator(str(value))
+        # Values are classified below, skip checking again when deserializing
+        # unless the property brings its own deserialization
+        self._custom_deserialize = \
+            type(property).deserialize is not BaseProperty.deserialize
+        if self._custom_deserialize:
+            self._deserialize = property.deserialize
+        else:
+            self._deserialize = property._deserialize
+        # Classify the value once instead of on every call
+        self._is_expression = property.is_expression(value)
+        self._is_env_var = \
+            not self._is_expression and property.is_env_var(value)
 
     def __call__(self, signal=None):
         """ Return value, evaluated if it is an expression """
         from nio.properties import PropertyHolder
-        if self._property.is_expression(self.value):
+        if self._is_expression:
             # Expression properties need to be evaluated
             value = self.evaluator.evaluate(signal)
             if value is None:
@@ -31,14 +44,44 @@ class PropertyValue:
             else:
                 # Deserialize should not be called with None
                 return self._property.deserialize(value)
+        elif self._is_env_var and not self._custom_deserialize:
+            # Environment variables are returned as they are, resolving them
+            # is left to the host
+            return self.value
         elif self.value is not None and isinstance(self.value, PropertyHolder):
             # Return property holders as they are
             return self.value
         elif self.value is not None:
             # Deserialize properties
-            return self._property.deserialize(self.value)
+            return self._deserialize(self.value)
         elif self.value is None and self._property.allow_none:
             # Return None if it is allowed
             return None
         else:
             raise AllowNoneViolation("Property value None is not allowed")
+
+    def compile(self):
+        """ Build a function returning this value for a signal
+
+        The function returns the same as calling the PropertyValue, skipping
+        the checks that can be done once: constant values are returned as they
+        are and expressions of untyped properties are evaluated directly.
+
+        Returns:
+            callable: function taking an optional signal
+        """
+        from nio.properties.base import BaseProperty
+        from nio.types.base import Type
+        if self._is_expression:
+            if self._property.allow_none and self._property.type is Type and \
+                    type(self._property).deserialize is \
+                    BaseProperty.deserialize:
+                return self.evaluator.evaluate
+        elif self.value is None or \
+                type(self.value) in (str, int, float, bool):
+            try:
+                value = self()
+            except AllowNoneViolation:
+                return self
+            return lambda signal=None: value
+        return self
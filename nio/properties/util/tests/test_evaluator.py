@@ -1,4 +1,6 @@
 import types
+from unittest.mock import patch
+
 from nio.properties.util.evaluator import Evaluator
 from nio.properties.exceptions import InvalidEvaluationCall
 from nio.signal.base import Signal
@@ -77,6 +79,32 @@ class TestEvaluator(NIOTestCaseNoModules):
             with self.assertRaises(Exception):
                 evaluator.evaluate(signal)
 
+    def test_attribute_access(self):
+        """Plain attribute reads bypass the general evaluation."""
+        signal = Signal({"str": "string", "obj": Signal({"int": 42})})
+        expressions = [
+            ("{{ $str }}", "string"),
+            ("{{$str}}", "string"),
+            ("{{ $.str }}", "string"),
+            ("{{ $obj.int }}", 42),
+        ]
+        for expression, expected_result in expressions:
+            evaluator = Evaluator(expression)
+            with patch.object(Evaluator, "_eval") as _eval:
+                self.assertEqual(evaluator.evaluate(signal), expected_result)
+                self.assertEqual(_eval.call_count, 0)
+        # a missing attribute is reported the same way
+        for expression in ["{{ $missing }}", "{{ $obj.missing }}"]:
+            with self.assertRaises(AttributeError):
+                Evaluator(expression).evaluate(signal)
+        # anything else is still evaluated
+        for expression in ["{{ $str }} ", "{{ $str.upper() }}",
+                           "{{ $obj.int + 1 }}", "{{ $ }}"]:
+            evaluator = Evaluator(expression)
+            with patch.object(Evaluator, "_eval", return_value=[]) as _eval:
+                evaluator.evaluate(signal)
+                self.assertEqual(_eval.call_count, 1)
+
     def test_expression_that_is_not_a_string(self):
         """Expressions don't need to be strings.
 
@@ -95,6 +123,7 @@ class TestEvaluator(NIOTestCaseNoModules):
             "{{ $ }}",
             "{{ $not_a_property }}",
             "{{ $.not_a_property }}",
+            "{{ $a.b }}",
         ]
         for expression in expressions:
             evaluator = Evaluator(expression)
@@ -1,6 +1,9 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from nio.properties.exceptions import AllowNoneViolation
 from nio.properties.base import BaseProperty
+from nio.properties.int import IntProperty
+from nio.properties.list import ListProperty
+from nio.properties.string import StringProperty
 from nio.properties.holder import PropertyHolder
 from nio.properties.util.property_value import PropertyValue
 from nio.signal.base import Signal
@@ -63,3 +66,39 @@ class TestPropertyValue(NIOTestCaseNoModules):
         property_value = PropertyValue(property, value=property_holder)
         value = property_value()
         self.assertEqual(value, property_holder)
+
+    def test_env_var(self):
+        """Environment variables are returned as they are, unresolved."""
+        with patch.dict("os.environ", {"HOME": "/root"}):
+            class Holder(PropertyHolder):
+                home = StringProperty(title="home", default="[[HOME]]")
+            self.assertEqual(Holder().home(), "[[HOME]]")
+            property = ListProperty(Type, title="property")
+            property_value = PropertyValue(property, value="[[HOME]]")
+            self.assertEqual(property_value(), "[[HOME]]")
+            property = IntProperty(title="property")
+            property_value = PropertyValue(property, value="[[HOME]]")
+            with patch.object(property, "is_env_var") as is_env_var:
+                self.assertEqual(property_value(), "[[HOME]]")
+                self.assertEqual(property_value.compile()(), "[[HOME]]")
+                # classified once, when the value was created
+                self.assertEqual(is_env_var.call_count, 0)
+
+    def test_compile(self):
+        """Compiled values return the same as calling the value."""
+        untyped = BaseProperty(Type, title="property", allow_none=True)
+        compiled = PropertyValue(untyped, value="{{ $attr }}").compile()
+        self.assertEqual(compiled(Signal({"attr": [1]})), [1])
+        self.assertIsNone(compiled(Signal({"attr": None})))
+        compiled = PropertyValue(untyped, value="constant").compile()
+        self.assertEqual(compiled(Signal()), "constant")
+        self.assertIsNone(PropertyValue(untyped).compile()(Signal()))
+        # typed properties still deserialize expressions
+        typed = IntProperty(title="property")
+        compiled = PropertyValue(typed, value="{{ $attr }}").compile()
+        self.assertEqual(compiled(Signal({"attr": "2"})), 2)
+        self.assertEqual(PropertyValue(typed, value="3").compile()(), 3)
+        # errors are raised when calling the compiled value
+        compiled = PropertyValue(typed, value=None).compile()
+        with self.assertRaises(AllowNoneViolation):
+            compiled()
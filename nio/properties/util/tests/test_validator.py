@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+from nio.properties import PropertyHolder, IntProperty, StringProperty, \
+    ListProperty, ObjectProperty, TimeDeltaProperty, VersionProperty
+from nio.properties.exceptions import AllowNoneViolation, InvalidProperties
+from nio.types import IntType
+from nio.testing.test_case import NIOTestCaseNoModules
+
+
+class Contained(PropertyHolder):
+    int_property = IntProperty(title="int_property", default=1)
+    string_property = StringProperty(title="string_property", default="")
+
+
+class VersionedContained(PropertyHolder):
+    version = VersionProperty("1.0.0")
+
+
+class Container(PropertyHolder):
+    int_property = IntProperty(title="int_property", default=0)
+    string_property = StringProperty(title="string_property", default="",
+                                     allow_none=False)
+    td_property = TimeDeltaProperty(title="td_property",
+                                    default={"seconds": 1})
+    int_list_property = ListProperty(IntType, title="int_list_property",
+                                     default=[])
+    list_property = ListProperty(Contained, title="list_property",
+                                 default=[])
+    object_property = ObjectProperty(Contained, title="object_property")
+    versioned_property = ObjectProperty(VersionedContained,
+                                        title="versioned_property")
+
+
+class TreeNode(PropertyHolder):
+    name = StringProperty(title="name", default="")
+
+
+TreeNode.children = ListProperty(TreeNode, title="children", default=[])
+
+
+class TestPropertyValidator(NIOTestCaseNoModules):
+
+    def test_validator_is_cached(self):
+        """Validators are compiled once per class."""
+        self.assertIs(Container.get_validator(), Container.get_validator())
+        self.assertIsNot(Container.get_validator(), Contained.get_validator())
+
+    def test_primitives_skip_deserialization(self):
+        """Values that are already of the right type are taken as they are."""
+        with patch.object(IntType, "deserialize") as deserialize:
+            validated = Container.validate_dict({
+                "int_property": 3,
+                "int_list_property": [1, 2, 3]})
+            self.assertEqual(deserialize.call_count, 0)
+        self.assertDictEqual(validated, {
+            "int_property": 3,
+            "int_list_property": [1, 2, 3]})
+        # other values still get deserialized
+        self.assertEqual(
+            Container.validate_dict({"int_property": "3"})["int_property"],
+            "3")
+        with self.assertRaises(TypeError):
+            Container.validate_dict({"int_list_property": [1, "two"]})
+
+    def test_serialized_values(self):
+        """Values are replaced with their serialized version."""
+        validated = Container.validate_dict({
+            "td_property": {"seconds": 5},
+            "object_property": Contained(),
+            "list_property": [{"int_property": 2}, Contained()]})
+        self.assertDictEqual(validated["td_property"], {
+            "days": 0, "seconds": 5, "microseconds": 0})
+        self.assertDictEqual(validated["object_property"], {
+            "int_property": 1, "string_property": ""})
+        self.assertEqual(validated["list_property"], [
+            {"int_property": 2},
+            {"int_property": 1, "string_property": ""}])
+
+    def test_expressions_and_env_vars(self):
+        """Expressions and environment variables are kept as they are."""
+        properties = {
+            "int_property": "{{ 1 + 2 }}",
+            "list_property": "{{ $items }}",
+            "object_property": "[[OBJECT]]"}
+        self.assertDictEqual(Container.validate_dict(dict(properties)),
+                             properties)
+
+    def test_nested_errors(self):
+        """Errors in nested objects are reported as a TypeError."""
+        with self.assertRaises(TypeError):
+            Container.validate_dict(
+                {"object_property": {"int_property": "one"}})
+        with self.assertRaises(TypeError):
+            Container.validate_dict(
+                {"list_property": [{"int_property": "one"}]})
+        with self.assertRaises(TypeError):
+            Container.validate_dict({"list_property": {"int_property": 1}})
+        # versions are still checked on nested objects
+        with self.assertRaises(TypeError):
+            Container.validate_dict(
+                {"versioned_property": {"version": "not a version"}})
+        Container.validate_dict({"versioned_property": {"version": "1.2.0"}})
+
+    def test_self_referencing_holder(self):
+        """Holders may contain lists of themselves."""
+        tree = {"name": "root", "children": [
+            {"name": "child", "children": [{"name": "grandchild"}]}]}
+        self.assertDictEqual(TreeNode.validate_dict(tree), tree)
+        with self.assertRaises(TypeError):
+            TreeNode.validate_dict(
+                {"children": [{"children": [{"children": "leaf"}]}]})
+
+    def test_validate_many(self):
+        """All errors of all dictionaries are reported at once."""
+        configs = [
+            {"int_property": 1},
+            {"int_property": "one", "string_property": None},
+            {"td_property": {"seconds": 2}},
+            {"object_property": 5}]
+        with self.assertRaises(InvalidProperties) as context:
+            Container.validate_many(configs)
+        errors = context.exception.errors
+        self.assertEqual(sorted(errors), [1, 3])
+        self.assertEqual(sorted(errors[1]),
+                         ["int_property", "string_property"])
+        self.assertIsInstance(errors[1]["int_property"], TypeError)
+        self.assertIsInstance(errors[1]["string_property"],
+                              AllowNoneViolation)
+        self.assertIsInstance(errors[3]["object_property"], TypeError)
+        # valid dictionaries were still serialized
+        self.assertEqual(configs[2]["td_property"]["microseconds"], 0)
+
+    def test_validate_many_valid(self):
+        """Valid dictionaries are returned serialized."""
+        configs = [{"int_property": 1}, {"td_property": {"seconds": 2}}]
+        validated = Container.validate_many(configs)
+        self.assertEqual(validated[0], {"int_property": 1})
+        self.assertEqual(validated[1]["td_property"]["seconds"], 2)
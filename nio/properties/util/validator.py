@@ -0,0 +1,182 @@
+from nio.properties.util.object_type import ObjectType
+from nio.types import Type, BoolType, DictType, FloatType, IntType, \
+    ListType, StringType
+
+
+# Python types whose values are known to deserialize and serialize back to
+# themselves for a given nio Type, such values can be accepted as they are
+_PRIMITIVES = {
+    StringType: (str,),
+    IntType: (int,),
+    FloatType: (float, int),
+    BoolType: (bool,),
+    DictType: (dict,),
+}
+
+
+class PropertyValidator(object):
+
+    """ Validates property dictionaries for a PropertyHolder class
+
+    The validator is compiled once from the class properties, turning each
+    property into a check function that validates a raw value and returns its
+    serialized version. Checks take shortcuts where the outcome is known in
+    advance, for example a string for a string property, and walk lists and
+    nested objects directly instead of going through PropertyHolder instances.
+
+    Validation results are the same as deserializing and re-serializing each
+    value through its property, except that expressions and environment
+    variables are kept as they are.
+
+    Args:
+        holder_class (class): PropertyHolder subclass to validate for
+
+    """
+
+    def __init__(self, holder_class):
+        self._checks = [
+            (property_name, self._compile(prop))
+            for (property_name, prop) in
+            holder_class.get_class_properties().items()]
+
+    def validate(self, properties):
+        """ Validate and serialize a property dictionary
+
+        Stops at the first invalid property, serialized values replace the
+        raw ones in the given dictionary.
+
+        Args:
+            properties (dict): values to validate
+
+        Returns:
+            properties (dict): validated and serialized
+
+        Raises:
+            AllowNoneViolation: Property value does not allow none
+            TypeError: Property value is invalid
+
+        """
+        for (property_name, check) in self._checks:
+            if property_name in properties:
+                properties[property_name] = check(properties[property_name])
+        return properties
+
+    def get_errors(self, properties):
+        """ Validate a property dictionary reporting every invalid property
+
+        Valid values are serialized in place, invalid ones are left untouched.
+
+        Args:
+            properties (dict): values to validate
+
+        Returns:
+            dict: exceptions raised while validating, indexed by property
+                name, empty when all properties are valid
+
+        """
+        errors = {}
+        for (property_name, check) in self._checks:
+            if property_name in properties:
+                try:
+                    properties[property_name] = \
+                        check(properties[property_name])
+                except Exception as e:
+                    errors[property_name] = e
+        return errors
+
+    def _compile(self, prop):
+        """ Build the check function for a property """
+        from nio.properties import BaseProperty
+
+        if getattr(prop.deserialize, "__func__", None) is not \
+                BaseProperty.deserialize:
+            # properties with their own deserialization can't take shortcuts
+            return lambda value: self._generic_check(prop, value)
+
+        if prop.type is ListType:
+            structured = self._list_check(prop)
+        elif prop.type is ObjectType:
+            structured = self._object_check(prop.kwargs["obj_type"])
+        else:
+            structured = None
+        primitives = _PRIMITIVES.get(prop.type, ())
+        any_value = prop.type is Type
+
+        def check(value):
+            if value is None:
+                return self._generic_check(prop, value)
+            if any_value or type(value) in primitives:
+                return value
+            if isinstance(value, str) and \
+                    (prop.is_expression(value) or prop.is_env_var(value)):
+                return value
+            if structured is None:
+                return self._generic_check(prop, value)
+            return structured(value)
+
+        return check
+
+    @staticmethod
+    def _generic_check(prop, value):
+        """ Deserialize to validate, then serialize """
+        prop.deserialize(value)
+        if value is None:
+            return None
+        return prop.type.serialize(value, **prop.kwargs)
+
+    def _list_check(self, prop):
+        kwargs = dict(prop.kwargs)
+        list_obj_type = kwargs.pop("list_obj_type")
+        if list_obj_type is ObjectType:
+            element_check = self._object_check(kwargs["obj_type"])
+        else:
+            element_check = self._type_check(list_obj_type, kwargs)
+
+        def check(value):
+            if not isinstance(value, list):
+                raise TypeError(
+                    "Unable to cast value to list: {}".format(value))
+            return [element_check(el) for el in value]
+
+        return check
+
+    @staticmethod
+    def _type_check(_type, kwargs):
+        primitives = _PRIMITIVES.get(_type, ())
+
+        def check(value):
+            if type(value) in primitives:
+                return value
+            _type.deserialize(value, **kwargs)
+            return _type.serialize(value, **kwargs)
+
+        return check
+
+    @staticmethod
+    def _object_check(obj_type):
+        from nio.properties import PropertyHolder
+
+        class_properties = obj_type.get_class_properties()
+        # loading an instance checks the version property, only those
+        # holders still need to go through an actual instance
+        if "version" in class_properties:
+            def check(value):
+                ObjectType.deserialize(value, obj_type=obj_type)
+                return ObjectType.serialize(value)
+            return check
+
+        def check(value):
+            if isinstance(value, dict):
+                try:
+                    # nested validators are fetched when first needed since
+                    # holders may reference themselves
+                    obj_type.get_validator().validate(value)
+                except Exception:
+                    raise TypeError(
+                        "Unable to cast value to object: {}".format(value))
+                return value
+            elif isinstance(value, PropertyHolder):
+                return value.to_dict()
+            raise TypeError("Unable to cast value to object: {}".format(value))
+
+        return check
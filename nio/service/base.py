@@ -1,6 +1,9 @@
+from copy import deepcopy
+
 from nio import discoverable
 from nio.block.context import BlockContext
 from nio.command import command
+from nio.command.params.float import FloatParameter
 from nio.command.holder import CommandHolder
 from nio.properties import PropertyHolder, VersionProperty, \
     BoolProperty, ListProperty, StringProperty, Property, SelectProperty
@@ -9,7 +12,8 @@ from nio.util.logging import get_nio_logger
 from nio.util.logging.levels import LogLevel
 from nio.util.flags_enum import FlagsEnum
 from nio.util.runner import Runner, RunnerStatus
-from nio.util.threading import spawn
+from nio.util.threading import spawn, ThreadPool
+from nio.util.threading.diagnostics import profile, thread_diagnostics
 
 
 class BlockException(Exception):
@@ -51,6 +55,10 @@ class BlockMapping(PropertyHolder):
 
 @command('status', method="full_status")
 @command('heartbeat')
+@command('pools')
+@command('threads', FloatParameter('interval', default=0))
+@command('profile', FloatParameter('duration', default=5),
+         FloatParameter('interval', default=0.01))
 @command('runproperties')
 @command('start')
 @command('stop')
@@ -105,6 +113,8 @@ class Service(PropertyHolder, CommandHolder, Runner):
         self._blocks_async_configure = None
         self._blocks_async_start = None
         self._blocks_async_stop = None
+        # executes block methods when these are executed asynchronously
+        self._blocks_pool = None
 
     def start(self):
         """Overrideable method to be called when the service starts.
@@ -148,9 +158,9 @@ class Service(PropertyHolder, CommandHolder, Runner):
     def _execute_on_blocks_async(self, method):
         """ Performs given method on all blocks in an async manner
 
-        A join operation is performed for each spawned thread, that way we
-        can assure that each block gets a chance to execute fully before
-        leaving this method.
+        Methods are executed by the service blocks thread pool. A join
+        operation is performed for each of them, that way we can assure that
+        each block gets a chance to execute fully before leaving this method.
 
         Since created threads are not exposed to caller, and there is a
         potential for a spawned thread to be non-responsive, it is recommended
@@ -166,7 +176,8 @@ class Service(PropertyHolder, CommandHolder, Runner):
             # no apparent way to retrieve block label from the thread object
             threads.append({
                 "block": block,
-                "thread": spawn(getattr(block, method)),
+                "thread": spawn(getattr(block, method),
+                                pool=self._blocks_pool),
             })
 
         for thread in threads:
@@ -205,6 +216,12 @@ class Service(PropertyHolder, CommandHolder, Runner):
         self._blocks_async_start = context.blocks_async_start
         self._blocks_async_stop = context.blocks_async_stop
         self._block_router = context.block_router_type()
+        # by default every block gets a thread of its own, as when blocks
+        # were executed by threads created for them
+        blocks_pool_size = getattr(context, "blocks_pool_size", None) or \
+            max(len(context.blocks), 1)
+        self._blocks_pool = ThreadPool(
+            "{}-blocks".format(self.label()), blocks_pool_size)
 
         # create and configure blocks
         configure_threads = []
@@ -221,7 +238,8 @@ class Service(PropertyHolder, CommandHolder, Runner):
                 block.id = block_context.properties["id"]
                 configure_threads.append({
                     "block": block,
-                    "thread": spawn(block.do_configure, block_context),
+                    "thread": spawn(block.do_configure, block_context,
+                                    pool=self._blocks_pool),
                 })
             else:
                 try:
@@ -273,13 +291,19 @@ class Service(PropertyHolder, CommandHolder, Runner):
     def get_description(cls):
         """ Retrieves a service description based on properties and commands
 
+        The description is built once per service class and cached, a copy
+        of it is returned.
+
         Returns:
             Service description
         """
-        properties = super().get_description()
-        commands = cls.get_command_description()
-        return {'properties': properties,
-                'commands': commands}
+        description_attr = "{0}_description".format(cls.__name__)
+        if not hasattr(cls, description_attr):
+            properties = super().get_description()
+            commands = cls.get_command_description()
+            setattr(cls, description_attr, {'properties': properties,
+                                            'commands': commands})
+        return deepcopy(getattr(cls, description_attr))
 
     @property
     def blocks(self):
@@ -294,6 +318,33 @@ class Service(PropertyHolder, CommandHolder, Runner):
         """
         return self.status
 
+    def pools(self):
+        """ Returns the utilization of the shared thread pools and of the
+        service blocks pool
+        """
+        utilization = ThreadPool.shared_utilization()
+        if self._blocks_pool is not None:
+            utilization[self._blocks_pool.name] = \
+                self._blocks_pool.utilization()
+        return utilization
+
+    def threads(self, interval=0):
+        """ Returns the live threads of the process and their stacks
+
+        Args:
+            interval (float): seconds to sample each thread CPU usage over
+        """
+        return thread_diagnostics(interval)
+
+    def profile(self, duration=5, interval=0.01):
+        """ Samples thread stacks for a while, in collapsed stack format
+
+        Args:
+            duration (float): seconds to sample for
+            interval (float): seconds between samples
+        """
+        return profile(duration, interval)
+
     def runproperties(self):
         """ Returns service runtime properties """
         return self.to_dict()
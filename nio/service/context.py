@@ -13,7 +13,8 @@ class ServiceContext(object):
                  blocks_async_configure=True,
                  blocks_async_start=False,
                  blocks_async_stop=True,
-                 instance_id=None):
+                 instance_id=None,
+                 blocks_pool_size=None):
         """ Initializes information needed for a Service
 
         Arguments:
@@ -31,6 +32,9 @@ class ServiceContext(object):
             blocks_async_start: If True, blocks start asynchronously
             blocks_async_stop: If True, blocks stop asynchronously
             instance_id: Instance this service belongs to
+            blocks_pool_size (int): maximum number of threads configuring,
+                starting and stopping blocks asynchronously, one per block
+                when not set
         """
         self.properties = properties
         self.blocks = blocks if blocks is not None else {}
@@ -41,3 +45,4 @@ class ServiceContext(object):
         self.blocks_async_start = blocks_async_start
         self.blocks_async_stop = blocks_async_stop
         self.instance_id = instance_id
+        self.blocks_pool_size = blocks_pool_size
@@ -1,3 +1,4 @@
+from threading import current_thread
 from unittest.mock import Mock, patch
 
 from nio import Block
@@ -7,6 +8,7 @@ from nio.service.base import BlockException, Service
 from nio.service.context import ServiceContext
 from nio.signal.base import Signal
 from nio.testing.test_case import NIOTestCase
+from nio.util.threading import ThreadPool
 
 
 class TestBaseService(NIOTestCase):
@@ -175,6 +177,35 @@ class TestBaseService(NIOTestCase):
             # assert one spawn call per block stopped
             self.assertEqual(spawn_patched.call_count, 4)
 
+    def test_blocks_pool(self):
+        """ Blocks are executed in a pool of the service """
+        blocks = [{"type": Block, "properties": {'id': 'block1'}},
+                  {"type": Block, "properties": {'id': 'block2'}},
+                  {"type": Block, "properties": {'id': 'block3'}}]
+        service = Service()
+        service.do_configure(ServiceContext(
+            {"id": "ServiceId", "log_level": "WARNING"},
+            blocks=blocks,
+            block_router_type=BlockRouter
+        ))
+        # a thread per block by default
+        self.assertEqual(service._blocks_pool.max_workers, 3)
+        self.assertIsNot(service._blocks_pool, ThreadPool.get("blocks"))
+
+        service = Service()
+        service.do_configure(ServiceContext(
+            {"id": "ServiceId", "log_level": "WARNING"},
+            blocks=blocks,
+            block_router_type=BlockRouter,
+            blocks_pool_size=2
+        ))
+        self.assertEqual(service._blocks_pool.max_workers, 2)
+        service.do_start()
+        service.do_stop()
+        self.assertEqual(
+            [block.status.name for block in service.blocks.values()],
+            ["stopped"] * 3)
+
     def test_commands(self):
         """ Asserts commands functionality """
         service = Service()
@@ -198,6 +229,9 @@ class TestBaseService(NIOTestCase):
         self.assertIn("status", description["commands"])
         self.assertIn("heartbeat", description["commands"])
         self.assertIn("runproperties", description["commands"])
+        self.assertIn("pools", description["commands"])
+        self.assertIn("threads", description["commands"])
+        self.assertIn("profile", description["commands"])
 
         # verify heartbeat command
         self.assertEqual(service.heartbeat().name, "started")
@@ -207,6 +241,18 @@ class TestBaseService(NIOTestCase):
         self.assertIn("id", run_properties)
         self.assertEqual(run_properties["id"], "ServiceId")
 
+        # verify pools command
+        ThreadPool.get("blocks")
+        pools = service.pools()
+        self.assertEqual(pools["blocks"]["name"], "blocks")
+        self.assertEqual(
+            pools["{}-blocks".format(service.label())]["max_workers"], 1)
+
+        # verify threads and profile commands
+        self.assertIn(current_thread().name,
+                      [thread["name"] for thread in service.threads()])
+        self.assertGreater(service.profile(0.01)["samples"], 0)
+
         service.do_stop()
 
     def test_config_with_no_name(self):
@@ -0,0 +1,103 @@
+from copy import deepcopy
+from threading import Lock
+
+from nio.signal.base import Signal
+
+# attribute holding the base attributes, skipped by to_dict as any other
+# attribute starting with two underscores
+_BASE = "__overlay_base__"
+# values that can be shared with the base signal since they can't be modified
+_IMMUTABLE_TYPES = frozenset(
+    (str, bytes, int, float, complex, bool, type(None)))
+
+
+class OverlaySignal(Signal):
+
+    """ A signal made of some attributes on top of a base signal
+
+    The attributes of the base signal are taken when the overlay is created,
+    without copying their values. Immutable values are read from the base
+    attributes as they are, the first time a mutable value is read, the
+    signal is modified or turned into a dictionary, the base attributes are
+    deep copied into the signal, which from then on behaves as any other
+    signal.
+
+    Overlaying only costs the attributes given to the overlay while the deep
+    copy of the base signal is only made if needed. Values in the base signal
+    should not be modified in place afterwards since that is only isolated
+    from the overlay once it is flattened.
+
+    Args:
+        base (Signal): signal whose attributes are read through
+        attrs (dict): attributes of the overlay, taking precedence over the
+            base signal ones
+    """
+
+    # signals can be read from several threads, flattening one at a time
+    # keeps them from ending up with different copies of the same attribute
+    _flatten_lock = Lock()
+
+    def __init__(self, base, attrs=None):
+        super().__init__(attrs)
+        if isinstance(base, OverlaySignal):
+            base_attrs = base._overlay_attributes()
+        else:
+            base_attrs = dict(base.__dict__)
+        self.__dict__[_BASE] = base_attrs
+
+    def __getattr__(self, name):
+        # only called for attributes that are not set on the overlay
+        base_attrs = self.__dict__.get(_BASE)
+        if base_attrs is None or name not in base_attrs:
+            raise AttributeError(
+                "'{}' object has no attribute '{}'".format(
+                    self.__class__.__name__, name))
+        value = base_attrs[name]
+        if type(value) in _IMMUTABLE_TYPES:
+            return value
+        self._flatten()
+        return self.__dict__[name]
+
+    def __setattr__(self, name, value):
+        self._flatten()
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        self._flatten()
+        super().__delattr__(name)
+
+    def __dir__(self):
+        base_attrs = self.__dict__.get(_BASE)
+        if base_attrs is None:
+            return super().__dir__()
+        return list(set(super().__dir__()).union(base_attrs))
+
+    def to_dict(self, include_hidden=False, with_type=False):
+        self._flatten()
+        return super().to_dict(include_hidden, with_type)
+
+    def _overlay_attributes(self):
+        """ Get the attributes of the signal without flattening it """
+        attributes = dict(self.__dict__.get(_BASE, {}))
+        attributes.update(
+            (name, value) for (name, value) in self.__dict__.items()
+            if name != _BASE)
+        return attributes
+
+    def _flatten(self):
+        """ Copy the base attributes not set on the overlay into it """
+        if _BASE not in self.__dict__:
+            return
+        with OverlaySignal._flatten_lock:
+            base_attrs = self.__dict__.get(_BASE)
+            if base_attrs is None:
+                # flattened by another thread meanwhile
+                return
+            memo = {}
+            copied = {name: deepcopy(value, memo)
+                      for (name, value) in base_attrs.items()
+                      if name not in self.__dict__}
+            # base attributes are dropped last so that they can be read
+            # through until their copies are in place
+            self.__dict__.update(copied)
+            del self.__dict__[_BASE]
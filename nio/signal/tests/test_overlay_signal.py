@@ -0,0 +1,87 @@
+import copy
+import pickle
+from nio.signal.base import Signal
+from nio.signal.overlay import OverlaySignal
+from nio.testing.test_case import NIOTestCase
+
+
+class TestOverlaySignal(NIOTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.base = Signal({
+            'foo': 'bar',
+            'num': 3,
+            'nested': {'list': [1, 2]},
+            '_hidden': 'secret'
+        })
+
+    def test_reads_through(self):
+        """ Base attributes are read through, overlay ones first """
+        sig = OverlaySignal(self.base, {'num': 4, 'extra': 'value'})
+        self.assertEqual(sig.foo, 'bar')
+        self.assertEqual(sig.num, 4)
+        self.assertEqual(sig.extra, 'value')
+        self.assertEqual(sig._hidden, 'secret')
+        self.assertTrue(hasattr(sig, 'foo'))
+        self.assertFalse(hasattr(sig, 'missing'))
+        # nothing was copied yet
+        self.assertNotIn('foo', sig.__dict__)
+        self.assertEqual(self.base.num, 3)
+        self.assertFalse(hasattr(self.base, 'extra'))
+
+    def test_to_dict(self):
+        """ Overlays turn into the merged dictionary """
+        sig = OverlaySignal(self.base, {'num': 4})
+        self.assertDictEqual(sig.to_dict(), {
+            'foo': 'bar',
+            'num': 4,
+            'nested': {'list': [1, 2]}
+        })
+        self.assertEqual(sig.to_dict(include_hidden=True)['_hidden'],
+                         'secret')
+        self.assertEqual(sig, Signal(sig.to_dict()))
+
+    def test_mutable_values_are_copied(self):
+        """ Mutable values are copied before they can be modified """
+        sig = OverlaySignal(self.base)
+        sig.nested['list'].append(3)
+        self.assertEqual(sig.nested, {'list': [1, 2, 3]})
+        self.assertEqual(self.base.nested, {'list': [1, 2]})
+
+    def test_base_changes(self):
+        """ Base attributes set afterwards don't affect the overlay """
+        sig = OverlaySignal(self.base)
+        self.base.foo = 'updated'
+        self.base.new = 'new'
+        self.assertEqual(sig.foo, 'bar')
+        self.assertFalse(hasattr(sig, 'new'))
+
+    def test_modify(self):
+        """ Overlays can be modified as any other signal """
+        sig = OverlaySignal(self.base, {'num': 4})
+        sig.foo = 'baz'
+        del sig.num
+        self.assertEqual(sig.foo, 'baz')
+        self.assertFalse(hasattr(sig, 'num'))
+        self.assertEqual(self.base.foo, 'bar')
+        self.assertEqual(self.base.num, 3)
+
+    def test_overlay_of_overlay(self):
+        """ Overlays can be based on other overlays """
+        first = OverlaySignal(self.base, {'first': 1})
+        second = OverlaySignal(first, {'second': 2})
+        self.assertEqual(second.foo, 'bar')
+        self.assertEqual(second.first, 1)
+        self.assertEqual(second.second, 2)
+        self.assertFalse(hasattr(first, 'second'))
+        self.assertNotIn('first', self.base.to_dict())
+
+    def test_copy_and_pickle(self):
+        """ Overlays can be copied and pickled """
+        sig = OverlaySignal(self.base, {'num': 4})
+        for other in (copy.deepcopy(sig), copy.copy(sig),
+                      pickle.loads(pickle.dumps(sig))):
+            self.assertEqual(other.foo, 'bar')
+            self.assertEqual(other.num, 4)
+            self.assertEqual(other, sig)
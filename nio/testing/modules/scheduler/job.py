@@ -1,4 +1,6 @@
 from nio.testing.modules.scheduler.scheduler import JumpAheadScheduler
+from nio.testing.modules.scheduler.virtual_scheduler import \
+    VirtualTimeScheduler
 
 
 class JumpAheadJob(object):
@@ -10,6 +12,9 @@ class JumpAheadJob(object):
     def cancel(self):
         JumpAheadScheduler.unschedule(self._job)
 
+    def metrics(self):
+        return JumpAheadScheduler.job_metrics(self._job)
+
     def jump_ahead(self, seconds):
         """ Jump the scheudler forward a certain number of seconds.
 
@@ -17,3 +22,21 @@ class JumpAheadJob(object):
         logic and temporal assertions.
         """
         JumpAheadScheduler.jump_ahead(seconds)
+
+
+class VirtualTimeJob(object):
+
+    def __init__(self, target, delta, repeatable, *args, **kwargs):
+        self._job = VirtualTimeScheduler.schedule_task(
+            target, delta, repeatable, *args, **kwargs)
+
+    def cancel(self):
+        VirtualTimeScheduler.unschedule(self._job)
+
+    def metrics(self):
+        return VirtualTimeScheduler.job_metrics(self._job)
+
+    def advance(self, seconds):
+        """ Move the virtual time forward, running the jobs due meanwhile
+        """
+        VirtualTimeScheduler.advance(seconds)
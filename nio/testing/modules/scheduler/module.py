@@ -1,7 +1,10 @@
 from nio.modules.context import ModuleContext
-from nio.testing.modules.scheduler.job import JumpAheadJob
+from nio.testing.modules.scheduler.job import JumpAheadJob, VirtualTimeJob
 from nio.testing.modules.scheduler.scheduler import JumpAheadScheduler
+from nio.testing.modules.scheduler.virtual_scheduler import \
+    VirtualTimeScheduler
 from nio.modules.scheduler.module import SchedulerModule
+from nio.util.clock import set_clock
 
 
 class TestingSchedulerModule(SchedulerModule):
@@ -24,3 +27,35 @@ class TestingSchedulerModule(SchedulerModule):
         context.min_interval = 0.01
         context.resolution = 0.01
         return context
+
+
+class VirtualTimeSchedulerModule(SchedulerModule):
+
+    """ Scheduler module running jobs in virtual time
+
+    The scheduler clock becomes the process clock while the module is
+    initialized, time moves forward through VirtualTimeScheduler.advance.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._previous_clock = None
+
+    def initialize(self, context):
+        super().initialize(context)
+        self.proxy_job_class(VirtualTimeJob)
+
+        VirtualTimeScheduler.do_configure(context)
+        VirtualTimeScheduler.do_start()
+        self._previous_clock = set_clock(VirtualTimeScheduler.clock)
+
+    def finalize(self):
+        VirtualTimeScheduler.do_stop()
+        set_clock(self._previous_clock)
+        super().finalize()
+
+    def prepare_core_context(self):
+        context = ModuleContext()
+        context.min_interval = 0.01
+        context.resolution = 0.01
+        return context
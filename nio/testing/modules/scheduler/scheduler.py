@@ -1,4 +1,5 @@
 from nio.util.scheduler.scheduler import SchedulerRunner
+from nio.util.threading import spawn
 
 
 class JumpAheadSchedulerRunner(SchedulerRunner):
@@ -32,6 +33,8 @@ class JumpAheadSchedulerRunner(SchedulerRunner):
             raise ValueError("Cannot jump backwards in time")
 
         self.offset += seconds
+        # the scheduler thread waits for the next event as of before the jump
+        self._sleep_interrupt_event.set()
 
         # have scheduler execute tasks that might be ready after this jump
         self._execute_pending_tasks()
@@ -41,6 +44,15 @@ class JumpAheadSchedulerRunner(SchedulerRunner):
         self.offset = 0
         super()._reset_scheduler()
 
+    def _submit(self, target, *args):
+        """ Execute each run in its own thread
+
+        Starting a thread gives it a chance to run before the jump returns,
+        which tests rely on, while a worker of the pool might not get to run
+        until later.
+        """
+        spawn(target, *args)
+
     def _get_time(self):
         """ Overrides scheduler current time retrieval
 
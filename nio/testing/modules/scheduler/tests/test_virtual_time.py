@@ -0,0 +1,89 @@
+from datetime import timedelta
+
+from nio.block.mixins.retry.circuit_breaker import CircuitBreaker
+from nio.modules.scheduler import Job
+from nio.testing.test_case import NIOTestCase
+from nio.testing.modules.scheduler.module import VirtualTimeSchedulerModule
+from nio.testing.modules.scheduler.virtual_scheduler import \
+    VirtualTimeScheduler
+from nio.util.cache import Cache
+from nio.util.clock import get_clock, monotonic, sleep
+
+
+class TestVirtualTime(NIOTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+
+    def get_test_modules(self):
+        return {'scheduler'}
+
+    def get_module(self, module_name):
+        if module_name == 'scheduler':
+            return VirtualTimeSchedulerModule()
+
+    def _callback(self, name):
+        self.calls.append((name, monotonic()))
+
+    def test_advance(self):
+        """ Jobs due while time moves forward run in order of time """
+        start = monotonic()
+        every_minute = Job(
+            self._callback, timedelta(minutes=1), True, "minute")
+        Job(self._callback, timedelta(seconds=90), False, "once")
+        VirtualTimeScheduler.advance(3600)
+        self.assertEqual(monotonic(), start + 3600)
+        self.assertEqual(len(self.calls), 61)
+        self.assertEqual(self.calls[:3], [
+            ("minute", start + 60),
+            ("once", start + 90),
+            ("minute", start + 120),
+        ])
+        every_minute.cancel()
+        VirtualTimeScheduler.advance(3600)
+        self.assertEqual(len(self.calls), 61)
+
+    def test_run_next(self):
+        start = monotonic()
+        Job(self._callback, timedelta(hours=2), False, "later")
+        self.assertEqual(VirtualTimeScheduler.run_next(), start + 7200)
+        self.assertEqual(self.calls, [("later", start + 7200)])
+        self.assertIsNone(VirtualTimeScheduler.run_next())
+        with self.assertRaises(ValueError):
+            VirtualTimeScheduler.advance(-1)
+
+    def test_sleep_runs_due_jobs(self):
+        """ Sleeping on the clock lets due jobs run meanwhile """
+        self.assertIs(get_clock(), VirtualTimeScheduler.clock)
+        start = monotonic()
+
+        def sleeper():
+            self._callback("sleeping")
+            sleep(30)
+            self._callback("awake")
+
+        Job(sleeper, timedelta(seconds=10), False)
+        Job(self._callback, timedelta(seconds=20), False, "other")
+        VirtualTimeScheduler.advance(60)
+        self.assertEqual(self.calls, [
+            ("sleeping", start + 10),
+            ("other", start + 20),
+            ("awake", start + 40),
+        ])
+
+    def test_time_driven_utilities(self):
+        """ Caches and circuit breakers follow virtual time """
+        cache = Cache(3600)
+        cache.add("key", "value")
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=600)
+        breaker.record_failure()
+        self.assertFalse(breaker.allow_request())
+
+        VirtualTimeScheduler.advance(599)
+        self.assertEqual(cache.get("key"), "value")
+        self.assertFalse(breaker.allow_request())
+        VirtualTimeScheduler.advance(1)
+        self.assertTrue(breaker.allow_request())
+        VirtualTimeScheduler.advance(3000)
+        self.assertIsNone(cache.get("key"))
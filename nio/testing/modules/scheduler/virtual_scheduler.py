@@ -0,0 +1,122 @@
+from collections import deque
+
+from nio.util.clock import VirtualClock
+from nio.util.scheduler.heap import HeapQueue
+from nio.util.scheduler.scheduler import SchedulerRunner
+
+
+class SchedulerClock(VirtualClock):
+
+    """ A virtual clock running the scheduled jobs as its time moves
+
+    Sleeping runs the jobs due meanwhile, one of them sleeping returns once
+    the runs started while it sleeps are done.
+    """
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self._scheduler = scheduler
+
+    def advance_to(self, time):
+        self._scheduler.run_until(time)
+
+
+class VirtualTimeSchedulerRunner(SchedulerRunner):
+
+    """ A scheduler driven by a virtual clock instead of real time
+
+    Time does not pass on its own, moving the clock forward runs every job
+    due in between, one after the other and in order of time, from the
+    calling thread. Runs take no time unless they sleep on the clock, so
+    hours of scheduled jobs can be run in seconds and always in the same
+    order.
+
+    The clock of the scheduler, set as the process clock by the virtual
+    time scheduler module, is used by time driven code such as retries so
+    that it keeps in step with jobs.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.clock = SchedulerClock(self)
+        # runs launched, waiting to be executed by the thread moving time
+        self._runs = deque()
+
+    def _create_queue(self, backend):
+        # jobs run at their exact time, not rounded to a tick
+        return HeapQueue()
+
+    def start(self):
+        # there is no thread processing events, time is moved explicitly
+        pass
+
+    def stop(self):
+        self._stop_event.set()
+        self._runs.clear()
+
+    def advance(self, seconds):
+        """ Move time forward a number of seconds, running due jobs
+
+        Args:
+            seconds (float): number of seconds to move forward
+
+        Raises:
+            ValueError: If seconds is negative - can't go back in time
+        """
+        if float(seconds) < 0:
+            raise ValueError("Cannot move backwards in time")
+        self.run_until(self.clock.time() + seconds)
+
+    def run_until(self, time):
+        """ Run the jobs due up to a time, moving the clock to it
+
+        Args:
+            time (float): clock time to move to
+
+        Raises:
+            ValueError: If time is before the current time
+        """
+        if time < self.clock.time():
+            raise ValueError("Cannot move backwards in time")
+        while self.run_next(time) is not None:
+            pass
+        self.clock.set_time(time)
+
+    def run_next(self, until=None):
+        """ Move the clock to the next scheduled job and run it
+
+        Args:
+            until (float): do not move the clock past this time
+
+        Returns:
+            float: the time moved to, None if no job is scheduled up to
+                'until'
+        """
+        with self._queue_lock:
+            next_time = self._queue.next_time()
+        if next_time is None or until is not None and next_time > until:
+            return None
+        now = max(next_time, self.clock.time())
+        self.clock.set_time(now)
+        self._execute_pending_tasks()
+        self._run_pending()
+        return now
+
+    def _run_pending(self):
+        """ Execute the launched runs in order """
+        while self._runs:
+            target, args = self._runs.popleft()
+            try:
+                target(*args)
+            except Exception:
+                self.logger.exception('Calling: {0}'.format(target))
+
+    def _submit(self, target, *args):
+        """ Keep runs to be executed once due events are processed """
+        self._runs.append((target, args))
+
+    def _get_time(self):
+        return self.clock.time()
+
+# Singleton reference to our virtual time scheduler
+VirtualTimeScheduler = VirtualTimeSchedulerRunner()
@@ -0,0 +1,88 @@
+import time as _time
+from threading import Lock
+
+
+class Clock(object):
+
+    """ Real time, measured with a clock that cannot go backwards """
+
+    def time(self):
+        return _time.monotonic()
+
+    def sleep(self, seconds):
+        _time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+
+    """ A clock whose time only moves when told to
+
+    Sleeping moves the time forward instead of waiting, so that code driven
+    by time runs as fast as it can and always the same way.
+
+    Args:
+        time (float): initial time
+    """
+
+    def __init__(self, time=0.0):
+        super().__init__()
+        self._time = time
+        self._lock = Lock()
+
+    def time(self):
+        return self._time
+
+    def set_time(self, time):
+        """ Set the current time
+
+        Raises:
+            ValueError: the time is before the current time
+        """
+        with self._lock:
+            if time < self._time:
+                raise ValueError("Cannot move backwards in time")
+            self._time = time
+
+    def advance_to(self, time):
+        """ Move the time forward up to a time """
+        self.set_time(time)
+
+    def advance(self, seconds):
+        """ Move the time forward a number of seconds """
+        self.advance_to(self._time + seconds)
+
+    def sleep(self, seconds):
+        self.advance(seconds)
+
+
+# clock used to read the time and to wait throughout the process
+_clock = Clock()
+
+
+def get_clock():
+    return _clock
+
+
+def set_clock(clock):
+    """ Set the clock used throughout the process
+
+    Args:
+        clock (Clock): the new clock, None for real time
+
+    Returns:
+        Clock: the previous clock
+    """
+    global _clock
+    previous = _clock
+    _clock = clock or Clock()
+    return previous
+
+
+def monotonic():
+    """ Current time of the process clock """
+    return _clock.time()
+
+
+def sleep(seconds):
+    """ Wait a number of seconds as measured by the process clock """
+    _clock.sleep(seconds)
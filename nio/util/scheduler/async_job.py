@@ -0,0 +1,14 @@
+from nio.util.scheduler.async_scheduler import AsyncScheduler
+
+
+class AsyncJob(object):
+
+    def __init__(self, target, delta, repeatable, *args, **kwargs):
+        self._job = AsyncScheduler.schedule_task(
+            target, delta, repeatable, *args, **kwargs)
+
+    def cancel(self):
+        AsyncScheduler.unschedule(self._job)
+
+    def metrics(self):
+        return AsyncScheduler.job_metrics(self._job)
@@ -0,0 +1,23 @@
+from nio.modules.scheduler.module import SchedulerModule
+from nio.util.scheduler.async_job import AsyncJob
+from nio.util.scheduler.async_scheduler import AsyncScheduler
+
+
+class AsyncSchedulerModule(SchedulerModule):
+
+    """ Scheduler module running jobs from an asyncio event loop
+
+    Job targets that are coroutine functions are awaited in the event loop,
+    other targets are executed by a pool of worker threads.
+    """
+
+    def initialize(self, context):
+        super().initialize(context)
+        self.proxy_job_class(AsyncJob)
+
+        AsyncScheduler.do_configure(context)
+        AsyncScheduler.do_start()
+
+    def finalize(self):
+        AsyncScheduler.do_stop()
+        super().finalize()
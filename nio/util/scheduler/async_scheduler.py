@@ -0,0 +1,268 @@
+import asyncio
+from datetime import timedelta
+from threading import Lock
+from uuid import uuid4
+
+from nio.modules.module import ModuleNotInitialized
+from nio.modules.scheduler.job import OverrunPolicy
+from nio.util.logging import get_nio_logger
+from nio.util.runner import RunnerStatus, Runner
+from nio.util.scheduler.metrics import JobMetrics
+from nio.util.threading.pool import ThreadPool
+from nio.util.threading.thread import NIOThread
+
+
+class _ScheduledTask(object):
+
+    """ State of a task scheduled in the event loop """
+
+    def __init__(self, target, frequency, overrun_policy, args, kwargs):
+        self.id = uuid4().hex
+        self.target = target
+        self.frequency = frequency
+        self.overrun_policy = overrun_policy
+        self.args = args
+        self.kwargs = kwargs
+        self.is_coroutine = asyncio.iscoroutinefunction(target)
+        # loop time the task is next due at and its timer
+        self.time = None
+        self.handle = None
+        self.running = 0
+        # time a run queued while running was due at
+        self.queued_time = None
+        self.cancelled = False
+        self.metrics = JobMetrics() if frequency else None
+
+
+class AsyncSchedulerRunner(Runner):
+
+    """ A scheduler running tasks from an asyncio event loop
+
+    Tasks are timed with the event loop, which runs in its own thread.
+    Coroutine functions are awaited in the event loop while other targets
+    are executed by a pool of worker threads, the event loop thread is never
+    blocked by them.
+
+    Tasks can be scheduled and cancelled from any thread.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._sched_min_delta = 0.1
+        # sync targets are executed by a pool of worker threads
+        self._max_workers = 50
+        self._workers_name = "AsyncScheduler"
+        self._workers = None
+        self.logger = get_nio_logger("AsyncScheduler")
+        self._loop = None
+        self._loop_thread = None
+        self._tasks = dict()
+        self._tasks_lock = Lock()
+        self._overall_metrics = JobMetrics()
+
+    def configure(self, context):
+        self._sched_min_delta = context.min_interval
+        self._max_workers = getattr(
+            context, "max_workers", self._max_workers)
+        self._workers_name = getattr(
+            context, "workers_name", self._workers_name)
+
+    def start(self):
+        self._workers = ThreadPool(self._workers_name, self._max_workers)
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = NIOThread(
+            target=self._run_loop, name="{}-loop".format(self._workers_name))
+        self._loop_thread.daemon = True
+        self._loop_thread.start()
+
+    def stop(self):
+        if self._loop is None:
+            # never started
+            return
+        with self._tasks_lock:
+            tasks = list(self._tasks.values())
+            self._tasks.clear()
+        for task in tasks:
+            task.cancelled = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        # do not join indefinitely, allow a reasonable time
+        self._loop_thread.join(1)
+        if self._loop_thread.is_alive():
+            self.logger.warning("Event loop thread did not end properly, "
+                                "it timed out")
+        self._workers.shutdown()
+        self._overall_metrics = JobMetrics()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_forever()
+        finally:
+            # coroutines still running are not awaited any longer
+            for coroutine_task in asyncio.all_tasks(self._loop):
+                coroutine_task.cancel()
+            self._loop.close()
+
+    def schedule_task(self, target, delta, repeatable, *args,
+                      overrun_policy=OverrunPolicy.allow_concurrent,
+                      **kwargs):
+        """ Add the given task to the Scheduler.
+
+        Args:
+            target (callable): The task to be scheduled, coroutine functions
+                are awaited in the event loop.
+            delta (timedelta): The scheduling interval.
+            repeatable (bool): When False, 'target' is run only once.
+            args: Positional arguments to be passed to 'target'.
+            overrun_policy (OverrunPolicy): What to do when a repeatable
+                task is due while still running.
+            kwargs: Keyword arguments to be passed to 'target'.
+
+        Returns:
+            the id of the scheduled task
+        """
+        if self.status != RunnerStatus.started:
+            raise ModuleNotInitialized("Scheduler module is not started")
+
+        if not isinstance(delta, timedelta):
+            raise AttributeError('delta must be of type: timedelta')
+
+        delta = delta.total_seconds()
+        frequency = 0
+        if repeatable:
+            # make sure delta is not smaller than minimum
+            if delta < self._sched_min_delta:
+                self.logger.warning(
+                    "Scheduler delta of {} is invalid, minimum is {}".format(
+                        delta, self._sched_min_delta))
+                delta = self._sched_min_delta
+            frequency = delta
+
+        task = _ScheduledTask(
+            target, frequency, OverrunPolicy(overrun_policy), args, kwargs)
+        with self._tasks_lock:
+            self._tasks[task.id] = task
+        self._loop.call_soon_threadsafe(self._schedule, task, delta)
+        return task.id
+
+    def unschedule(self, job):
+        """ Remove a task from the scheduler
+
+        Args:
+            job: The ID of the task to remove
+
+        Returns:
+            bool: False if the task was not scheduled
+        """
+        with self._tasks_lock:
+            task = self._tasks.pop(job, None)
+        if task is None:
+            return False
+        task.cancelled = True
+        self._loop.call_soon_threadsafe(self._cancel, task)
+        return True
+
+    def job_metrics(self, job):
+        """ Get the metrics of a task, see SchedulerRunner.job_metrics """
+        with self._tasks_lock:
+            task = self._tasks.get(job)
+        if task is None:
+            return None
+        return (task.metrics or JobMetrics()).to_dict()
+
+    def metrics(self):
+        """ Get the scheduler metrics, see SchedulerRunner.metrics """
+        metrics = self._overall_metrics.to_dict()
+        with self._tasks_lock:
+            metrics["jobs"] = len(self._tasks)
+        if self._workers is not None:
+            metrics["workers"] = self._workers.utilization()
+        return metrics
+
+    def _schedule(self, task, delta):
+        if task.cancelled:
+            return
+        task.time = self._loop.time() + delta
+        task.handle = self._loop.call_at(task.time, self._fire, task)
+
+    def _cancel(self, task):
+        if task.handle is not None:
+            task.handle.cancel()
+
+    def _fire(self, task):
+        """ Run a due task, to be called from the event loop """
+        if task.cancelled:
+            return
+        due = task.time
+        if not task.frequency:
+            with self._tasks_lock:
+                self._tasks.pop(task.id, None)
+        elif task.overrun_policy is not OverrunPolicy.delay_next:
+            task.time += task.frequency
+            task.handle = self._loop.call_at(task.time, self._fire, task)
+        if task.running and task.frequency:
+            policy = task.overrun_policy
+            if policy is OverrunPolicy.skip or \
+                    policy is OverrunPolicy.queue_one and \
+                    task.queued_time is not None:
+                self._overall_metrics.run_skipped()
+                task.metrics.run_skipped()
+                return
+            if policy is OverrunPolicy.queue_one:
+                task.queued_time = due
+                self._overall_metrics.run_queued()
+                task.metrics.run_queued()
+                return
+            self._overall_metrics.run_overlapping()
+            task.metrics.run_overlapping()
+        self._start(task, due)
+
+    def _start(self, task, due):
+        task.running += 1
+        start = self._loop.time()
+        self._overall_metrics.run_started(start - due)
+        if task.metrics is not None:
+            task.metrics.run_started(start - due)
+        if task.is_coroutine:
+            self._loop.create_task(self._run_coroutine(task, start))
+        else:
+            self._workers.submit(self._run_sync, task, start)
+
+    async def _run_coroutine(self, task, start):
+        try:
+            await task.target(*task.args, **task.kwargs)
+        except Exception:
+            self.logger.exception("Executing: {0}".format(task.target))
+        finally:
+            self._finish(task, start)
+
+    def _run_sync(self, task, start):
+        try:
+            task.target(*task.args, **task.kwargs)
+        except Exception:
+            self.logger.exception("Executing: {0}".format(task.target))
+        finally:
+            try:
+                self._loop.call_soon_threadsafe(self._finish, task, start)
+            except RuntimeError:
+                # the event loop was closed meanwhile
+                pass
+
+    def _finish(self, task, start):
+        """ Keep track of a finished run, to be called from the event loop """
+        run_time = self._loop.time() - start
+        self._overall_metrics.run_finished(run_time)
+        if task.metrics is not None:
+            task.metrics.run_finished(run_time)
+        task.running -= 1
+        if task.cancelled:
+            return
+        if task.queued_time is not None:
+            due, task.queued_time = task.queued_time, None
+            self._start(task, due)
+        elif task.overrun_policy is OverrunPolicy.delay_next and \
+                task.frequency:
+            self._schedule(task, task.frequency)
+
+# Singleton reference to an asyncio scheduler
+AsyncScheduler = AsyncSchedulerRunner()
@@ -0,0 +1,72 @@
+import heapq
+
+
+class HeapQueue(object):
+
+    """ Scheduler events ordered by time in a binary heap
+
+    Cancelled events are left in the heap and skipped once they reach the
+    top of it. The heap is compacted once cancelled events make up most of
+    it, so cancelling an event costs O(1) amortized.
+    """
+
+    def __init__(self):
+        self._heap = []
+        # ids of the cancelled events still in the heap
+        self._cancelled = set()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, event):
+        heapq.heappush(self._heap, event)
+
+    def peek(self):
+        """ Get the next event without removing it
+
+        Returns:
+            the event with the earliest time, None if there are no events
+        """
+        while self._heap:
+            event = self._heap[0]
+            if event.id not in self._cancelled:
+                return event
+            heapq.heappop(self._heap)
+            self._cancelled.discard(event.id)
+        return None
+
+    def pop_due(self, now):
+        """ Remove and get the next event if its time is up
+
+        Args:
+            now (float): current time
+
+        Returns:
+            the earliest event if its time is not after now, otherwise None
+        """
+        event = self.peek()
+        if event is None or event.time > now:
+            return None
+        return heapq.heappop(self._heap)
+
+    def next_time(self):
+        """ Get the time of the next event, None if there are no events """
+        event = self.peek()
+        return event.time if event is not None else None
+
+    def discard(self, event):
+        """ Cancel an event """
+        self._cancelled.add(event.id)
+        if len(self._cancelled) * 2 > len(self._heap):
+            self._compact()
+
+    def clear(self):
+        self._heap[:] = []
+        self._cancelled.clear()
+
+    def _compact(self):
+        """ Remove cancelled events from the heap """
+        self._heap[:] = [event for event in self._heap
+                         if event.id not in self._cancelled]
+        self._cancelled.clear()
+        heapq.heapify(self._heap)
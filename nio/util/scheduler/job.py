@@ -9,3 +9,6 @@ class Job(object):
 
     def cancel(self):
         Scheduler.unschedule(self._job)
+
+    def metrics(self):
+        return Scheduler.job_metrics(self._job)
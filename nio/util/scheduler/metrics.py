@@ -0,0 +1,88 @@
+from bisect import bisect_left
+from threading import Lock
+
+# upper bounds in seconds of the buckets job times are counted in
+TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 60)
+
+
+class Histogram(object):
+
+    """ Counts values in buckets defined by their upper bounds
+
+    Args:
+        bounds (tuple): sorted upper bounds of the buckets, values greater
+            than the last one are counted in an additional bucket
+    """
+
+    def __init__(self, bounds=TIME_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def to_dict(self):
+        buckets = {str(bound): count
+                   for (bound, count) in zip(self.bounds, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "buckets": buckets,
+        }
+
+
+class JobMetrics(object):
+
+    """ Start lateness and run time histograms of scheduled job runs
+
+    Lateness is the time between when a run was scheduled to start and when
+    it actually started. Runs due while the job was still running are
+    counted as skipped, queued or overlapping depending on the job overrun
+    policy.
+    """
+
+    def __init__(self):
+        self.lateness = Histogram()
+        self.run_time = Histogram()
+        self.skipped = 0
+        self.queued = 0
+        self.overlapping = 0
+        self._lock = Lock()
+
+    def run_started(self, lateness):
+        with self._lock:
+            self.lateness.record(max(lateness, 0))
+
+    def run_finished(self, run_time):
+        with self._lock:
+            self.run_time.record(run_time)
+
+    def run_skipped(self):
+        with self._lock:
+            self.skipped += 1
+
+    def run_queued(self):
+        with self._lock:
+            self.queued += 1
+
+    def run_overlapping(self):
+        with self._lock:
+            self.overlapping += 1
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "lateness": self.lateness.to_dict(),
+                "run_time": self.run_time.to_dict(),
+                "skipped": self.skipped,
+                "queued": self.queued,
+                "overlapping": self.overlapping,
+            }
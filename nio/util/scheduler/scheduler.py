@@ -1,4 +1,3 @@
-import heapq
 from collections import namedtuple
 from datetime import timedelta
 from threading import Event, RLock
@@ -6,11 +5,18 @@ from time import monotonic
 from uuid import uuid4
 
 from nio.modules.module import ModuleNotInitialized
+from nio.modules.scheduler.job import OverrunPolicy
 from nio.util.logging import get_nio_logger
 from nio.util.runner import RunnerStatus, Runner
+from nio.util.scheduler.heap import HeapQueue
+from nio.util.scheduler.metrics import JobMetrics
+from nio.util.scheduler.tick_group import TickGroup
+from nio.util.scheduler.timing_wheel import TimingWheel
 from nio.util.threading import spawn
+from nio.util.threading.pool import ThreadPool
 
-QueueEvent = namedtuple('Event', 'time, id, target, frequency, args, kwargs')
+QueueEvent = namedtuple(
+    'Event', 'time, id, target, frequency, args, kwargs, overrun_policy')
 
 
 class SchedulerRunner(Runner):
@@ -19,15 +25,36 @@ class SchedulerRunner(Runner):
         super().__init__()
         self._sched_min_delta = 0.1
         self._sched_resolution = 0.1
+        # jobs are executed by a pool of worker threads
+        self._max_workers = 50
+        self._workers_name = "Scheduler"
+        self._workers = None
         self.logger = get_nio_logger("Custom Scheduler")
-        self._queue = []
+        # events are queued in a heap or a timing wheel
+        self._backend = "heap"
+        self._queue = HeapQueue()
         self._queue_lock = RLock()
         self._stop_event = Event()
         self._events = dict()
         self._events_lock = RLock()
+        # lateness and run time of job runs, per job and overall
+        self._metrics = dict()
+        self._overall_metrics = JobMetrics()
+        # number of runs launched and not finished yet, per job
+        self._running = dict()
+        # runs of jobs waiting for their running run to finish
+        self._queued_runs = dict()
+        # repeatable jobs sharing a frequency can run together in groups,
+        # spread in phases, indexed by frequency and phase, by the id of
+        # their queued event and by job id
+        self._coalesce = False
+        self._coalesce_phases = 1
+        self._tick_groups = dict()
+        self._tick_group_ids = dict()
+        self._job_groups = dict()
         self._process_events_thread = None
-        # event used to wait for next task to execute and/or wait at scheduler
-        # resolution
+        # event used to wait for next task to execute, set to wake up the
+        # scheduler when an earlier task is scheduled or when stopping
         self._sleep_interrupt_event = Event()
 
     def configure(self, context):
@@ -35,6 +62,33 @@ class SchedulerRunner(Runner):
         self._reset_scheduler()
         self._sched_min_delta = context.min_interval
         self._sched_resolution = context.resolution
+        self._max_workers = getattr(
+            context, "max_workers", self._max_workers)
+        self._workers_name = getattr(
+            context, "workers_name", self._workers_name)
+        self._backend = getattr(context, "backend", self._backend)
+        self._coalesce = getattr(context, "coalesce", self._coalesce)
+        self._coalesce_phases = getattr(
+            context, "coalesce_phases", self._coalesce_phases)
+        with self._queue_lock:
+            self._queue = self._create_queue(self._backend)
+
+    def _create_queue(self, backend):
+        """ Create the queue holding the scheduled events
+
+        Args:
+            backend (str): "heap" for a binary heap, good for any number of
+                events, or "timing_wheel" for a hierarchical timing wheel,
+                better for large numbers of short lived events
+
+        Raises:
+            ValueError: unknown backend
+        """
+        if backend == "heap":
+            return HeapQueue()
+        if backend == "timing_wheel":
+            return TimingWheel(self._sched_resolution, self._get_time())
+        raise ValueError("Unknown scheduler backend: {}".format(backend))
 
     def _reset_scheduler(self):
         """ Reset the scheduler to the basic state.
@@ -43,15 +97,25 @@ class SchedulerRunner(Runner):
         restarted or start fresh. It will clear out the queue, reset the
         stop event, etc.
         """
-        self._queue[:] = []
+        self._queue.clear()
         # Set and then clear the event to trigger any needed stops
         self._stop_event.set()
+        self._sleep_interrupt_event.set()
         self._stop_event.clear()
         self._events.clear()
+        self._metrics.clear()
+        self._overall_metrics = JobMetrics()
+        self._running.clear()
+        self._queued_runs.clear()
+        self._tick_groups.clear()
+        self._tick_group_ids.clear()
+        self._job_groups.clear()
         if self._process_events_thread is not None:
             self._process_events_thread.join(self._sched_resolution)
 
-    def schedule_task(self, target, delta, repeatable, *args, **kwargs):
+    def schedule_task(self, target, delta, repeatable, *args,
+                      overrun_policy=OverrunPolicy.allow_concurrent,
+                      **kwargs):
         """ Add the given task to the Scheduler.
 
         Args:
@@ -63,6 +127,8 @@ class SchedulerRunner(Runner):
                 Otherwise, it is run repeatedly at an interval defined by
                 'delta'.
             args: Positional arguments to be passed to 'target'.
+            overrun_policy (OverrunPolicy): What to do when a repeatable
+                task is due while still running.
             kwargs: Keyword arguments to be passed to 'target'.
 
         Returns:
@@ -92,18 +158,33 @@ class SchedulerRunner(Runner):
         event_id = uuid4().hex
         event = QueueEvent(
             self._get_time() + delta, event_id, target,
-            frequency, args, kwargs)
+            frequency, args, kwargs, OverrunPolicy(overrun_policy))
 
-        # add to queue
-        with self._queue_lock:
-            heapq.heappush(self._queue, event)
-
-        # add to events
+        # add to events and queue
         with self._events_lock:
-            self._events[event_id] = event
+            if self._coalesce and frequency and \
+                    event.overrun_policy is not OverrunPolicy.delay_next:
+                self._join_tick_group(event)
+            else:
+                self._queue_event(event)
 
         return event_id
 
+    def _queue_event(self, event):
+        """ Add an event to the queue, to be called holding events lock """
+        self._events[event.id] = event
+        self._push_event(event)
+
+    def _push_event(self, event):
+        """ Push an event to the queue, waking up the scheduler if needed """
+        with self._queue_lock:
+            next_time = self._queue.next_time()
+            self._queue.push(event)
+        if next_time is None or event.time < next_time:
+            # the scheduler is waiting for a later event, have it wait for
+            # this one instead
+            self._sleep_interrupt_event.set()
+
     def unschedule(self, job):
         """Remove a job from the scheduler.
 
@@ -123,12 +204,16 @@ class SchedulerRunner(Runner):
         with self._events_lock:
             if job in self._events:
                 event = self._events.pop(job)
+                self._metrics.pop(job, None)
+                self._queued_runs.pop(job, None)
+                if job in self._job_groups:
+                    self._leave_tick_group(job)
+                    self.logger.debug('Success cancelling event')
+                    return True
         if event:
             try:
                 with self._queue_lock:
-                    if event in self._queue:
-                        self._queue.remove(event)
-                        heapq.heapify(self._queue)
+                    self._queue.discard(event)
                 self.logger.debug('Success cancelling event')
                 return True
             except Exception:
@@ -136,8 +221,102 @@ class SchedulerRunner(Runner):
                                   ' while cancelling a job'.format(event))
         return False
 
+    def _join_tick_group(self, event):
+        """ Add a repeatable job to the group of its frequency
+
+        The job first runs on the first tick of the group at or after its
+        time. Jobs are spread in phases evenly shifted within the frequency
+        interval, each phase being a group.
+
+        To be called holding events lock
+        """
+        phase = event.frequency * (
+            int(event.id, 16) % self._coalesce_phases) / self._coalesce_phases
+        group = self._tick_groups.get((event.frequency, phase))
+        if group is None:
+            group = TickGroup(event.frequency, phase)
+            self._tick_groups[(group.frequency, group.phase)] = group
+            self._tick_group_ids[group.id] = group
+            self._push_event(QueueEvent(
+                group.first_tick(event.time), group.id, None,
+                group.frequency, (), {}, OverrunPolicy.allow_concurrent))
+        group.members[event.id] = event
+        self._events[event.id] = event
+        self._job_groups[event.id] = group
+
+    def _leave_tick_group(self, job):
+        """ Remove a job from its group, to be called holding events lock """
+        group = self._job_groups.pop(job)
+        del group.members[job]
+        # empty groups are dropped on their next tick
+
+    def _tick(self, tick_event, group):
+        """ Start the runs of the due members of a group
+
+        To be called holding events lock
+
+        Returns:
+            list: (event, metrics) of the runs to launch
+        """
+        runs = []
+        for (job, event) in list(group.members.items()):
+            if event.time > tick_event.time:
+                # not due yet
+                continue
+            # the run is due at the tick
+            event = event._replace(time=tick_event.time)
+            metrics = self._get_job_metrics(event)
+            if self._start_run(event, metrics):
+                runs.append((event, metrics))
+            group.members[job] = self._events[job] = event._replace(
+                time=tick_event.time + group.frequency)
+        if group.members:
+            self._push_event(tick_event._replace(
+                time=tick_event.time + group.frequency))
+        else:
+            del self._tick_groups[(group.frequency, group.phase)]
+            del self._tick_group_ids[group.id]
+        return runs
+
+    def job_metrics(self, job):
+        """ Get the metrics of a job
+
+        Metrics are kept while the job is scheduled.
+
+        Args:
+            job: The ID of the job
+
+        Returns:
+            dict: lateness and run time histograms of the job runs, None if
+                the job is not scheduled
+        """
+        with self._events_lock:
+            if job not in self._events:
+                return None
+            # metrics are only created once a repeatable job runs
+            metrics = self._metrics.get(job) or JobMetrics()
+        return metrics.to_dict()
+
+    def metrics(self):
+        """ Get the scheduler metrics
+
+        Returns:
+            dict: lateness and run time histograms of every job run, number
+                of jobs and tick groups and the worker pool utilization
+        """
+        metrics = self._overall_metrics.to_dict()
+        with self._events_lock:
+            metrics["jobs"] = len(self._events)
+            metrics["tick_groups"] = len(self._tick_groups)
+        if self._workers is not None:
+            metrics["workers"] = self._workers.utilization()
+        return metrics
+
     def stop(self):
         self._stop_event.set()
+        self._sleep_interrupt_event.set()
+        if self._workers is not None:
+            self._workers.shutdown()
         # do not join indefinitely, allow a reasonable time
         self._process_events_thread.join(10 * self._sched_resolution)
         if self._process_events_thread.is_alive():
@@ -145,6 +324,7 @@ class SchedulerRunner(Runner):
                                 "it timed out")
 
     def start(self):
+        self._workers = ThreadPool(self._workers_name, self._max_workers)
         self._process_events_thread = spawn(self._process_events)
 
     def _process_events(self):
@@ -152,12 +332,16 @@ class SchedulerRunner(Runner):
 
         Starts a loop that runs indefinitely until stop_event is set.
         Uses recommended-time returned from _execute_pending_tasks to wait
-            for next pending tasks execution
+            for next pending tasks execution, the wait is interrupted when
+            an earlier task is scheduled
         Any exception that may arise is logged while loop continues execution
         """
 
         while not self._stop_event.is_set():
             try:
+                # clear before looking at the queue so that tasks scheduled
+                # from now on interrupt the wait
+                self._sleep_interrupt_event.clear()
                 next_try_time = self._execute_pending_tasks()
                 self._sleep_interrupt_event.wait(next_try_time)
             except Exception:
@@ -172,66 +356,164 @@ class SchedulerRunner(Runner):
 
         General characteristics:
             Scheduler tasks are launched asynchronously
-            When not a single event is scheduled, method will return the
-            resolution time, however, when events are present the next wait
-            time is calculated as the minimum between scheduler's resolution
-            and next event scheduled time.
+            When not a single event is scheduled, method will return None
+            to wait until a task is scheduled, however, when events are
+            present the next wait time is the time left until the next event
+            is due. The next event is looked at without removing it from
+            the queue.
 
         Returns:
-            recommended time to wait before events are next considered
+            recommended time to wait before events are next considered, None
+                to wait until interrupted
         """
         while not self._stop_event.is_set():
-            with self._queue_lock:
-                # is queue empty?
-                if not self._queue:
-                    # amount of time recommended to wait before trying again
-                    return self._sched_resolution
-                # have access to first event in queue
-                event = heapq.heappop(self._queue)
-
-            # check event's time to see if it is up for execution.
-            event_time, event_id, target, frequency, args, kwargs = event
-            # get time to compare event against
-            now = self._get_time()
-            if now < event_time:
-                # event is in the future so push it back and recommend time
-                # to wait before trying again
+            # events are popped and processed at once so that other threads
+            # never see a popped event not processed yet
+            with self._events_lock:
                 with self._queue_lock:
-                    heapq.heappush(self._queue, event)
-                return min(event_time - now, self._sched_resolution)
-            else:
-                # time is up, execute
-                try:
-                    self.logger.debug("Executing: {0}".format(target))
-                    # launch target task from a different thread thus
-                    # making scheduler independent from task duration
-                    spawn(target, *args, **kwargs)
-                except Exception:
-                    self.logger.exception('Calling: {0}'.format(target))
-
-                with self._events_lock:
-                    # before processing any further, make sure event has
-                    # not been cancelled
-                    if event_id in self._events:
-                        # is it repeatable?
-                        if frequency:
-                            # reschedule it back, adding frequency to
-                            # event time
-                            event = QueueEvent(event_time + frequency,
-                                               event_id,
-                                               target,
-                                               frequency,
-                                               args, kwargs)
-                            # housekeeping new event in
-                            with self._queue_lock:
-                                heapq.heappush(self._queue, event)
-                            self._events[event_id] = event
-                        else:
-                            # remove event when not repeatable
-                            del self._events[event_id]
-                    else:
-                        self.logger.debug("Event: {0} was cancelled".
-                                          format(event_id))
+                    # get time to compare events against
+                    now = self._get_time()
+                    event = self._queue.pop_due(now)
+                    if event is None:
+                        next_time = self._queue.next_time()
+                        # is queue empty?
+                        if next_time is None:
+                            # wait until a task is scheduled
+                            return None
+                        # recommend time to wait before trying again
+                        return max(next_time - now, 0)
+
+                group = self._tick_group_ids.get(event.id)
+                if group is not None:
+                    runs = self._tick(event, group)
+                    if runs:
+                        # time is up, execute the group members
+                        self._launch(runs)
+                    continue
+                # before processing any further, make sure event has
+                # not been cancelled
+                if event.id not in self._events:
+                    self.logger.debug("Event: {0} was cancelled".
+                                      format(event.id))
+                    continue
+                metrics = self._get_job_metrics(event)
+                if self._start_run(event, metrics):
+                    # time is up, execute
+                    self._launch([(event, metrics)])
+                # is it repeatable?
+                if event.frequency:
+                    if event.overrun_policy is not OverrunPolicy.delay_next:
+                        # reschedule it back, adding frequency to event time
+                        self._queue_event(event._replace(
+                            time=event.time + event.frequency))
+                else:
+                    # remove event when not repeatable
+                    del self._events[event.id]
+
+    def _get_job_metrics(self, event):
+        """ Get the metrics of a repeatable job
+
+        To be called holding events lock
+        """
+        if not event.frequency:
+            return None
+        metrics = self._metrics.get(event.id)
+        if metrics is None:
+            metrics = self._metrics[event.id] = JobMetrics()
+        return metrics
+
+    def _start_run(self, event, metrics):
+        """ Apply the overrun policy to a due event
+
+        To be called holding events lock
+
+        Returns:
+            bool: True if the event is to be executed now
+        """
+        running = self._running.get(event.id, 0)
+        if running and event.frequency:
+            policy = event.overrun_policy
+            if policy is OverrunPolicy.skip or \
+                    policy is OverrunPolicy.queue_one and \
+                    event.id in self._queued_runs:
+                self._overall_metrics.run_skipped()
+                metrics.run_skipped()
+                return False
+            if policy is OverrunPolicy.queue_one:
+                self._queued_runs[event.id] = event
+                self._overall_metrics.run_queued()
+                metrics.run_queued()
+                return False
+            self._overall_metrics.run_overlapping()
+            metrics.run_overlapping()
+        self._running[event.id] = running + 1
+        return True
+
+    def _finish_run(self, event, metrics):
+        """ Keep track of a finished run, launching the next one if due """
+        with self._events_lock:
+            running = self._running.pop(event.id, 1) - 1
+            if running:
+                self._running[event.id] = running
+            if event.id not in self._events:
+                return
+            next_event = self._queued_runs.pop(event.id, None)
+            if next_event is not None:
+                self._running[event.id] = running + 1
+            elif event.overrun_policy is OverrunPolicy.delay_next:
+                self._queue_event(event._replace(
+                    time=self._get_time() + event.frequency))
+        if next_event is not None:
+            self._launch([(next_event, metrics)])
+
+    def _launch(self, runs):
+        """ Launch runs of events, to be executed one after the other
+
+        Runs are executed from another thread thus making scheduler
+        independent from their duration
+
+        Args:
+            runs (list): (event, metrics) of each run
+        """
+        try:
+            self.logger.debug("Executing: {0}".format(
+                [event.target for (event, _) in runs]))
+            self._submit(self._run_events, runs)
+        except Exception:
+            self.logger.exception('Calling: {0}'.format(
+                [event.target for (event, _) in runs]))
+            for (event, metrics) in runs:
+                self._finish_run(event, metrics)
+
+    def _submit(self, target, *args):
+        """ Have a worker execute a target """
+        self._workers.submit(target, *args)
+
+    def _run_events(self, runs):
+        if len(runs) == 1:
+            self._run_event(*runs[0])
+            return
+        for (event, metrics) in runs:
+            try:
+                self._run_event(event, metrics)
+            except Exception:
+                self.logger.exception(
+                    'Calling: {0}'.format(event.target))
+
+    def _run_event(self, event, metrics):
+        """ Execute the target of an event, recording its metrics """
+        start = self._get_time()
+        self._overall_metrics.run_started(start - event.time)
+        if metrics is not None:
+            metrics.run_started(start - event.time)
+        try:
+            event.target(*event.args, **event.kwargs)
+        finally:
+            run_time = self._get_time() - start
+            self._overall_metrics.run_finished(run_time)
+            if metrics is not None:
+                metrics.run_finished(run_time)
+            self._finish_run(event, metrics)
 
     def _get_time(self):
         """ Time retrieval method to use when comparing against event time
@@ -0,0 +1,148 @@
+import asyncio
+from datetime import timedelta
+from threading import current_thread, Event
+from time import sleep
+
+from nio.modules.context import ModuleContext
+from nio.modules.module import ModuleNotInitialized
+from nio.modules.scheduler.job import Job, OverrunPolicy
+from nio.testing.test_case import NIOTestCaseNoModules
+from nio.util.scheduler.async_module import AsyncSchedulerModule
+from nio.util.scheduler.async_scheduler import AsyncSchedulerRunner
+
+
+class TestAsyncScheduler(NIOTestCaseNoModules):
+
+    def setUp(self):
+        super().setUp()
+        self._scheduler = AsyncSchedulerRunner()
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        ctx.workers_name = "TestAsync"
+        self._scheduler.do_configure(ctx)
+        self._scheduler.do_start()
+
+    def tearDown(self):
+        self._scheduler.do_stop()
+        super().tearDown()
+
+    def test_sync_target(self):
+        """ Sync targets are executed by worker threads """
+        executed = Event()
+        threads = []
+
+        def target(value, key=None):
+            threads.append((current_thread().name, value, key))
+            executed.set()
+
+        self._scheduler.schedule_task(
+            target, timedelta(seconds=0.02), False, 1, key=2)
+        self.assertTrue(executed.wait(1))
+        self.assertEqual(threads, [("TestAsync-1", 1, 2)])
+        # one time tasks are done once executed
+        self.assertEqual(self._scheduler.metrics()["jobs"], 0)
+
+    def test_coroutine_target(self):
+        """ Coroutine targets are awaited in the event loop """
+        executed = Event()
+        threads = []
+
+        async def target(value):
+            await asyncio.sleep(0.01)
+            threads.append((current_thread().name, value))
+            executed.set()
+
+        self._scheduler.schedule_task(
+            target, timedelta(seconds=0.02), False, 1)
+        self.assertTrue(executed.wait(1))
+        self.assertEqual(threads, [("TestAsync-loop", 1)])
+        self.assertEqual(
+            self._scheduler.metrics()["workers"]["workers"], 0)
+
+    def test_repeatable(self):
+        """ Repeatable tasks run until cancelled """
+        runs = []
+
+        async def target():
+            runs.append(1)
+
+        job = self._scheduler.schedule_task(
+            target, timedelta(seconds=0.02), True)
+        sleep(0.15)
+        self.assertTrue(self._scheduler.unschedule(job))
+        count = len(runs)
+        self.assertGreaterEqual(count, 4)
+        sleep(0.1)
+        self.assertEqual(len(runs), count)
+        # cancelling again fails
+        self.assertFalse(self._scheduler.unschedule(job))
+
+    def test_cancel_before_run(self):
+        executed = Event()
+        job = self._scheduler.schedule_task(
+            executed.set, timedelta(seconds=0.05), False)
+        self.assertTrue(self._scheduler.unschedule(job))
+        self.assertFalse(executed.wait(0.15))
+
+    def test_overrun_skip(self):
+        """ Overrun policies apply to repeatable tasks """
+        runs = []
+
+        async def target():
+            runs.append(1)
+            await asyncio.sleep(0.1)
+
+        job = self._scheduler.schedule_task(
+            target, timedelta(seconds=0.02), True,
+            overrun_policy=OverrunPolicy.skip)
+        sleep(0.15)
+        metrics = self._scheduler.job_metrics(job)
+        self._scheduler.unschedule(job)
+        self.assertLessEqual(len(runs), 2)
+        self.assertGreater(metrics["skipped"], 0)
+        self.assertEqual(metrics["overlapping"], 0)
+
+    def test_failing_target(self):
+        """ A failing target does not stop a repeatable task """
+        runs = []
+
+        def target():
+            runs.append(1)
+            raise RuntimeError("failing")
+
+        job = self._scheduler.schedule_task(
+            target, timedelta(seconds=0.02), True)
+        sleep(0.1)
+        self._scheduler.unschedule(job)
+        self.assertGreaterEqual(len(runs), 2)
+
+    def test_not_started(self):
+        scheduler = AsyncSchedulerRunner()
+        with self.assertRaises(ModuleNotInitialized):
+            scheduler.schedule_task(print, timedelta(seconds=1), False)
+        with self.assertRaises(AttributeError):
+            self._scheduler.schedule_task(print, 1, False)
+        # stopping a scheduler that never started is harmless
+        scheduler.stop()
+
+
+class TestAsyncSchedulerModule(NIOTestCaseNoModules):
+
+    def test_job(self):
+        """ Jobs are proxied to the asyncio scheduler """
+        module = AsyncSchedulerModule()
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        module.initialize(ctx)
+        try:
+            executed = Event()
+
+            async def target():
+                executed.set()
+
+            job = Job(target, timedelta(seconds=0.02), True)
+            self.assertTrue(executed.wait(1))
+            self.assertGreater(job.metrics()["lateness"]["count"], 0)
+            job.cancel()
+        finally:
+            module.finalize()
@@ -1,6 +1,8 @@
 from datetime import timedelta
+from unittest.mock import patch
 
-from nio.modules.scheduler.job import Job
+from nio.modules.scheduler.job import Job, OverrunPolicy
+from nio.testing.modules.scheduler.scheduler import JumpAheadScheduler
 from nio.testing.condition import ensure_condition
 from nio.testing.test_case import NIOTestCase
 
@@ -65,5 +67,15 @@ class TestJob(NIOTestCase):
         self.job.jump_ahead(2.5)
         self.assertEqual(self.dummy.foo_called, 0)
 
+    def test_overrun_policy_forwarding(self):
+        """ Only non default overrun policies reach the implementation """
+        with patch.object(JumpAheadScheduler, "schedule_task") as schedule:
+            Job(self.dummy.foo, timedelta(seconds=1), True)
+            self.assertNotIn("overrun_policy", schedule.call_args[1])
+            Job(self.dummy.foo, timedelta(seconds=1), True,
+                overrun_policy=OverrunPolicy.skip)
+            self.assertEqual(schedule.call_args[1]["overrun_policy"],
+                             OverrunPolicy.skip)
+
     def _foo_called(self, times):
         return self.dummy.foo_called == times
@@ -0,0 +1,110 @@
+from datetime import timedelta
+from threading import Event, current_thread
+
+from nio.modules.context import ModuleContext
+from nio.testing.condition import ensure_condition
+from nio.testing.modules.scheduler.scheduler import JumpAheadSchedulerRunner
+from nio.testing.test_case import NIOTestCaseNoModules
+from nio.util.scheduler.metrics import Histogram
+from nio.util.scheduler.scheduler import SchedulerRunner
+
+
+class TestHistogram(NIOTestCaseNoModules):
+
+    def test_buckets(self):
+        """ Values are counted in the bucket of their upper bound """
+        histogram = Histogram((1, 5))
+        for value in (0.5, 1, 3, 10):
+            histogram.record(value)
+        self.assertDictEqual(histogram.to_dict(), {
+            "count": 4,
+            "sum": 14.5,
+            "max": 10,
+            "buckets": {"1": 2, "5": 1, "inf": 1},
+        })
+
+
+class TestSchedulerMetrics(NIOTestCaseNoModules):
+
+    def setUp(self):
+        super().setUp()
+        self._scheduler = JumpAheadSchedulerRunner()
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        ctx.resolution = 0.01
+        self._scheduler.do_configure(ctx)
+        self._scheduler.do_start()
+        self._runs = 0
+
+    def tearDown(self):
+        self._scheduler.do_stop()
+        super().tearDown()
+
+    def _run(self):
+        self._runs += 1
+
+    def test_job_metrics(self):
+        """ Lateness and run time of every run are recorded """
+        job = self._scheduler.schedule_task(
+            self._run, timedelta(seconds=1), True)
+        job_metrics = self._scheduler.job_metrics(job)
+        self.assertEqual(job_metrics["lateness"]["count"], 0)
+        self._scheduler.jump_ahead(1.5)
+        self._scheduler.jump_ahead(1)
+        ensure_condition(lambda: self._scheduler.job_metrics(job)[
+            "run_time"]["count"] == 2)
+        job_metrics = self._scheduler.job_metrics(job)
+        self.assertEqual(job_metrics["lateness"]["count"], 2)
+        self.assertEqual(job_metrics["run_time"]["count"], 2)
+        # runs started around half a second late
+        self.assertGreaterEqual(job_metrics["lateness"]["max"], 0.5)
+        self.assertEqual(job_metrics["lateness"]["buckets"]["0.5"], 0)
+        self.assertEqual(self._scheduler.metrics()["run_time"]["count"], 2)
+        self.assertEqual(self._scheduler.metrics()["jobs"], 1)
+        # metrics are dropped with the job
+        self._scheduler.unschedule(job)
+        self.assertIsNone(self._scheduler.job_metrics(job))
+        self.assertEqual(self._scheduler.metrics()["jobs"], 0)
+
+
+class TestWorkerPool(NIOTestCaseNoModules):
+
+    def setUp(self):
+        super().setUp()
+        self._scheduler = SchedulerRunner()
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        ctx.resolution = 0.01
+        ctx.max_workers = 2
+        ctx.workers_name = "TestWorkers"
+        self._scheduler.do_configure(ctx)
+        self._scheduler.do_start()
+
+    def tearDown(self):
+        self._scheduler.do_stop()
+        super().tearDown()
+
+    def test_worker_pool(self):
+        """ Jobs are executed by the bounded worker pool """
+        release = Event()
+        thread_names = []
+
+        def target():
+            thread_names.append(current_thread().name)
+            release.wait(1)
+
+        for _ in range(3):
+            self._scheduler.schedule_task(
+                target, timedelta(seconds=0.01), False)
+        ensure_condition(
+            lambda: self._scheduler.metrics()["workers"]["busy"] == 2 and
+            self._scheduler.metrics()["workers"]["queued"] == 1)
+        workers = self._scheduler.metrics()["workers"]
+        self.assertEqual(workers["name"], "TestWorkers")
+        self.assertEqual(workers["busy"], 2)
+        self.assertEqual(workers["queued"], 1)
+        release.set()
+        ensure_condition(lambda: len(thread_names) == 3)
+        self.assertEqual(len(thread_names), 3)
+        self.assertTrue(all(name.startswith("TestWorkers-")
+                            for name in thread_names))
@@ -0,0 +1,115 @@
+from datetime import timedelta
+from threading import Event, Lock
+
+from nio.modules.context import ModuleContext
+from nio.modules.scheduler.job import OverrunPolicy
+from nio.testing.condition import ensure_condition
+from nio.testing.modules.scheduler.scheduler import JumpAheadSchedulerRunner
+from nio.testing.test_case import NIOTestCaseNoModules
+
+
+class TestOverrunPolicies(NIOTestCaseNoModules):
+
+    def setUp(self):
+        super().setUp()
+        self._scheduler = JumpAheadSchedulerRunner()
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        ctx.resolution = 0.01
+        self._scheduler.do_configure(ctx)
+        self._scheduler.do_start()
+        self._release = Event()
+        self._lock = Lock()
+        self._started = 0
+        self._running = 0
+        self._max_running = 0
+
+    def tearDown(self):
+        self._release.set()
+        self._scheduler.do_stop()
+        super().tearDown()
+
+    def _target(self):
+        with self._lock:
+            self._started += 1
+            self._running += 1
+            self._max_running = max(self._max_running, self._running)
+        self._release.wait(1)
+        with self._lock:
+            self._running -= 1
+
+    def _schedule(self, policy):
+        return self._scheduler.schedule_task(
+            self._target, timedelta(seconds=1), True,
+            overrun_policy=policy)
+
+    def _jump(self, times):
+        for _ in range(times):
+            self._scheduler.jump_ahead(1)
+
+    def test_allow_concurrent(self):
+        """ Runs due while running start along with the running one """
+        job = self._schedule(OverrunPolicy.allow_concurrent)
+        self._jump(3)
+        ensure_condition(lambda: self._started == 3)
+        self.assertEqual(self._max_running, 3)
+        self.assertEqual(self._scheduler.job_metrics(job)["overlapping"], 2)
+
+    def test_skip(self):
+        """ Runs due while running are skipped """
+        job = self._schedule("skip")
+        self._jump(3)
+        ensure_condition(lambda: self._started == 1)
+        self.assertEqual(self._started, 1)
+        metrics = self._scheduler.job_metrics(job)
+        self.assertEqual(metrics["skipped"], 2)
+        self.assertEqual(metrics["overlapping"], 0)
+        # runs start again once the running one finishes
+        self._release.set()
+        ensure_condition(lambda: not self._scheduler._running)
+        self._jump(1)
+        ensure_condition(lambda: self._started == 2)
+        self.assertEqual(self._started, 2)
+
+    def test_queue_one(self):
+        """ One run due while running starts once the running one ends """
+        job = self._schedule(OverrunPolicy.queue_one)
+        self._jump(3)
+        ensure_condition(lambda: self._started == 1)
+        metrics = self._scheduler.job_metrics(job)
+        self.assertEqual(metrics["queued"], 1)
+        self.assertEqual(metrics["skipped"], 1)
+        self._release.set()
+        ensure_condition(lambda: self._started == 2)
+        ensure_condition(lambda: not self._scheduler._running)
+        self.assertEqual(self._started, 2)
+        self.assertEqual(self._max_running, 1)
+
+    def test_delay_next(self):
+        """ Runs are scheduled an interval after the previous one ends """
+        job = self._schedule(OverrunPolicy.delay_next)
+        self._jump(3)
+        ensure_condition(lambda: self._started == 1)
+        self.assertEqual(self._started, 1)
+        self._release.set()
+        ensure_condition(lambda: not self._scheduler._running)
+        # the next run is an interval after the previous one finished
+        self._scheduler.jump_ahead(0.5)
+        self.assertEqual(self._started, 1)
+        self._scheduler.jump_ahead(0.6)
+        ensure_condition(lambda: self._started == 2)
+        self.assertEqual(self._started, 2)
+        metrics = self._scheduler.job_metrics(job)
+        self.assertEqual(metrics["skipped"], 0)
+        self.assertEqual(metrics["overlapping"], 0)
+
+    def test_cancel_queued_run(self):
+        """ Queued runs of a cancelled job are not executed """
+        job = self._schedule(OverrunPolicy.queue_one)
+        self._jump(2)
+        ensure_condition(lambda: self._started == 1)
+        self._scheduler.unschedule(job)
+        self._release.set()
+        ensure_condition(lambda: not self._scheduler._running)
+        self.assertEqual(self._started, 1)
+        self.assertEqual(self._scheduler._running, {})
@@ -14,14 +14,17 @@ class TestScheduler(NIOTestCaseNoModules):
     def setUp(self):
         super().setUp()
         self._scheduler = JumpAheadSchedulerRunner()
-        ctx = ModuleContext()
-        ctx.min_interval = 0.01
-        ctx.resolution = 0.01
-        self._scheduler.do_configure(ctx)
+        self._scheduler.do_configure(self.get_context())
         self._scheduler.do_start()
         self._fired_times_lock = RLock()
         self._fired_times = 0
 
+    def get_context(self):
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        ctx.resolution = 0.01
+        return ctx
+
     def tearDown(self):
         self._scheduler.do_stop()
         super().tearDown()
@@ -54,6 +54,36 @@ class TestSchedulerCleanUp(NIOTestCase):
     def _callback(self):
         pass
 
+    def test_cancelled_events_compaction(self):
+        """ Asserts that cancelled events are skipped and compacted.
+
+        Cancelled events stay in the queue until they make up most of it
+        """
+        scheduler = JumpAheadScheduler
+        self._runs = 0
+        jobs = [Job(self._count_run, timedelta(seconds=1), False)
+                for _ in range(10)]
+        for job in jobs[:5]:
+            job.cancel()
+        with scheduler._queue_lock:
+            self.assertEqual(len(scheduler._queue), 10)
+            self.assertEqual(len(scheduler._queue._cancelled), 5)
+        # one more cancellation and cancelled events are most of the queue
+        jobs[5].cancel()
+        with scheduler._queue_lock:
+            self.assertEqual(len(scheduler._queue), 4)
+            self.assertEqual(len(scheduler._queue._cancelled), 0)
+        jobs[6].cancel()
+        jobs[0].jump_ahead(1.5)
+        ensure_condition(lambda: self._runs == 3)
+        self.assertEqual(self._runs, 3)
+        with scheduler._queue_lock:
+            self.assertEqual(len(scheduler._queue), 0)
+            self.assertEqual(len(scheduler._queue._cancelled), 0)
+
+    def _count_run(self):
+        self._runs += 1
+
     def test_scheduler_cancel_from_callback(self):
         """ Asserts that scheduler accepts callbacks that cancel jobs.
 
@@ -0,0 +1,116 @@
+from datetime import timedelta
+from threading import current_thread
+
+from nio.modules.context import ModuleContext
+from nio.testing.condition import ensure_condition
+from nio.testing.modules.scheduler.scheduler import JumpAheadSchedulerRunner
+from nio.testing.test_case import NIOTestCaseNoModules
+from nio.util.scheduler.tick_group import TickGroup
+
+
+class TestTickGroup(NIOTestCaseNoModules):
+
+    def test_first_tick(self):
+        """ Ticks are aligned to the frequency and shifted by the phase """
+        group = TickGroup(1, 0.25)
+        self.assertEqual(group.first_tick(0), 0.25)
+        self.assertEqual(group.first_tick(3.1), 3.25)
+        self.assertEqual(group.first_tick(3.25), 3.25)
+        self.assertEqual(group.first_tick(3.3), 4.25)
+
+
+class CoalescingTestCase(NIOTestCaseNoModules):
+
+    phases = 1
+
+    def setUp(self):
+        super().setUp()
+        self._scheduler = JumpAheadSchedulerRunner()
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        ctx.resolution = 0.01
+        ctx.coalesce = True
+        ctx.coalesce_phases = self.phases
+        self._scheduler.do_configure(ctx)
+        self._scheduler.do_start()
+        # ticks are aligned to the clock, start right before a tick of
+        # every frequency used
+        self._scheduler.jump_ahead(
+            (4 - self._scheduler._get_time() % 4 - 0.05) % 4)
+        self._runs = []
+
+    def tearDown(self):
+        self._scheduler.do_stop()
+        super().tearDown()
+
+    def _run(self, name):
+        self._runs.append((name, current_thread().name))
+
+
+class TestCoalescing(CoalescingTestCase):
+
+    def test_coalesced(self):
+        """ Jobs sharing a frequency run together in one thread """
+        jobs = [self._scheduler.schedule_task(
+            self._run, timedelta(seconds=1), True, i) for i in range(10)]
+        other_job = self._scheduler.schedule_task(
+            self._run, timedelta(seconds=2), True, "other")
+        # a single queued event per frequency
+        self.assertEqual(len(self._scheduler._queue), 2)
+        self.assertEqual(len(self._scheduler._events), 11)
+        self._scheduler.jump_ahead(2.5)
+        ensure_condition(lambda: len(self._runs) == 21)
+        self.assertEqual(len(self._runs), 21)
+        # every tick of the group ran in a single thread
+        threads = {thread for (name, thread) in self._runs
+                   if name != "other"}
+        self.assertEqual(len(threads), 2)
+        self.assertEqual(
+            self._scheduler.job_metrics(jobs[0])["run_time"]["count"], 2)
+        self._scheduler.unschedule(other_job)
+        for job in jobs[1:]:
+            self.assertTrue(self._scheduler.unschedule(job))
+        self._runs.clear()
+        self._scheduler.jump_ahead(1)
+        ensure_condition(lambda: len(self._runs) == 1)
+        self.assertEqual(self._runs[0][0], 0)
+        # the group is dropped once it has no members
+        self._scheduler.unschedule(jobs[0])
+        self._scheduler.jump_ahead(2)
+        self.assertEqual(len(self._scheduler._queue), 0)
+        self.assertEqual(self._scheduler._tick_groups, {})
+        self.assertEqual(self._scheduler._tick_group_ids, {})
+
+    def test_first_run_not_early(self):
+        """ Jobs joining a group first run once their interval elapses """
+        self._scheduler.schedule_task(
+            self._run, timedelta(seconds=1), True, "first")
+        self._scheduler.jump_ahead(0.5)
+        self._scheduler.schedule_task(
+            self._run, timedelta(seconds=1), True, "second")
+        # the group ticks before the second job interval elapsed
+        self._scheduler.jump_ahead(0.7)
+        ensure_condition(lambda: len(self._runs) == 1)
+        self.assertEqual([name for (name, _) in self._runs], ["first"])
+        self._scheduler.jump_ahead(1)
+        ensure_condition(lambda: len(self._runs) == 3)
+        self.assertEqual([name for (name, _) in self._runs],
+                         ["first", "first", "second"])
+
+
+class TestCoalescingPhases(CoalescingTestCase):
+
+    phases = 4
+
+    def test_coalesced(self):
+        """ Jobs sharing a frequency are spread in phases """
+        for i in range(40):
+            self._scheduler.schedule_task(
+                self._run, timedelta(seconds=1), True, i)
+        self.assertEqual(len(self._scheduler._queue), 4)
+        phases = sorted(phase for (_, phase) in self._scheduler._tick_groups)
+        self.assertEqual(phases, [0, 0.25, 0.5, 0.75])
+        self._scheduler.jump_ahead(2)
+        ensure_condition(lambda: len(self._runs) == 40)
+        self.assertEqual(len(self._runs), 40)
+        self.assertEqual(len({thread for (_, thread) in self._runs}), 4)
@@ -0,0 +1,88 @@
+from collections import namedtuple
+
+import nio.util.scheduler.tests.test_scheduler as scheduler_tests
+from nio.testing.test_case import NIOTestCaseNoModules
+from nio.util.scheduler.timing_wheel import TimingWheel
+
+Event = namedtuple('Event', 'time, id')
+
+
+class TestTimingWheel(NIOTestCaseNoModules):
+
+    def _pop_all(self, wheel, now):
+        events = []
+        event = wheel.pop_due(now)
+        while event is not None:
+            events.append(event)
+            event = wheel.pop_due(now)
+        return [event.id for event in events]
+
+    def test_due_in_order(self):
+        """ Events are due once their tick is reached, in time order """
+        wheel = TimingWheel(1, 0, slots=4, levels=2)
+        for (time, id) in ((2.5, "c"), (1, "a"), (2.2, "b"), (30, "d")):
+            wheel.push(Event(time, id))
+        self.assertEqual(len(wheel), 4)
+        self.assertEqual(self._pop_all(wheel, 0.9), [])
+        self.assertEqual(self._pop_all(wheel, 1), ["a"])
+        # events are not due before their time
+        self.assertEqual(self._pop_all(wheel, 2.9), [])
+        self.assertEqual(self._pop_all(wheel, 3), ["b", "c"])
+        self.assertEqual(self._pop_all(wheel, 29), [])
+        self.assertEqual(self._pop_all(wheel, 30), ["d"])
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_time())
+
+    def test_cascades(self):
+        """ Events in outer wheels and overflow are due at their tick """
+        wheel = TimingWheel(1, 0, slots=4, levels=2)
+        times = [3, 4, 5, 15, 16, 17, 63, 64, 100, 1000]
+        for time in times:
+            wheel.push(Event(time, time))
+        due = []
+        for now in range(1001):
+            popped = self._pop_all(wheel, now)
+            self.assertTrue(all(time == now for time in popped))
+            due.extend(popped)
+        self.assertEqual(due, times)
+
+    def test_jump(self):
+        """ Moving far ahead at once makes every passed event due """
+        wheel = TimingWheel(0.01, 0)
+        for time in range(1, 100):
+            wheel.push(Event(time * 37.3, time))
+        self.assertEqual(self._pop_all(wheel, 37.3 * 50 + 0.01), list(range(1, 51)))
+        self.assertEqual(self._pop_all(wheel, 10 ** 6), list(range(51, 100)))
+
+    def test_discard(self):
+        """ Cancelled events are never due """
+        wheel = TimingWheel(1, 0, slots=4, levels=2)
+        events = [Event(time, time) for time in (1, 2, 50)]
+        for event in events:
+            wheel.push(event)
+        wheel.discard(events[2])
+        self.assertEqual(self._pop_all(wheel, 0), [])
+        # a due event can be cancelled before it is popped
+        self.assertEqual(wheel.next_time(), 1)
+        wheel._advance(5)
+        wheel.discard(events[0])
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(self._pop_all(wheel, 100), [2])
+        self.assertEqual(len(wheel), 0)
+
+
+class TestTimingWheelScheduler(scheduler_tests.TestScheduler):
+
+    """ Runs the scheduler tests with the timing wheel backend """
+
+    def get_context(self):
+        ctx = super().get_context()
+        ctx.backend = "timing_wheel"
+        return ctx
+
+    def test_timing_wheel_backend(self):
+        self.assertIsInstance(self._scheduler._queue, TimingWheel)
+
+    def test_invalid_cancel(self):
+        """ Asserts that trying to cancel an invalid job returns False """
+        self.assertFalse(self._scheduler.unschedule("invalid_id"))
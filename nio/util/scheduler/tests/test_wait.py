@@ -0,0 +1,62 @@
+from datetime import timedelta
+from threading import Event
+from time import monotonic
+
+from nio.modules.context import ModuleContext
+from nio.testing.test_case import NIOTestCaseNoModules
+from nio.util.scheduler.scheduler import SchedulerRunner
+
+
+class TestSchedulerWait(NIOTestCaseNoModules):
+
+    def setUp(self):
+        super().setUp()
+        self._scheduler = SchedulerRunner()
+        ctx = ModuleContext()
+        ctx.min_interval = 0.01
+        ctx.resolution = 0.1
+        self._scheduler.do_configure(ctx)
+        self._scheduler.do_start()
+
+    def tearDown(self):
+        self._scheduler.do_stop()
+        super().tearDown()
+
+    def test_wait_until_next_event(self):
+        """ The scheduler waits exactly until the next event is due """
+        # nothing to wait for until a task is scheduled
+        self.assertIsNone(self._scheduler._execute_pending_tasks())
+        self._scheduler.schedule_task(
+            self._fail, timedelta(minutes=10), False)
+        wait = self._scheduler._execute_pending_tasks()
+        # well beyond the resolution, and the event is still queued
+        self.assertGreater(wait, 599)
+        self.assertLessEqual(wait, 600)
+        self.assertEqual(len(self._scheduler._queue), 1)
+
+    def test_earlier_task_interrupts_wait(self):
+        """ Scheduling an earlier task wakes up the scheduler """
+        self._scheduler.schedule_task(
+            self._fail, timedelta(minutes=10), False)
+        executed = Event()
+        start = monotonic()
+        self._scheduler.schedule_task(
+            executed.set, timedelta(seconds=0.05), False)
+        self.assertTrue(executed.wait(1))
+        elapsed = monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.05)
+        # not delayed to the resolution or to the later task
+        self.assertLess(elapsed, 0.5)
+
+    def test_stop_interrupts_wait(self):
+        """ Stopping the scheduler wakes it up right away """
+        self._scheduler.schedule_task(
+            self._fail, timedelta(minutes=10), False)
+        start = monotonic()
+        self._scheduler.do_stop()
+        self.assertFalse(self._scheduler._process_events_thread.is_alive())
+        self.assertLess(monotonic() - start, 0.5)
+        self._scheduler.do_start()
+
+    def _fail(self):
+        raise AssertionError("should not run")
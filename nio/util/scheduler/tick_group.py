@@ -0,0 +1,29 @@
+from collections import OrderedDict
+from uuid import uuid4
+
+
+class TickGroup(object):
+
+    """ Repeatable jobs sharing a frequency, run together on each tick
+
+    The group is queued in the scheduler as a single event, ticking at
+    times aligned to its frequency and shifted by its phase. On every tick
+    the members that are due are run one after the other by one worker.
+
+    Args:
+        frequency (float): seconds between ticks
+        phase (float): seconds ticks are shifted by from the frequency
+            multiples
+    """
+
+    def __init__(self, frequency, phase):
+        self.id = uuid4().hex
+        self.frequency = frequency
+        self.phase = phase
+        # member job events indexed by job id
+        self.members = OrderedDict()
+
+    def first_tick(self, time):
+        """ Get the first tick of the group at or after a time """
+        ticks = -((self.phase - time) // self.frequency)
+        return self.phase + ticks * self.frequency
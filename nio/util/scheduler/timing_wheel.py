@@ -0,0 +1,181 @@
+import heapq
+from math import ceil, floor
+
+
+class TimingWheel(object):
+
+    """ Scheduler events kept in a hierarchical timing wheel
+
+    Time is divided in ticks. Events are placed in the slot of the tick they
+    expire at in the first wheel when expiring within a turn of it, or in a
+    slot of the next wheels covering longer spans of time, or in an overflow
+    slot when too far in the future. As time moves forward the slots of the
+    next wheels are moved down to the first one, and events in its slots
+    become due when their tick is reached.
+
+    Placing and cancelling an event costs O(1) no matter how many events
+    there are, which suits large numbers of short lived timers better than
+    a heap. Events are never due before their time but can be up to a tick
+    late.
+
+    Args:
+        tick (float): seconds per tick
+        now (float): current time
+        slots (int): number of slots of every wheel
+        levels (int): number of wheels
+    """
+
+    def __init__(self, tick, now, slots=64, levels=4):
+        self.tick = tick
+        self._slots = slots
+        self._levels = levels
+        # ticks spanned by a slot of each wheel, and by the overflow slot
+        self._spans = [slots ** level for level in range(levels + 1)]
+        # the overflow slot is kept as the last level
+        self._wheels = [[{} for _ in range(slots)] for _ in range(levels)]
+        self._wheels.append([{}])
+        self._counts = [0] * (levels + 1)
+        # event id to the slot holding it
+        self._locations = {}
+        self._current = floor(now / tick)
+        # events whose tick was reached, ordered by time
+        self._due = []
+        self._due_ids = set()
+        # ids of the cancelled events still in the due events
+        self._cancelled = set()
+
+    def __len__(self):
+        return sum(self._counts) + len(self._due) - len(self._cancelled)
+
+    def push(self, event):
+        self._place(event, ceil(event.time / self.tick))
+
+    def peek(self):
+        """ Get the next due event without removing it
+
+        Returns:
+            the due event with the earliest time, None if no event is due as
+                of the last time the wheel moved forward
+        """
+        while self._due:
+            event = self._due[0]
+            if event.id not in self._cancelled:
+                return event
+            heapq.heappop(self._due)
+            self._due_ids.discard(event.id)
+            self._cancelled.discard(event.id)
+        return None
+
+    def pop_due(self, now):
+        """ Remove and get the next event if its tick was reached
+
+        Args:
+            now (float): current time
+
+        Returns:
+            the earliest due event, None if no event is due
+        """
+        self._advance(floor(now / self.tick))
+        event = self.peek()
+        if event is None:
+            return None
+        heapq.heappop(self._due)
+        self._due_ids.discard(event.id)
+        return event
+
+    def next_time(self):
+        """ Get the earliest time an event could be due at
+
+        Returns:
+            the time of the next due event, or of the next tick if there
+                are events not yet due, None if there are no events
+        """
+        event = self.peek()
+        if event is not None:
+            return event.time
+        if not self._locations:
+            return None
+        return (self._current + 1) * self.tick
+
+    def discard(self, event):
+        """ Cancel an event """
+        location = self._locations.pop(event.id, None)
+        if location is not None:
+            level, slot = location
+            del slot[event.id]
+            self._counts[level] -= 1
+        elif event.id in self._due_ids:
+            self._cancelled.add(event.id)
+
+    def clear(self):
+        for wheel in self._wheels:
+            for slot in wheel:
+                slot.clear()
+        self._counts = [0] * (self._levels + 1)
+        self._locations.clear()
+        self._due[:] = []
+        self._due_ids.clear()
+        self._cancelled.clear()
+
+    def _place(self, event, event_tick):
+        """ Place an event in the slot of the tick it expires at """
+        ticks = event_tick - self._current
+        if ticks <= 0:
+            heapq.heappush(self._due, event)
+            self._due_ids.add(event.id)
+            return
+        for level in range(self._levels):
+            if ticks < self._spans[level + 1]:
+                slot = self._wheels[level][
+                    (event_tick // self._spans[level]) % self._slots]
+                break
+        else:
+            level = self._levels
+            slot = self._wheels[level][0]
+        slot[event.id] = event
+        self._counts[level] += 1
+        self._locations[event.id] = (level, slot)
+
+    def _advance(self, target_tick):
+        """ Move the wheel forward up to a tick, collecting due events """
+        while self._current < target_tick:
+            if not self._locations:
+                self._current = target_tick
+                return
+            # no tick needs processing until the slots of the first wheel
+            # holding events move down
+            level = next(level for (level, count) in enumerate(self._counts)
+                         if count)
+            if level == 0:
+                self._current += 1
+            else:
+                span = self._spans[level]
+                self._current = min(
+                    target_tick, (self._current // span + 1) * span)
+            self._process_tick()
+
+    def _process_tick(self):
+        current = self._current
+        # move down the slots of the next wheels starting a new turn, from
+        # the outermost one so that its events can move further down
+        for level in range(self._levels, 0, -1):
+            if current % self._spans[level]:
+                continue
+            if level == self._levels:
+                slot = self._wheels[level][0]
+            else:
+                slot = self._wheels[level][
+                    (current // self._spans[level]) % self._slots]
+            self._cascade(level, slot)
+        self._cascade(0, self._wheels[0][current % self._slots])
+
+    def _cascade(self, level, slot):
+        """ Place again the events of a slot as of the current tick """
+        if not slot:
+            return
+        events = list(slot.values())
+        slot.clear()
+        self._counts[level] -= len(events)
+        for event in events:
+            del self._locations[event.id]
+            self._place(event, ceil(event.time / self.tick))
@@ -1 +1,2 @@
 from nio.util.threading.spawn import spawn
+from nio.util.threading.pool import PoolFuture, ThreadPool
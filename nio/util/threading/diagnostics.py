@@ -0,0 +1,125 @@
+import sys
+import time
+import traceback
+from collections import Counter
+from os.path import basename
+from threading import current_thread, enumerate as enumerate_threads, \
+    get_ident
+
+
+def thread_cpu_time(thread):
+    """ CPU time used by a thread
+
+    time.thread_time only measures the calling thread, the CPU clock of
+    other threads is read through their pthread id where available.
+
+    Args:
+        thread (Thread): a live thread
+
+    Returns:
+        float: seconds of CPU time, None if not available
+    """
+    if thread is current_thread():
+        return time.thread_time()
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(thread.ident))
+    except (AttributeError, OSError, TypeError):
+        return None
+
+
+def thread_diagnostics(interval=0):
+    """ Describe the live threads of the process
+
+    Args:
+        interval (float): seconds to sample CPU time over to report the CPU
+            usage of every thread, no sampling when 0
+
+    Returns:
+        list: a dict per thread with its name, ident, daemon flag, target,
+            age in seconds, CPU time and usage, and current stack
+    """
+    threads = enumerate_threads()
+    cpu_times = {thread.ident: thread_cpu_time(thread) for thread in threads}
+    cpu_usages = {}
+    if interval > 0:
+        time.sleep(interval)
+        for thread in threads:
+            before = cpu_times[thread.ident]
+            after = thread_cpu_time(thread)
+            if before is not None and after is not None:
+                cpu_usages[thread.ident] = (after - before) / interval
+                cpu_times[thread.ident] = after
+    frames = sys._current_frames()
+    now = time.monotonic()
+    diagnostics = []
+    for thread in threads:
+        started_at = getattr(thread, "started_at", None)
+        frame = frames.get(thread.ident)
+        diagnostics.append({
+            "name": thread.name,
+            "ident": thread.ident,
+            "daemon": thread.daemon,
+            "target": _target_name(thread),
+            "age": now - started_at if started_at is not None else None,
+            "cpu_time": cpu_times[thread.ident],
+            "cpu_usage": cpu_usages.get(thread.ident),
+            "stack": [line.rstrip() for line in
+                      traceback.format_stack(frame)] if frame else [],
+        })
+    return diagnostics
+
+
+def profile(duration, interval=0.01):
+    """ Sample the stacks of every thread for a while
+
+    Stacks are aggregated in collapsed stack format, one line per distinct
+    stack with its frames from the thread down to the innermost function
+    separated by semicolons, followed by the number of samples it was seen
+    in. This is the input flamegraph tools expect.
+
+    Args:
+        duration (float): seconds to sample for
+        interval (float): seconds between samples
+
+    Returns:
+        dict: number of samples taken and collapsed stacks, most frequent
+            first
+    """
+    stacks = Counter()
+    samples = 0
+    # the sampling thread is left out
+    sampler = get_ident()
+    end = time.monotonic() + duration
+    while True:
+        names = {thread.ident: thread.name for thread in enumerate_threads()}
+        for (ident, frame) in sys._current_frames().items():
+            if ident != sampler:
+                stacks[_collapse(names.get(ident, ident), frame)] += 1
+        samples += 1
+        if time.monotonic() >= end:
+            break
+        time.sleep(interval)
+    return {
+        "samples": samples,
+        "collapsed": "\n".join(
+            "{} {}".format(stack, count)
+            for (stack, count) in stacks.most_common()),
+    }
+
+
+def _collapse(thread_name, frame):
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append("{} ({})".format(
+            code.co_name, basename(code.co_filename)))
+        frame = frame.f_back
+    frames.append(str(thread_name))
+    return ";".join(reversed(frames))
+
+
+def _target_name(thread):
+    target = getattr(thread, "_target", None)
+    if target is None:
+        return None
+    return getattr(target, "__qualname__", repr(target))
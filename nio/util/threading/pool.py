@@ -0,0 +1,250 @@
+from collections import deque
+from threading import Condition, Event, Lock
+
+from nio.util.logging import get_nio_logger
+from nio.util.threading.thread import NIOThread
+
+
+class PoolFuture(object):
+
+    """ Result of a target executed by a thread pool
+
+    Behaves as the thread spawn returns, joining it waits for the target to
+    finish and either returns its result or raises its exception.
+    """
+
+    def __init__(self, target, args, kwargs):
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs
+        self._done = Event()
+        self.nio_result = None
+        self.nio_exception = None
+
+    def run(self):
+        try:
+            self.nio_result = self._target(*self._args, **self._kwargs)
+        except BaseException as e:
+            get_nio_logger("PoolFuture").exception(
+                "Executing: {0}".format(
+                    getattr(self._target, "__name__", self._target)))
+            self.nio_exception = e
+        finally:
+            self._done.set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def join(self, timeout=None):
+        """ Wait for the target to finish
+
+        Args:
+            timeout: join timeout
+
+        Returns:
+            target execution result
+        """
+        self._done.wait(timeout)
+        if self.nio_exception:
+            raise self.nio_exception
+        return self.nio_result
+
+    def __repr__(self):
+        return "PoolFuture({}), nio_result: {}, nio_exception: {}".format(
+            getattr(self._target, "__name__", self._target),
+            self.nio_result, self.nio_exception)
+
+
+class ThreadPool(object):
+
+    """ A bounded and named pool of threads executing tasks
+
+    Worker threads are created as tasks are submitted, up to max_workers,
+    and are reused for later tasks. A worker with nothing to execute for
+    idle_timeout seconds finishes, so an idle pool holds no threads.
+    Once every worker is busy submitted tasks wait in order for one to be
+    available.
+
+    Workers are daemon threads named after the pool.
+
+    Pools can be shared by the whole process through ThreadPool.get, which
+    caps the number of threads executing a kind of task.
+
+    Args:
+        name (str): pool name, used to name its threads
+        max_workers (int): maximum number of threads in the pool
+        idle_timeout (float): seconds a worker waits for a task before
+            finishing
+    """
+
+    # size of the shared pools not configured otherwise
+    default_size = 50
+    _pools = {}
+    _sizes = {}
+    _pools_lock = Lock()
+
+    def __init__(self, name, max_workers, idle_timeout=60):
+        if max_workers < 1:
+            raise ValueError("A pool needs at least one worker")
+        self.name = name
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self.logger = get_nio_logger(name)
+        self._tasks = deque()
+        self._condition = Condition()
+        self._workers = 0
+        self._idle = 0
+        self._busy = 0
+        self._threads_created = 0
+        self._shutdown = False
+
+    @classmethod
+    def get(cls, name):
+        """ Get a pool shared by the process
+
+        The pool is created the first time it is requested, with the size
+        configured for it.
+
+        Args:
+            name (str): pool name
+
+        Returns:
+            ThreadPool: the shared pool
+        """
+        with cls._pools_lock:
+            pool = cls._pools.get(name)
+            if pool is None:
+                pool = cls._pools[name] = cls(
+                    name, cls._sizes.get(name, cls.default_size))
+            return pool
+
+    @classmethod
+    def configure_shared(cls, sizes):
+        """ Configure the size of shared pools
+
+        Pools already created are resized, busy workers over the new size
+        finish once done with their task.
+
+        Args:
+            sizes (dict): maximum number of threads by pool name
+        """
+        with cls._pools_lock:
+            cls._sizes.update(sizes)
+            pools = [(cls._pools[name], size)
+                     for (name, size) in sizes.items() if name in cls._pools]
+        for (pool, size) in pools:
+            pool.resize(size)
+
+    @classmethod
+    def shared_utilization(cls):
+        """ Get the utilization of the shared pools
+
+        Returns:
+            dict: utilization of each shared pool by name
+        """
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+        return {pool.name: pool.utilization() for pool in pools}
+
+    def resize(self, max_workers):
+        """ Change the maximum number of threads of the pool """
+        if max_workers < 1:
+            raise ValueError("A pool needs at least one worker")
+        with self._condition:
+            self.max_workers = max_workers
+            # start workers for the tasks waiting if the pool grew, have
+            # idle workers over the size finish if it shrank
+            for _ in range(min(len(self._tasks) - self._idle,
+                               self.max_workers - self._workers)):
+                self._start_worker()
+            self._condition.notify_all()
+
+    def submit(self, target, *args, **kwargs):
+        """ Execute a target in a thread of the pool
+
+        Args:
+            target: method or function to execute
+            *args: positional arguments in 'target'
+            **kwargs: keyword arguments in 'target'
+
+        Raises:
+            RuntimeError: the pool is shut down
+        """
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError(
+                    "Thread pool {} is shut down".format(self.name))
+            self._tasks.append((target, args, kwargs))
+            # idle workers still count as idle until they take a task
+            if len(self._tasks) > self._idle and \
+                    self._workers < self.max_workers:
+                self._start_worker()
+            else:
+                self._condition.notify()
+
+    def utilization(self):
+        """ Get the pool utilization
+
+        Returns:
+            dict: maximum number of workers, current number of workers, how
+                many of them are executing tasks and number of tasks waiting
+                for a worker
+        """
+        with self._condition:
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "workers": self._workers,
+                "busy": self._busy,
+                "queued": len(self._tasks),
+            }
+
+    def shutdown(self):
+        """ Stop executing tasks
+
+        Tasks waiting for a worker are discarded and idle workers finish,
+        tasks being executed are not interrupted.
+        """
+        with self._condition:
+            self._shutdown = True
+            self._tasks.clear()
+            self._condition.notify_all()
+
+    def _start_worker(self):
+        """ Start a worker thread, to be called holding the condition """
+        self._workers += 1
+        self._threads_created += 1
+        thread = NIOThread(
+            target=self._work,
+            name="{}-{}".format(self.name, self._threads_created))
+        thread.daemon = True
+        thread.start()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                if self._workers > self.max_workers:
+                    # the pool shrank
+                    self._workers -= 1
+                    return
+                while not self._tasks:
+                    if self._shutdown or self._workers > self.max_workers:
+                        self._workers -= 1
+                        return
+                    self._idle += 1
+                    notified = self._condition.wait(self.idle_timeout)
+                    self._idle -= 1
+                    if not notified and not self._tasks:
+                        self._workers -= 1
+                        return
+                target, args, kwargs = self._tasks.popleft()
+                self._busy += 1
+            try:
+                target(*args, **kwargs)
+            except Exception:
+                self.logger.exception(
+                    "Executing: {0}".format(
+                        getattr(target, "__name__", target)))
+            finally:
+                with self._condition:
+                    self._busy -= 1
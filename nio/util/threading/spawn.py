@@ -1,10 +1,17 @@
+from nio.util.threading.pool import PoolFuture, ThreadPool
 from nio.util.threading.thread import NIOThread
 
 
-def spawn(target, *args, **kwargs):
-    """ Executes given target in a new thread
+def spawn(target, *args, pool=None, **kwargs):
+    """ Executes given target in a new thread or in a shared thread pool
 
-    This method creates a thread invoking the target function specified
+    This method creates a thread invoking the target function specified,
+    or, when a pool is given, has a thread of the shared pool of that name
+    execute it, saving the cost of starting a thread and bounding the
+    number of threads executing such targets. Targets submitted to a pool
+    wait for a thread once all of its threads are busy, targets that run
+    indefinitely or wait for other targets of the same pool to finish are
+    better executed in a new thread.
 
     If the target function happens to eventually invoke a longtime running
     function executing in C, the GIL happens to hijack control and would not
@@ -16,12 +23,21 @@ def spawn(target, *args, **kwargs):
     Args:
         target: method or function to execute
         *args: positional arguments in 'target'
+        pool (str or ThreadPool): pool to execute 'target' in, either a
+            ThreadPool or the name of a shared pool, see ThreadPool.get
         **kwargs: keyword arguments in 'target'
 
     Returns:
-        newly created thread
+        newly created thread, or PoolFuture when executed in a pool, both
+            are joined to get the result of 'target'
 
     """
+    if pool is not None:
+        future = PoolFuture(target, args, kwargs)
+        if not isinstance(pool, ThreadPool):
+            pool = ThreadPool.get(pool)
+        pool.submit(future.run)
+        return future
     t = NIOThread(target=target, args=args, kwargs=kwargs)
     t.daemon = True
     t.start()
@@ -0,0 +1,65 @@
+from threading import Event, current_thread
+
+from nio.testing.condition import ensure_condition
+from nio.testing.test_case import NIOTestCaseNoModules
+from nio.util.threading import spawn
+from nio.util.threading.diagnostics import profile, thread_cpu_time, \
+    thread_diagnostics
+
+
+class TestThreadDiagnostics(NIOTestCaseNoModules):
+
+    def setUp(self):
+        super().setUp()
+        self._release = Event()
+        self._waiting = Event()
+
+    def tearDown(self):
+        self._release.set()
+        super().tearDown()
+
+    def _wait_for_release(self):
+        self._waiting.set()
+        self._release.wait()
+
+    def test_thread_diagnostics(self):
+        """ Live threads are described with their target and stack """
+        thread = spawn(self._wait_for_release)
+        self.assertTrue(self._waiting.wait(1))
+        diagnostics = {info["ident"]: info
+                       for info in thread_diagnostics(interval=0.01)}
+        info = diagnostics[thread.ident]
+        self.assertEqual(info["name"], thread.name)
+        self.assertTrue(info["daemon"])
+        self.assertEqual(
+            info["target"], "TestThreadDiagnostics._wait_for_release")
+        self.assertGreaterEqual(info["age"], 0)
+        self.assertIn("_wait_for_release", "\n".join(info["stack"]))
+        if info["cpu_time"] is not None:
+            # a waiting thread hardly uses any CPU
+            self.assertLess(info["cpu_usage"], 0.5)
+        # threads not started as NIOThread have no age
+        self.assertIsNone(
+            diagnostics[current_thread().ident]["age"])
+
+    def test_cpu_time(self):
+        self.assertGreater(thread_cpu_time(current_thread()), 0)
+
+    def test_profile(self):
+        """ Stacks are sampled in collapsed stack format """
+        thread = spawn(self._wait_for_release)
+        self.assertTrue(self._waiting.wait(1))
+        result = profile(0.05, interval=0.01)
+        self.assertGreater(result["samples"], 1)
+        lines = result["collapsed"].split("\n")
+        thread_lines = [line for line in lines
+                        if line.startswith(thread.name + ";")]
+        self.assertEqual(len(thread_lines), 1)
+        stack, count = thread_lines[0].rsplit(" ", 1)
+        self.assertIn(";_wait_for_release (test_diagnostics.py);", stack)
+        self.assertEqual(int(count), result["samples"])
+        # the sampling thread is not sampled
+        self.assertFalse(any(
+            line.startswith(current_thread().name + ";") for line in lines))
+        self._release.set()
+        ensure_condition(lambda: not thread.is_alive())
@@ -0,0 +1,97 @@
+from threading import Event, current_thread
+
+from nio.testing.condition import ensure_condition
+from nio.testing.test_case import NIOTestCaseNoModules
+from nio.util.threading.pool import ThreadPool
+
+
+class TestThreadPool(NIOTestCaseNoModules):
+
+    def setUp(self):
+        super().setUp()
+        self._pool = ThreadPool("TestPool", 2, idle_timeout=0.1)
+
+    def tearDown(self):
+        self._pool.shutdown()
+        super().tearDown()
+
+    def test_reuses_workers(self):
+        """ Tasks are executed by named threads that are reused """
+        thread_names = []
+        done = Event()
+        for _ in range(5):
+            self._pool.submit(
+                lambda: thread_names.append(current_thread().name))
+        self._pool.submit(done.set)
+        self.assertTrue(done.wait(1))
+        ensure_condition(lambda: len(thread_names) == 5)
+        self.assertTrue(all(name.startswith("TestPool-")
+                            for name in thread_names))
+        self.assertLessEqual(len(set(thread_names)), 2)
+
+    def test_bounded(self):
+        """ Tasks wait for a worker once every worker is busy """
+        release = Event()
+        for _ in range(3):
+            self._pool.submit(release.wait)
+        ensure_condition(lambda: self._pool.utilization()["busy"] == 2)
+        self.assertDictEqual(self._pool.utilization(), {
+            "name": "TestPool",
+            "max_workers": 2,
+            "workers": 2,
+            "busy": 2,
+            "queued": 1,
+        })
+        release.set()
+        ensure_condition(lambda: self._pool.utilization()["busy"] == 0)
+        self.assertEqual(self._pool.utilization()["queued"], 0)
+
+    def test_idle_workers_finish(self):
+        """ Workers finish once idle for a while """
+        done = Event()
+        self._pool.submit(done.set)
+        self.assertTrue(done.wait(1))
+        ensure_condition(lambda: self._pool.utilization()["workers"] == 0)
+        self.assertEqual(self._pool.utilization()["workers"], 0)
+
+    def test_failing_task(self):
+        """ A failing task does not keep the worker from other tasks """
+        done = Event()
+        self._pool.submit(self._fail)
+        self._pool.submit(done.set)
+        self.assertTrue(done.wait(1))
+
+    def test_shutdown(self):
+        """ Tasks can not be submitted to a shut down pool """
+        self._pool.shutdown()
+        with self.assertRaises(RuntimeError):
+            self._pool.submit(self._fail)
+
+    def test_resize(self):
+        """ Pools grow to execute waiting tasks and shrink once done """
+        release = Event()
+        for _ in range(4):
+            self._pool.submit(release.wait)
+        ensure_condition(lambda: self._pool.utilization()["busy"] == 2)
+        self._pool.resize(4)
+        ensure_condition(lambda: self._pool.utilization()["busy"] == 4)
+        self._pool.resize(1)
+        release.set()
+        # the remaining worker finishes too once idle
+        ensure_condition(lambda: self._pool.utilization()["workers"] <= 1)
+        self.assertLessEqual(self._pool.utilization()["workers"], 1)
+
+    def test_shared(self):
+        """ Shared pools are created once with their configured size """
+        ThreadPool.configure_shared({"TestSharedPool": 3})
+        pool = ThreadPool.get("TestSharedPool")
+        self.assertIs(ThreadPool.get("TestSharedPool"), pool)
+        self.assertEqual(pool.max_workers, 3)
+        ThreadPool.configure_shared({"TestSharedPool": 5})
+        self.assertEqual(pool.max_workers, 5)
+        self.assertEqual(
+            ThreadPool.shared_utilization()["TestSharedPool"]["max_workers"],
+            5)
+
+    def _fail(self):
+        raise ValueError()
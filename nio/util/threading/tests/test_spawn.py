@@ -2,7 +2,7 @@ from threading import Event
 
 from nio.testing.condition import ensure_condition
 from nio.testing.test_case import NIOTestCaseNoModules
-from nio.util.threading import spawn
+from nio.util.threading import spawn, ThreadPool
 
 
 class MyException(Exception):
@@ -102,6 +102,36 @@ class TestSpawn(NIOTestCaseNoModules):
             self.assertTrue(e.kwargs["kwarg1"], "2")
         self.assertTrue(self._exception_thrown)
 
+    def test_spawn_pool(self):
+        """ Targets can be executed in a shared pool """
+        receiver_event = Event()
+        target = Target(receiver_event)
+        future = spawn(target.receiver, "1", "2", pool="TestSpawnPool",
+                       key1="key1_passed")
+        self.assertEqual(future.join(1), "verify this")
+        self.assertTrue(future.done())
+        self.assertEqual(future.nio_result, "verify this")
+        self.assertEqual(target.args, ["1", "2"])
+        self.assertEqual(target.kwargs, ["key1_passed", "key2_default"])
+        self.assertEqual(
+            ThreadPool.get("TestSpawnPool").utilization()["workers"], 1)
+
+    def test_spawn_pool_instance(self):
+        """ Targets can be executed in a pool that is not shared """
+        pool = ThreadPool("TestSpawnOwnPool", 1)
+        future = spawn(self.throw_exception, "arg1", pool=pool)
+        with self.assertRaises(MyException):
+            future.join(1)
+        self.assertEqual(pool.utilization()["workers"], 1)
+        self.assertNotIn("TestSpawnOwnPool", ThreadPool.shared_utilization())
+
+    def test_spawn_pool_exception(self):
+        """ Joining a pool target raises its exception """
+        future = spawn(self.throw_exception, "arg1", pool="TestSpawnPool")
+        with self.assertRaises(MyException):
+            future.join(1)
+        self.assertIsInstance(future.nio_exception, MyException)
+
     def throw_exception(self, *args, **kwargs):
         self._exception_thrown = True
         raise MyException(*args, **kwargs)
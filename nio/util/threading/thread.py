@@ -1,4 +1,5 @@
 from threading import Thread
+from time import monotonic
 
 from nio.util.logging import get_nio_logger
 
@@ -16,6 +17,8 @@ class NIOThread(Thread):
         self.logger = get_nio_logger("NIOThread")
         self.nio_result = None
         self.nio_exception = None
+        # monotonic time the thread started running at
+        self.started_at = None
 
     def run(self):
         """ Overrides task execution
@@ -29,6 +32,7 @@ class NIOThread(Thread):
         in 'nio_exception'
 
         """
+        self.started_at = monotonic()
         try:
             self.nio_result = self._target(*self._args, **self._kwargs)
         except BaseException as e: